@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Compare N single tool calls with one batch call over stdio and SSE.
+
+Run with ``poetry run python benchmarks/bench_batch.py [--sizes 10 50 200]``.
+"""
+
+import argparse
+import asyncio
+import time
+
+from _servers import http_server, sse_session, stdio_session
+
+TOOLS = {
+    "calculate_difference": lambda i: {
+        "start_timestamp": f"2024-01-{i % 28 + 1:02d}T08:00:00",
+        "end_timestamp": f"2024-02-{i % 28 + 1:02d}T17:30:00",
+    },
+    "adjust_timestamp": lambda i: {
+        "start_timestamp": f"2024-07-{i % 28 + 1:02d}T12:00:00",
+        "delta_value": i,
+        "delta_unit": "hours",
+    },
+    "get_timestamp_context": lambda i: {
+        "timestamp": f"2024-03-{i % 28 + 1:02d}T{i % 24:02d}:15:00",
+        "timezone": "America/New_York",
+    },
+}
+
+
+async def run_transport(label: str, session, sizes: list[int]) -> None:
+    for tool, make_item in TOOLS.items():
+        for size in sizes:
+            items = [make_item(i) for i in range(size)]
+
+            start = time.perf_counter()
+            for item in items:
+                await session.call_tool(tool, item)
+            single = time.perf_counter() - start
+
+            start = time.perf_counter()
+            await session.call_tool(f"batch_{tool}", {"items": items})
+            batched = time.perf_counter() - start
+
+            print(
+                f"{label:<6}{tool:<24}{size:>6}{single * 1e3:>14.1f}{batched * 1e3:>14.1f}"
+                f"{single / batched:>9.1f}x"
+            )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    args = parser.parse_args()
+
+    print(f"{'':<6}{'tool':<24}{'N':>6}{'N calls (ms)':>14}{'1 batch (ms)':>14}{'speedup':>10}")
+    async with stdio_session() as session:
+        await run_transport("stdio", session, args.sizes)
+    with http_server() as base_url:
+        async with sse_session(base_url) as session:
+            await run_transport("sse", session, args.sizes)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
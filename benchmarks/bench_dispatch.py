@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Measure the server's per-request overhead for tools/list and tools/call.
+
+Requests go straight to the low-level request handlers, so no transport or
+JSON-RPC framing is included. The ``calculate_difference`` row uses the parse
+cache, leaving mostly dispatch, validation and rendering.
+
+Run with ``poetry run python benchmarks/bench_dispatch.py``.
+"""
+
+import asyncio
+import time
+
+from mcp.types import CallToolRequest, CallToolRequestParams, ListToolsRequest
+
+from temporal_awareness_mcp.server import create_server
+
+CALLS = {
+    "get_current_time": {"timezone": "Europe/London"},
+    "calculate_difference": {
+        "start_timestamp": "2024-01-01T08:00:00",
+        "end_timestamp": "2024-02-01T17:30:00",
+    },
+    "adjust_timestamp (json)": {
+        "start_timestamp": "2024-07-20T12:00:00",
+        "delta_value": 5,
+        "delta_unit": "days",
+        "response_format": "json",
+    },
+}
+
+
+async def bench(handler, request, number: int) -> float:
+    """Return the best per-request time in microseconds over five repeats."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(number):
+            await handler(request)
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+async def main(number: int = 1_000) -> None:
+    server = create_server().server
+    list_handler = server.request_handlers[ListToolsRequest]
+    call_handler = server.request_handlers[CallToolRequest]
+
+    print(f"{'request':<32}{'us/request':>12}")
+    list_request = ListToolsRequest(method="tools/list")
+    print(f"{'tools/list':<32}{await bench(list_handler, list_request, number):12.2f}")
+
+    for label, arguments in CALLS.items():
+        request = CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name=label.split()[0], arguments=arguments),
+        )
+        print(f"{'tools/call ' + label:<32}{await bench(call_handler, request, number):12.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Duration formatting: ``durations.format_duration`` against the float formatter it replaced.
+
+The previous ``core._format_timedelta`` is kept below as the reference. Each
+row formats the same mix of durations, from sub-second to multi-year, and
+reports the best-of-five cost per call.
+
+Run with ``poetry run python benchmarks/bench_durations.py``.
+"""
+
+import random
+import timeit
+from datetime import timedelta
+
+from temporal_awareness_mcp import durations
+
+
+def previous_format_timedelta(duration: timedelta) -> str:
+    seconds = abs(duration.total_seconds())
+    days, remainder = divmod(seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, seconds = divmod(remainder, 60)
+
+    parts = []
+    if days > 0:
+        parts.append(f"{int(days)} day{'s' if days != 1 else ''}")
+    if hours > 0:
+        parts.append(f"{int(hours)} hour{'s' if hours != 1 else ''}")
+    if minutes > 0:
+        parts.append(f"{int(minutes)} minute{'s' if minutes != 1 else ''}")
+    if seconds > 0 or not parts:
+        parts.append(f"{int(seconds)} second{'s' if seconds != 1 else ''}")
+
+    return ", ".join(parts)
+
+
+def main() -> None:
+    rng = random.Random(7)
+    micros = [rng.choice((0, 1, 3, 6, 9, 11)) for _ in range(1000)]
+    micros = [rng.randrange(10 ** exponent) * rng.choice((1, 1_000_000)) for exponent in micros]
+    deltas = [timedelta(microseconds=value) for value in micros]
+
+    def run(label, func, values):
+        best = min(timeit.repeat(lambda: [func(value) for value in values], number=50, repeat=5))
+        print(f"{label:<48}{best / (50 * len(values)) * 1e6:>10.2f}")
+
+    print(f"{'formatter':<48}{'us/call':>10}")
+    run("previous _format_timedelta (timedelta)", previous_format_timedelta, deltas)
+    run("format_duration, long (int microseconds)", durations.format_duration, micros)
+    run("format_duration, long (from timedelta)",
+        lambda delta: durations.format_duration(delta // timedelta(microseconds=1)), deltas)
+    run("format_duration, compact", lambda value: durations.format_duration(value, "compact"), micros)
+    run("format_duration, iso + milliseconds",
+        lambda value: durations.format_duration(value, "iso", smallest_unit="milliseconds"), micros)
+    run("format_duration, long, max_parts=2",
+        lambda value: durations.format_duration(value, max_parts=2), micros)
+
+
+if __name__ == "__main__":
+    main()
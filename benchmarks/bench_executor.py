@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Event-loop responsiveness under a burst of heavy tool calls, per executor mode.
+
+A ticker task sleeps 1 ms in a loop and records how late it wakes up while a
+burst of free-form batch calls goes through the tools/call handler. Inline
+execution blocks the ticker for the whole of every call; the pools keep the
+loop free, at some cost in total throughput for the thread pool (GIL).
+
+Run with ``poetry run python benchmarks/bench_executor.py``.
+"""
+
+import asyncio
+import statistics
+import time
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from temporal_awareness_mcp import executor, utils
+from temporal_awareness_mcp.server import create_server
+
+BURST = 16
+ITEMS = 200
+
+
+def heavy_request(seed: int) -> CallToolRequest:
+    items = [
+        {
+            "start_timestamp": f"March {i % 28 + 1}, 2024 {i % 12 + 1}:{seed % 60:02d} PM",
+            "end_timestamp": f"April {i % 28 + 1}, 2024 9:15 AM",
+        }
+        for i in range(ITEMS)
+    ]
+    return CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name="batch_calculate_difference", arguments={"items": items}),
+    )
+
+
+async def ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def run_mode(mode: str) -> None:
+    executor.configure_executor(mode, max_workers=4)
+    utils.configure_parse_cache(0)
+    handler = create_server().server.request_handlers[CallToolRequest]
+    # Warm up the pool (process workers take a moment to spawn).
+    await handler(heavy_request(0))
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    tick = asyncio.create_task(ticker(lags, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(handler(heavy_request(seed)) for seed in range(1, BURST + 1)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await tick
+
+    lags_ms = sorted(lag * 1e3 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"{mode:<10}{elapsed * 1e3:12.1f}{len(lags):8d}"
+        f"{statistics.median(lags_ms):12.2f}{p99:12.2f}{lags_ms[-1]:12.2f}"
+    )
+    executor.get_executor().shutdown()
+
+
+async def main() -> None:
+    print(f"{BURST} concurrent batch calls x {ITEMS} free-form pairs")
+    print(f"{'mode':<10}{'burst (ms)':>12}{'ticks':>8}{'lag p50':>12}{'lag p99':>12}{'lag max':>12}")
+    for mode in executor.EXECUTOR_MODES:
+        await run_mode(mode)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Cost of the handlers' result objects: slotted dataclasses against Pydantic models.
+
+For each result type, and for a batch of ``--size`` items wrapped in batch
+results, this builds the same values both ways and reports the time to build
+one, the memory a built result keeps alive (from ``tracemalloc``), and the
+time to serialize it to JSON the way ``response_format="json"`` does.
+
+Run with ``poetry run python benchmarks/bench_results.py [--size 1000]``.
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+from temporal_awareness_mcp import models, results
+
+
+SINGLE = {
+    "calculate_difference": (
+        models.CalculateDifferenceOutput, results.Difference,
+        {"total_seconds": 9000.0, "is_negative": False, "formatted_duration": "2 hours, 30 minutes"},
+    ),
+    "get_timestamp_context": (
+        models.GetTimestampContextOutput, results.TimestampContext,
+        {"day_of_week": "Monday", "is_weekend": False, "is_business_hours": True, "time_of_day": "morning"},
+    ),
+    "adjust_timestamp": (
+        models.AdjustTimestampOutput, results.AdjustedTimestamp,
+        {"original_timestamp_iso": "2024-03-11T10:30:00+01:00",
+         "adjusted_timestamp_iso": "2024-03-12T10:30:00+01:00"},
+    ),
+}
+
+
+def per_call(func, number: int) -> float:
+    """Best-of-five microseconds per call."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def retained_bytes(build, count: int) -> float:
+    """Bytes kept alive per object by ``count`` objects from ``build``."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000, help="Items per batch")
+    args = parser.parse_args()
+
+    header = f"{'result':<38}{'':<10}{'build (us)':>12}{'kept (B)':>10}{'json (us)':>11}"
+    print(header)
+    for name, (model, slotted, values) in SINGLE.items():
+        built_model = model(**values)
+        built_slotted = slotted(**values)
+        rows = {
+            "pydantic": (lambda: model(**values), lambda: built_model.model_dump_json(exclude_none=True)),
+            "slotted": (lambda: slotted(**values), lambda: results.to_json(built_slotted)),
+        }
+        for kind, (build, dump) in rows.items():
+            print(f"{name:<38}{kind:<10}{per_call(build, 20000):>12.2f}"
+                  f"{retained_bytes(build, 10000):>10.0f}{per_call(dump, 20000):>11.2f}")
+
+    values = SINGLE["calculate_difference"][2]
+    item_model = models.BatchItemResult[models.CalculateDifferenceOutput]
+
+    def pydantic_batch():
+        return models.BatchCalculateDifferenceOutput(results=[
+            item_model(index=index, result=models.CalculateDifferenceOutput(**values))
+            for index in range(args.size)
+        ])
+
+    def slotted_batch():
+        return results.Batch([
+            results.BatchItem(index, results.Difference(**values)) for index in range(args.size)
+        ])
+
+    built_pydantic, built_slotted = pydantic_batch(), slotted_batch()
+    label = f"batch_calculate_difference x{args.size}"
+    for kind, build, dump in (
+        ("pydantic", pydantic_batch, lambda: built_pydantic.model_dump_json(exclude_none=True)),
+        ("slotted", slotted_batch, lambda: results.to_json(built_slotted)),
+    ):
+        print(f"{label:<38}{kind:<10}{per_call(build, 20):>12.0f}"
+              f"{retained_bytes(build, 5):>10.0f}{per_call(dump, 20):>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Cold-start cost of ``stdio_main``, which MCP hosts spawn once per session.
+
+Two measurements, each the median of several fresh processes:
+
+* the import graph, from ``python -X importtime``: total time to import
+  ``stdio_main``, self time per top-level package, the slowest modules, and
+  whether any module that should be deferred (NumPy, dateutil, the relative
+  time grammar, Starlette's HTTP stack outside the MCP SDK) was loaded;
+* time to first response: from spawning the server to reading its reply to
+  ``initialize``, and then to the reply to the first ``tools/list``. With
+  ``--prefork`` the same is measured through ``temporal-mcp-attach`` against a
+  running prefork daemon.
+
+Most of the import time is the MCP SDK itself (``import mcp`` loads its client,
+FastMCP and their HTTP dependencies); the package's own share is reported
+separately. The run fails (exit status 1) if the median time to the
+``initialize`` reply exceeds ``--target-ms``.
+
+Run with ``poetry run python benchmarks/bench_startup.py [--runs 5] [--target-ms 1000]``.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+PACKAGE = "temporal_awareness_mcp"
+# Loaded on first use only; importing any of them at startup is a regression.
+DEFERRED = ("numpy", "dateutil", "temporal_awareness_mcp.vectorized", "temporal_awareness_mcp.relative")
+DEFAULT_TARGET_MS = 1000
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "bench_startup", "version": "0"},
+    },
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+LIST_TOOLS = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+
+
+def import_profile() -> tuple[float, dict[str, float], dict[str, float]]:
+    """Total import time and self time per package and per module, in ms."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {PACKAGE}.stdio_main"],
+        capture_output=True, text=True, check=True,
+    )
+    packages: dict[str, float] = defaultdict(float)
+    modules: dict[str, float] = {}
+    total = 0.0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        modules[name] = int(self_us) / 1e3
+        packages[name.split(".")[0]] += int(self_us) / 1e3
+        if name == f"{PACKAGE}.stdio_main":
+            total = int(cumulative_us) / 1e3
+    return total, packages, modules
+
+
+def loaded_deferred() -> list[str]:
+    code = (
+        f"import sys, {PACKAGE}.stdio_main; "
+        f"print(','.join(m for m in {DEFERRED!r} if m in sys.modules))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return [name for name in output.stdout.strip().split(",") if name]
+
+
+def send(process: subprocess.Popen, message: dict) -> None:
+    process.stdin.write((json.dumps(message) + "\n").encode())
+    process.stdin.flush()
+
+
+def first_response(*module_args: str) -> tuple[float, float]:
+    """Milliseconds from spawn to the initialize and tools/list replies."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", *module_args],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        env=dict(os.environ),
+    )
+    try:
+        send(process, INITIALIZE)
+        process.stdout.readline()
+        initialized = time.perf_counter()
+        send(process, INITIALIZED)
+        send(process, LIST_TOOLS)
+        process.stdout.readline()
+        listed = time.perf_counter()
+    finally:
+        process.stdin.close()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    return (initialized - started) * 1e3, (listed - started) * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes per measurement")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list")
+    parser.add_argument(
+        "--prefork", action="store_true", help="Also measure sessions attached to a prefork daemon"
+    )
+    parser.add_argument(
+        "--target-ms", type=float, default=DEFAULT_TARGET_MS,
+        help=f"Budget for the median time to the initialize reply (default: {DEFAULT_TARGET_MS})",
+    )
+    args = parser.parse_args()
+
+    profiles = [import_profile() for _ in range(args.runs)]
+    totals = [total for total, _, _ in profiles]
+    print(f"import {PACKAGE}.stdio_main: median {statistics.median(totals):.0f} ms "
+          f"(min {min(totals):.0f}, max {max(totals):.0f})")
+
+    print(f"\n{'package':<28}{'self (ms)':>10}")
+    packages = {name: statistics.median(p.get(name, 0.0) for _, p, _ in profiles) for name in profiles[0][1]}
+    for name, ms in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{name:<28}{ms:10.1f}")
+
+    print(f"\n{'module':<52}{'self (ms)':>10}")
+    modules = {name: statistics.median(m.get(name, 0.0) for _, _, m in profiles) for name in profiles[0][2]}
+    for name, ms in sorted(modules.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{name:<52}{ms:10.1f}")
+    own = sum(ms for name, ms in modules.items() if name.split(".")[0] == PACKAGE)
+    print(f"{PACKAGE} modules: {own:.1f} ms")
+
+    deferred = loaded_deferred()
+    print(f"\ndeferred modules loaded at startup: {', '.join(deferred) or 'none'}")
+
+    responses = [first_response(f"{PACKAGE}.stdio_main") for _ in range(args.runs)]
+    to_initialize = statistics.median(r[0] for r in responses)
+    to_list = statistics.median(r[1] for r in responses)
+    print(f"time to initialize reply: {to_initialize:.0f} ms (target {args.target_ms:.0f} ms)")
+    print(f"time to tools/list reply: {to_list:.0f} ms")
+
+    if args.prefork:
+        with tempfile.TemporaryDirectory() as run_dir:
+            path = os.path.join(run_dir, "daemon.sock")
+            daemon = subprocess.Popen(
+                [sys.executable, "-m", f"{PACKAGE}.prefork", "--socket", path],
+                stderr=subprocess.DEVNULL,
+            )
+            try:
+                while not os.path.exists(path):
+                    time.sleep(0.05)
+                attach = (f"{PACKAGE}.launcher", "--socket", path, "--no-fallback")
+                attached = [first_response(*attach) for _ in range(args.runs)]
+            finally:
+                daemon.terminate()
+                daemon.wait()
+        print(f"prefork: time to initialize reply: {statistics.median(r[0] for r in attached):.0f} ms")
+        print(f"prefork: time to tools/list reply: {statistics.median(r[1] for r in attached):.0f} ms")
+
+    return 1 if deferred or to_initialize > args.target_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
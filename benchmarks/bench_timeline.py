@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Throughput and memory of ``analyze_timeline`` on large synthetic logs.
+
+The timeline is ``--size`` ISO timestamps a few seconds apart, with some
+long gaps, and with ``--shuffle`` of them out of order. It is analyzed as a
+list and as newline-delimited text; for each the script reports the wall time,
+the cost per timestamp and the peak memory the analysis allocated on top of
+its input (from ``tracemalloc``, which slows the run down, so it is measured
+in a separate pass). For scale, the last row runs ``calculate_difference`` on
+consecutive pairs, the way an agent would without the tool.
+
+Run with ``poetry run python benchmarks/bench_timeline.py [--size 1000000]``.
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from temporal_awareness_mcp import models
+from temporal_awareness_mcp.tools import core
+from temporal_awareness_mcp.tools.timeline import analyze_timeline
+
+
+def synthetic_log(rng: random.Random, size: int, shuffle: float) -> list[str]:
+    current = datetime(2024, 1, 1)
+    stamps = []
+    for _ in range(size):
+        gap = rng.expovariate(1 / 3) if rng.random() > 0.0005 else rng.uniform(600, 7200)
+        current += timedelta(seconds=gap)
+        stamps.append(current.isoformat(timespec="milliseconds") + "Z")
+    for _ in range(int(size * shuffle)):
+        i, j = rng.randrange(size), rng.randrange(size)
+        stamps[i], stamps[j] = stamps[j], stamps[i]
+    return stamps
+
+
+def measure(input_data: models.AnalyzeTimelineInput) -> tuple[float, float]:
+    """Seconds for one analysis, and peak MiB allocated during another."""
+    start = time.perf_counter()
+    analyze_timeline(input_data)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    analyze_timeline(input_data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000, help="Timestamps in the timeline")
+    parser.add_argument("--shuffle", type=float, default=0.01, help="Fraction of entries swapped out of order")
+    parser.add_argument("--pairs", type=int, default=100_000, help="Pairs for the calculate_difference row")
+    args = parser.parse_args()
+
+    stamps = synthetic_log(random.Random(42), args.size, args.shuffle)
+    inputs = {
+        "list": models.AnalyzeTimelineInput(timestamps=stamps),
+        "text": models.AnalyzeTimelineInput(timestamps_text="\n".join(stamps)),
+    }
+    print(f"{'input':<28}{'total (s)':>11}{'per item (us)':>15}{'peak (MiB)':>12}")
+    for name, input_data in inputs.items():
+        elapsed, peak = measure(input_data)
+        print(f"{name:<28}{elapsed:>11.2f}{elapsed / args.size * 1e6:>15.2f}{peak:>12.1f}")
+
+    pairs = [
+        models.CalculateDifferenceInput(start_timestamp=a, end_timestamp=b)
+        for a, b in zip(stamps[:args.pairs], stamps[1:args.pairs + 1])
+    ]
+    start = time.perf_counter()
+    for pair in pairs:
+        core.calculate_difference(pair)
+    elapsed = time.perf_counter() - start
+    print(f"{f'calculate_difference x{len(pairs)}':<28}{elapsed:>11.2f}{elapsed / len(pairs) * 1e6:>15.2f}{'':>12}")
+
+
+if __name__ == "__main__":
+    main()
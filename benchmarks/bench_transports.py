@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Compare the legacy SSE transport with stateless streamable HTTP (``/mcp``).
+
+* steady state: per-call latency on an already-initialized session;
+* short-lived sessions: connect, initialize, make one call, disconnect -
+  the pattern of many short agent sessions;
+* raw POST: one JSON-RPC ``tools/call`` per HTTP request on a keep-alive
+  connection, with no MCP session at all (only possible on ``/mcp``);
+* connections held: peak established TCP connections to the server while
+  concurrent sessions make calls (read from ``/proc/net/tcp``, Linux only).
+
+Run with ``poetry run python benchmarks/bench_transports.py``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from _servers import http_server, sse_session, streamable_http_session
+
+ARGUMENTS = {"start_timestamp": "2024-03-08T09:00:00", "end_timestamp": "2024-03-11T17:30:00"}
+SESSIONS = {"sse": sse_session, "streamable-http": streamable_http_session}
+
+
+def summarize(samples: list[float]) -> str:
+    ms = sorted(sample * 1e3 for sample in samples)
+    p99 = ms[min(len(ms) - 1, int(len(ms) * 0.99))]
+    return f"{statistics.median(ms):10.2f}{p99:10.2f}"
+
+
+async def steady_state(open_session, base_url: str, calls: int) -> list[float]:
+    samples = []
+    async with open_session(base_url) as session:
+        for _ in range(calls):
+            started = time.perf_counter()
+            await session.call_tool("calculate_difference", ARGUMENTS)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def short_sessions(open_session, base_url: str, sessions: int) -> list[float]:
+    samples = []
+    for _ in range(sessions):
+        started = time.perf_counter()
+        async with open_session(base_url) as session:
+            await session.call_tool("calculate_difference", ARGUMENTS)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def raw_posts(base_url: str, calls: int) -> list[float]:
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "calculate_difference", "arguments": ARGUMENTS},
+    }
+    headers = {"Accept": "application/json, text/event-stream"}
+    samples = []
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(calls):
+            started = time.perf_counter()
+            response = await client.post("/mcp", json=payload, headers=headers)
+            response.raise_for_status()
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def established_connections(port: int) -> int:
+    count = 0
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as f:
+                next(f)
+                for line in f:
+                    fields = line.split()
+                    if fields[3] == "01" and int(fields[1].rsplit(":", 1)[1], 16) == port:
+                        count += 1
+        except FileNotFoundError:
+            pass
+    return count
+
+
+async def connections_held(open_session, base_url: str, concurrency: int, calls: int) -> int:
+    port = int(base_url.rsplit(":", 1)[1])
+    peak = 0
+    done = asyncio.Event()
+
+    async def sample() -> None:
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, established_connections(port))
+            await asyncio.sleep(0.005)
+
+    async def agent() -> None:
+        async with open_session(base_url) as session:
+            for _ in range(calls):
+                await session.call_tool("calculate_difference", ARGUMENTS)
+
+    sampler = asyncio.create_task(sample())
+    await asyncio.gather(*(agent() for _ in range(concurrency)))
+    done.set()
+    await sampler
+    return peak
+
+
+async def run(base_url: str, args: argparse.Namespace) -> None:
+    print(f"{'scenario':<34}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+    for name, open_session in SESSIONS.items():
+        await steady_state(open_session, base_url, 20)  # warm up
+        print(f"{'steady state, ' + name:<34}{summarize(await steady_state(open_session, base_url, args.calls))}")
+    print(f"{'steady state, raw POST /mcp':<34}{summarize(await raw_posts(base_url, args.calls))}")
+    for name, open_session in SESSIONS.items():
+        samples = await short_sessions(open_session, base_url, args.sessions)
+        print(f"{'1-call session, ' + name:<34}{summarize(samples)}")
+
+    print(f"\n{'transport':<34}{'peak connections':>18}  ({args.concurrency} concurrent sessions)")
+    for name, open_session in SESSIONS.items():
+        peak = await connections_held(open_session, base_url, args.concurrency, 20)
+        print(f"{name:<34}{peak:>18}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=300)
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    with http_server() as base_url:
+        asyncio.run(run(base_url, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Compare the pure-Python batch path with the NumPy engine.
+
+The first table times only the arithmetic on already-parsed timestamps, which
+is the part the engine replaces. The second times whole batches, where
+parsing each timestamp and building the result models costs the same on both
+paths.
+
+Requires the ``vector`` extra. Run with
+``poetry run python benchmarks/bench_vectorized.py [--sizes 100 1000 10000]``.
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from temporal_awareness_mcp import durations, models, vectorized
+from temporal_awareness_mcp.tools import batch, contextual, core
+
+ZONES = ["UTC", "America/New_York", "Europe/Berlin", "Asia/Tokyo"]
+
+
+def timestamps(rng: random.Random, count: int) -> list[str]:
+    base = datetime(2020, 1, 1)
+    return [
+        (base + timedelta(seconds=rng.randrange(5 * 365 * 86400))).isoformat()
+        for _ in range(count)
+    ]
+
+
+def best_of(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    if not vectorized.is_available():
+        raise SystemExit("NumPy is not installed; install the 'vector' extra.")
+
+    rng = random.Random(0)
+    for zone in ZONES:
+        vectorized.zone_table(batch.utils.resolve_timezone(zone))
+
+    header = f"{'':<24}{'N':>8}{'python (ms)':>14}{'numpy (ms)':>14}{'speedup':>10}"
+    print("compute on parsed timestamps\n" + header)
+    zone = batch.utils.resolve_timezone("America/New_York")
+    for size in args.sizes:
+        starts = [batch.utils.robust_parse_datetime(s, "America/New_York") for s in timestamps(rng, size)]
+        ends = [batch.utils.robust_parse_datetime(s, "America/New_York") for s in timestamps(rng, size)]
+        hours = [rng.uniform(-100, 100) for _ in range(size)]
+
+        def python_compute():
+            for start, end, delta in zip(starts, ends, hours):
+                durations.format_duration((end - start) // timedelta(microseconds=1))
+                (start + timedelta(hours=delta)).isoformat()
+                start.weekday(), start.hour
+
+        def numpy_compute():
+            start_us, fold = vectorized.to_wall_us(starts)
+            end_us, _ = vectorized.to_wall_us(ends)
+            vectorized.difference_seconds(start_us, end_us)
+            [durations.format_duration(delta) for delta in (end_us - start_us).tolist()]
+            deltas, _ = vectorized.delta_us(hours, ["hours"] * size)
+            adjusted = start_us + deltas
+            vectorized.format_iso(adjusted, vectorized.offsets_for_wall(adjusted, zone))
+            vectorized.contexts(start_us, 9, 17)
+
+        python = best_of(python_compute)
+        numpy = best_of(numpy_compute)
+        print(f"{'all three':<24}{size:>8}{python * 1e3:>14.1f}{numpy * 1e3:>14.1f}{python / numpy:>9.1f}x")
+
+    print("\nend-to-end batches\n" + header)
+    for size in args.sizes:
+        starts, ends = timestamps(rng, size), timestamps(rng, size)
+        cases = {
+            "calculate_difference": (
+                [models.CalculateDifferenceInput(start_timestamp=s, end_timestamp=e, timezone=rng.choice(ZONES))
+                 for s, e in zip(starts, ends)],
+                core.calculate_difference,
+                batch._vectorized_calculate_difference,
+            ),
+            "get_timestamp_context": (
+                [models.GetTimestampContextInput(timestamp=s, timezone=rng.choice(ZONES)) for s in starts],
+                contextual.get_timestamp_context,
+                batch._vectorized_get_timestamp_context,
+            ),
+            "adjust_timestamp": (
+                [models.AdjustTimestampInput(start_timestamp=s, delta_value=rng.uniform(-100, 100),
+                                             delta_unit="hours", timezone=rng.choice(ZONES))
+                 for s in starts],
+                core.adjust_timestamp,
+                batch._vectorized_adjust_timestamp,
+            ),
+        }
+        for tool, (items, reference, engine) in cases.items():
+            python = best_of(lambda: batch._run(reference, items))
+            numpy = best_of(lambda: engine(items))
+            print(f"{tool:<24}{size:>8}{python * 1e3:>14.1f}{numpy * 1e3:>14.1f}{python / numpy:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
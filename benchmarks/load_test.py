@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Throughput of ``http_main`` over SSE as the number of worker processes grows.
+
+For each worker count the server is started with ``--workers N`` and loaded by
+client processes (so the load generator is not the bottleneck), each holding
+several SSE sessions that issue tool calls back to back for a fixed duration.
+Scaling is reported relative to a single worker. Leave enough spare cores for
+the clients: on a box with C cores, test up to about C/2 workers.
+
+Run with ``poetry run python benchmarks/load_test.py [--workers 1 2 4] [--duration 10]``.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+import urllib.error
+import urllib.request
+
+from _servers import http_server, sse_session
+
+ARGUMENTS = {
+    "start_timestamp": "2024-03-08T09:00:00",
+    "end_timestamp": "2024-03-11T17:30:00",
+    "timezone": "America/New_York",
+}
+
+
+def wait_healthy(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(f"{base_url}/health/workers", timeout=2):
+                return
+        except urllib.error.HTTPError as e:
+            if e.code == 404:  # single-process server
+                return
+        except OSError:
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError("server did not become healthy")
+        time.sleep(0.2)
+
+
+async def _client(base_url: str, sessions: int, duration: float) -> int:
+    async def session_loop() -> int:
+        calls = 0
+        async with sse_session(base_url) as session:
+            deadline = time.monotonic() + duration
+            while time.monotonic() < deadline:
+                await session.call_tool("calculate_difference", ARGUMENTS)
+                calls += 1
+        return calls
+
+    return sum(await asyncio.gather(*(session_loop() for _ in range(sessions))))
+
+
+def client_process(base_url: str, sessions: int, duration: float) -> int:
+    return asyncio.run(_client(base_url, sessions, duration))
+
+
+def run_load(base_url: str, clients: int, sessions: int, duration: float) -> float:
+    with multiprocessing.get_context("spawn").Pool(clients) as pool:
+        started = time.perf_counter()
+        counts = pool.starmap(client_process, [(base_url, sessions, duration)] * clients)
+        elapsed = time.perf_counter() - started
+    return sum(counts) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=4, help="Client processes")
+    parser.add_argument("--sessions", type=int, default=8, help="SSE sessions per client process")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load per run")
+    args = parser.parse_args()
+
+    print(f"{args.clients} client processes x {args.sessions} sessions, {args.duration:.0f}s per run")
+    print(f"{'workers':>8}{'calls/s':>12}{'scaling':>10}{'efficiency':>12}")
+    baseline = None
+    for workers in args.workers:
+        with http_server("--workers", str(workers)) as base_url:
+            wait_healthy(base_url)
+            throughput = run_load(base_url, args.clients, args.sessions, args.duration)
+        baseline = baseline or throughput / workers
+        scaling = throughput / baseline
+        print(f"{workers:>8}{throughput:12.0f}{scaling:9.2f}x{scaling / workers:11.0%}")
+
+
+if __name__ == "__main__":
+    main()
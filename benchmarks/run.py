@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the tool hot paths, with JSON results and profiling.
+
+Cases are grouped as:
+
+* ``parse``: ``robust_parse_datetime`` per input class;
+* ``tool``: the functions in ``tools/core.py`` and ``tools/contextual.py``;
+* ``call``: the tools/call request handler in-process (validation, dispatch,
+  rendering);
+* ``client``: an MCP client session connected to the server over in-memory
+  streams, the same message loop ``stdio_main`` runs, minus the pipes.
+
+Each case is calibrated to run for about ``--min-time`` seconds per repeat;
+per-call times are reported from the repeats. ``--json PATH`` writes the
+results with environment details, and ``--compare PATH`` checks a run against
+an earlier one and exits with status 1 if any case got slower than
+``--threshold``. ``--profile cprofile`` writes a ``.pstats`` file per case
+(for snakeviz, or ``flameprof`` for a flamegraph); ``--profile pyinstrument``
+writes speedscope JSON (needs ``pip install pyinstrument``).
+
+The parse cache is disabled unless ``--parse-cache-size`` says otherwise, so
+repeated inputs measure parsing rather than cache hits.
+
+Run with ``poetry run python benchmarks/run.py [-k parse] [--json results.json]``.
+"""
+
+import argparse
+import asyncio
+import cProfile
+import json
+import os
+import platform
+import pstats
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from importlib import metadata
+from typing import Any, Callable
+
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.types import CallToolRequest, CallToolRequestParams, ListToolsRequest
+
+from temporal_awareness_mcp import executor, models, utils
+from temporal_awareness_mcp.server import create_server
+from temporal_awareness_mcp.tools.contextual import get_timestamp_context
+from temporal_awareness_mcp.tools.core import adjust_timestamp, calculate_difference, get_current_time
+
+SCHEMA_VERSION = 1
+
+PARSE_INPUTS = {
+    "iso": "2024-03-11T10:30:00",
+    "rfc3339": "2024-03-11T10:30:00.123456+02:00",
+    "epoch": "1700000000",
+    "free_form": "March 15, 2024 2:30 PM",
+    # Resolved against the current time by the relative-expression tier.
+    "relative": "friday 3pm",
+    "relative_offset": "in 3 hours",
+}
+
+TOOL_CALLS = {
+    "get_current_time": (get_current_time, {"timezone": "Europe/London", "format": "human"}),
+    "calculate_difference": (calculate_difference, {
+        "start_timestamp": "2024-03-08T09:00:00",
+        "end_timestamp": "2024-03-11T17:30:00",
+        "timezone": "America/New_York",
+    }),
+    "calculate_difference_free_form": (calculate_difference, {
+        "start_timestamp": "March 8, 2024 9:00 AM",
+        "end_timestamp": "March 11, 2024 5:30 PM",
+        "timezone": "America/New_York",
+    }),
+    "adjust_timestamp": (adjust_timestamp, {
+        "start_timestamp": "2024-03-30T12:00:00",
+        "delta_value": 2,
+        "delta_unit": "days",
+        "timezone": "Europe/Berlin",
+    }),
+    "get_timestamp_context": (get_timestamp_context, {
+        "timestamp": "2024-07-20T14:30:00",
+        "timezone": "Asia/Tokyo",
+    }),
+}
+
+INPUT_MODELS = {
+    get_current_time: models.GetCurrentTimeInput,
+    calculate_difference: models.CalculateDifferenceInput,
+    adjust_timestamp: models.AdjustTimestampInput,
+    get_timestamp_context: models.GetTimestampContextInput,
+}
+
+
+@dataclass
+class Case:
+    group: str
+    name: str
+    func: Callable[[], Any]
+    is_async: bool = False
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}/{self.name}"
+
+
+def call_request(name: str, arguments: dict[str, Any]) -> CallToolRequest:
+    return CallToolRequest(
+        method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments)
+    )
+
+
+def build_cases(client_session) -> list[Case]:
+    cases = [
+        Case("parse", label, lambda text=text: utils.robust_parse_datetime(text, "Europe/Paris"))
+        for label, text in PARSE_INPUTS.items()
+    ]
+
+    for label, (func, arguments) in TOOL_CALLS.items():
+        input_data = INPUT_MODELS[func](**arguments)
+        cases.append(Case("tool", label, lambda func=func, input_data=input_data: func(input_data)))
+
+    server = create_server().server
+    list_handler = server.request_handlers[ListToolsRequest]
+    call_handler = server.request_handlers[CallToolRequest]
+    list_request = ListToolsRequest(method="tools/list")
+    cases.append(Case("call", "tools_list", lambda: list_handler(list_request), is_async=True))
+    for label, (func, arguments) in TOOL_CALLS.items():
+        request = call_request(func.__name__, arguments)
+        cases.append(Case("call", label, lambda request=request: call_handler(request), is_async=True))
+    json_request = call_request(
+        "calculate_difference", {**TOOL_CALLS["calculate_difference"][1], "response_format": "json"}
+    )
+    cases.append(Case(
+        "call", "calculate_difference_json", lambda: call_handler(json_request), is_async=True
+    ))
+
+    cases.append(Case("client", "tools_list", client_session.list_tools, is_async=True))
+    for label in ("calculate_difference", "get_timestamp_context"):
+        func, arguments = TOOL_CALLS[label]
+        cases.append(Case(
+            "client", label,
+            lambda name=func.__name__, arguments=arguments: client_session.call_tool(name, arguments),
+            is_async=True,
+        ))
+    return cases
+
+
+async def run_batch(case: Case, number: int) -> float:
+    """Seconds taken by ``number`` back-to-back calls."""
+    func = case.func
+    start = time.perf_counter()
+    if case.is_async:
+        for _ in range(number):
+            await func()
+    else:
+        for _ in range(number):
+            func()
+    return time.perf_counter() - start
+
+
+async def calibrate(case: Case, min_time: float) -> int:
+    number = 1
+    while True:
+        elapsed = await run_batch(case, number)
+        if elapsed >= min_time / 5 or number >= 1 << 20:
+            return max(1, int(number * min_time / max(elapsed, 1e-9)))
+        number *= 4
+
+
+async def measure(case: Case, repeats: int, min_time: float) -> dict[str, Any]:
+    await run_batch(case, 1)  # warm-up
+    number = await calibrate(case, min_time)
+    per_call = [await run_batch(case, number) / number * 1e6 for _ in range(repeats)]
+    median = statistics.median(per_call)
+    return {
+        "name": case.key,
+        "group": case.group,
+        "number": number,
+        "repeats": repeats,
+        "min_us": round(min(per_call), 3),
+        "median_us": round(median, 3),
+        "mean_us": round(statistics.fmean(per_call), 3),
+        "stdev_us": round(statistics.stdev(per_call), 3) if repeats > 1 else 0.0,
+        "ops_per_sec": round(1e6 / median, 1),
+    }
+
+
+async def profile(case: Case, mode: str, seconds: float, out_dir: str) -> str:
+    number = await calibrate(case, seconds)
+    base = os.path.join(out_dir, case.key.replace("/", "-"))
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        await run_batch(case, number)
+        profiler.disable()
+        path = base + ".pstats"
+        profiler.dump_stats(path)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(12)
+        return path
+
+    try:
+        from pyinstrument import Profiler
+        from pyinstrument.renderers import SpeedscopeRenderer
+    except ImportError:
+        raise SystemExit("--profile pyinstrument needs pyinstrument: pip install pyinstrument")
+    profiler = Profiler(interval=0.0001, async_mode="disabled")
+    profiler.start()
+    await run_batch(case, number)
+    profiler.stop()
+    path = base + ".speedscope.json"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(profiler.output(SpeedscopeRenderer()))
+    return path
+
+
+def environment() -> dict[str, Any]:
+    try:
+        version = metadata.version("temporal-awareness-mcp")
+    except metadata.PackageNotFoundError:
+        version = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "package_version": version,
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "parse_cache_size": utils.get_parse_cache_stats()["maxsize"],
+    }
+
+
+def compare(results: list[dict[str, Any]], baseline_path: str, threshold: float) -> bool:
+    """Print each case against a baseline run; True if any regressed beyond ``threshold``."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {result["name"]: result for result in json.load(f)["results"]}
+    print(f"\n{'case':<44}{'baseline (us)':>14}{'now (us)':>12}{'change':>10}")
+    regressed = False
+    for result in results:
+        before = baseline.get(result["name"])
+        if before is None:
+            continue
+        change = result["median_us"] / before["median_us"] - 1
+        flag = ""
+        if change > threshold:
+            flag, regressed = "  slower", True
+        print(f"{result['name']:<44}{before['median_us']:14.2f}{result['median_us']:12.2f}{change:+10.1%}{flag}")
+    return regressed
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", action="append", default=[],
+                        help="Only run cases whose group/name contains this text (repeatable)")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repeats per case")
+    parser.add_argument("--min-time", type=float, default=0.1, help="Seconds per repeat")
+    parser.add_argument("--parse-cache-size", type=int, default=0,
+                        help="Parse cache size during the run (default: 0, disabled)")
+    parser.add_argument("--json", metavar="PATH", help="Write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against an earlier --json file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative slowdown counted as a regression by --compare (default: 0.10)")
+    parser.add_argument("--profile", choices=("cprofile", "pyinstrument"),
+                        help="Profile each case instead of timing it")
+    parser.add_argument("--profile-dir", default="profiles", help="Where profiles are written")
+    args = parser.parse_args()
+
+    utils.configure_parse_cache(args.parse_cache_size)
+    # Everything runs on the event loop, so timings exclude pool hand-offs.
+    executor.configure_executor("inline")
+
+    async with AsyncExitStack() as stack:
+        client_session = await stack.enter_async_context(
+            create_connected_server_and_client_session(create_server().server)
+        )
+        cases = [
+            case for case in build_cases(client_session)
+            if not args.filter or any(text in case.key for text in args.filter)
+        ]
+        if not cases:
+            raise SystemExit("No benchmark matches the filter")
+
+        if args.profile:
+            os.makedirs(args.profile_dir, exist_ok=True)
+            for case in cases:
+                print(f"== {case.key}")
+                path = await profile(case, args.profile, args.min_time * args.repeats, args.profile_dir)
+                print(f"wrote {path}")
+            return 0
+
+        print(f"{'case':<44}{'median (us)':>12}{'min (us)':>12}{'stdev':>10}{'ops/s':>12}")
+        results = []
+        for case in cases:
+            result = await measure(case, args.repeats, args.min_time)
+            results.append(result)
+            print(
+                f"{case.key:<44}{result['median_us']:12.2f}{result['min_us']:12.2f}"
+                f"{result['stdev_us']:10.2f}{result['ops_per_sec']:12.0f}"
+            )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {"schema": SCHEMA_VERSION, "environment": environment(), "results": results},
+                f, indent=2,
+            )
+            f.write("\n")
+        print(f"\nwrote {args.json}")
+    if args.compare and compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
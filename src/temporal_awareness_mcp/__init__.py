@@ -6,6 +6,14 @@ Built with the official Python MCP SDK following 2025 best practices.
 
 __version__ = "0.1.0"
 
-from .server import create_server
+__all__ = ["create_server", "__version__"]
 
-__all__ = ["create_server", "__version__"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Deferred so that importing a submodule (as process-pool workers do)
+    # does not load the MCP SDK.
+    if name == "create_server":
+        from .server import create_server
+
+        return create_server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
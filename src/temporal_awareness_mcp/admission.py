@@ -0,0 +1,260 @@
+"""Admission control for the HTTP server: rate limits, session caps, deadlines and load shedding.
+
+``AdmissionMiddleware`` sits in front of the Starlette app and refuses, before
+any MCP processing:
+
+* requests from a client IP beyond its token bucket (``--ip-rate`` per second,
+  bursts of ``--ip-burst``), with 429 and ``Retry-After``;
+* messages of an SSE session beyond the session's own bucket
+  (``--session-rate``, ``--session-burst``), also with 429;
+* new SSE sessions once ``--max-sessions`` are open, with 503.
+
+``/health`` and ``/metrics`` are never limited, nor are requests without a
+client address: those arrive on a prefork worker's Unix socket, relayed by the
+worker that admitted them. Client addresses are those uvicorn reports, so
+``X-Forwarded-For`` is honored only from the proxies it trusts
+(``--forwarded-allow-ips``). Buckets are kept for the most recent
+``MAX_TRACKED_CLIENTS`` addresses and sessions.
+
+Inside the MCP server, ``admit_call`` sheds ``tools/call`` requests with a
+JSON-RPC error (``OVERLOADED``, with ``retry_after`` in its data) while
+``--max-inflight-calls`` calls are already running or the executor queue is
+full, and ``deadline`` bounds each call's execution at ``--call-timeout``
+seconds. A call that misses its deadline is answered with an error straight
+away; if it was offloaded, its worker thread still runs to completion.
+
+Every limit is off at 0, and all but the call timeout are off by default.
+Each process keeps its own buckets and counters.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+from urllib.parse import parse_qs
+
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+
+from . import executor
+
+
+# JSON-RPC "server error" code for shed tools/call requests.
+OVERLOADED = -32000
+DEFAULT_CALL_TIMEOUT = 30.0
+MAX_TRACKED_CLIENTS = 10_000
+# Seconds a shed caller is asked to wait before retrying.
+SHED_RETRY_AFTER = 1.0
+REJECTION_REASONS = ("ip_rate", "session_rate", "sessions", "overloaded")
+EXEMPT_PREFIXES = ("/health", "/metrics")
+
+
+class CallTimeoutError(RuntimeError):
+    """Raised when a tool call runs past its deadline."""
+
+
+@dataclass(frozen=True)
+class AdmissionLimits:
+    ip_rate: float = 0.0
+    ip_burst: int = 0
+    session_rate: float = 0.0
+    session_burst: int = 0
+    max_sessions: int = 0
+    max_inflight_calls: int = 0
+    call_timeout: float = DEFAULT_CALL_TIMEOUT
+
+
+class TokenBucket:
+    """``rate`` tokens per second, holding at most ``burst``."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """Take a token; returns 0.0, or the seconds until one is available."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """One token bucket per key, for the ``max_keys`` most recently seen keys."""
+
+    def __init__(self, rate: float, burst: int, max_keys: int = MAX_TRACKED_CLIENTS):
+        self.rate = rate
+        # A burst of 0 means one rate's worth, and at least one request.
+        self.burst = burst or max(1, int(rate))
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def acquire(self, key: str, now: float | None = None) -> float:
+        """0.0 if ``key`` may proceed, else the seconds it should wait."""
+        if not self.enabled:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self.rate, self.burst, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.take(now)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class AdmissionController:
+    def __init__(self, limits: AdmissionLimits = AdmissionLimits()):
+        self.limits = limits
+        self.ip_limiter = RateLimiter(limits.ip_rate, limits.ip_burst)
+        self.session_limiter = RateLimiter(limits.session_rate, limits.session_burst)
+        self.inflight_calls = 0
+        self.admitted = 0
+        self.rejected: Counter[str] = Counter()
+        self.timeouts = 0
+
+    def stats(self) -> dict:
+        return {
+            "admitted": self.admitted,
+            "rejected": {reason: self.rejected[reason] for reason in REJECTION_REASONS},
+            "timeouts": self.timeouts,
+            "inflight_calls": self.inflight_calls,
+            "tracked_clients": len(self.ip_limiter),
+            "tracked_sessions": len(self.session_limiter),
+        }
+
+
+_controller = AdmissionController()
+
+
+def get_admission() -> AdmissionController:
+    return _controller
+
+
+def configure_admission(limits: AdmissionLimits) -> AdmissionController:
+    """Replace the shared controller, dropping its buckets and counters."""
+    global _controller
+    _controller = AdmissionController(limits)
+    return _controller
+
+
+def get_admission_stats() -> dict:
+    return _controller.stats()
+
+
+def _overloaded() -> bool:
+    limits = _controller.limits
+    if limits.max_inflight_calls and _controller.inflight_calls >= limits.max_inflight_calls:
+        return True
+    pool = executor.get_executor()
+    return pool.mode != "inline" and pool.stats()["queue_depth"] >= pool.max_queue
+
+
+@contextlib.contextmanager
+def admit_call():
+    """Count a tools/call as in flight, or shed it with an ``OVERLOADED`` McpError."""
+    controller = _controller
+    if _overloaded():
+        controller.rejected["overloaded"] += 1
+        raise McpError(ErrorData(
+            code=OVERLOADED,
+            message="Server overloaded; retry shortly.",
+            data={"retry_after": SHED_RETRY_AFTER},
+        ))
+    controller.inflight_calls += 1
+    try:
+        yield
+    finally:
+        controller.inflight_calls -= 1
+
+
+@contextlib.asynccontextmanager
+async def deadline():
+    """Bound the enclosed awaits by the call timeout, raising ``CallTimeoutError``."""
+    timeout = _controller.limits.call_timeout
+    if not timeout:
+        yield
+        return
+    try:
+        async with asyncio.timeout(timeout):
+            yield
+    except TimeoutError as e:
+        _controller.timeouts += 1
+        raise CallTimeoutError(f"Tool call exceeded its {timeout:g} s deadline.") from e
+
+
+def _retry_after(seconds: float) -> str:
+    return str(max(1, int(seconds + 0.999)))
+
+
+class AdmissionMiddleware:
+    """ASGI middleware applying the shared controller's HTTP limits.
+
+    ``active_sessions`` reports the open SSE sessions; ``sse_path`` opens
+    them and requests under ``messages_prefix`` carry a ``session_id``.
+    """
+
+    def __init__(
+        self,
+        app,
+        active_sessions: Callable[[], int],
+        sse_path: str = "/sse",
+        messages_prefix: str = "/messages/",
+    ):
+        self.app = app
+        self.active_sessions = active_sessions
+        self.sse_path = sse_path
+        self.messages_prefix = messages_prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope.get("client") or scope["path"].startswith(EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        refusal = self._check(scope)
+        if refusal is None:
+            _controller.admitted += 1
+            await self.app(scope, receive, send)
+            return
+
+        from starlette.responses import JSONResponse
+
+        status, reason, message, retry_after = refusal
+        _controller.rejected[reason] += 1
+        response = JSONResponse(
+            {"error": message}, status_code=status, headers={"Retry-After": _retry_after(retry_after)}
+        )
+        await response(scope, receive, send)
+
+    def _check(self, scope) -> tuple[int, str, str, float] | None:
+        controller = _controller
+        wait = controller.ip_limiter.acquire(scope["client"][0])
+        if wait:
+            return 429, "ip_rate", "Too many requests from this client.", wait
+
+        path = scope["path"]
+        if path == self.sse_path:
+            limit = controller.limits.max_sessions
+            if limit and self.active_sessions() >= limit:
+                return 503, "sessions", "Too many open sessions; retry later.", SHED_RETRY_AFTER
+        elif path.startswith(self.messages_prefix) and controller.session_limiter.enabled:
+            session = parse_qs(scope["query_string"].decode("latin-1")).get("session_id", [""])[0]
+            wait = controller.session_limiter.acquire(session)
+            if wait:
+                return 429, "session_rate", "Too many requests in this session.", wait
+        return None
@@ -0,0 +1,312 @@
+"""Business calendars: weekly working hours, holidays and half-days.
+
+A calendar gives each weekday a list of working intervals in local wall-clock
+time and overrides them on particular dates (holidays close the whole day,
+half-days and other special days get their own intervals). Working time is
+measured in wall-clock seconds inside those intervals.
+
+Every calendar keeps a lazily built index over a range of days: the
+cumulative working seconds and working days before each day. Working time
+between two instants is two index lookups plus a walk over at most one day's
+intervals, and adding working time or working days is a ``bisect`` over the
+index, so neither depends on how far apart the dates are. The index grows (at
+least doubling) when a query falls outside it.
+
+The built-in ``default`` calendar works Monday to Friday, 09:00-17:00, with
+no holidays, in the timezone of the request. Other calendars are JSON files in
+the calendar directory (``--calendar-dir`` or ``$TEMPORAL_MCP_CALENDAR_DIR``),
+one per file, named after the file unless they say otherwise::
+
+    {
+      "name": "nyse",
+      "timezone": "America/New_York",
+      "weekly": {"mon": [["09:30", "16:00"]], "tue": [["09:30", "16:00"]], ...},
+      "holidays": [
+        "2024-12-25",
+        {"date": "2024-11-29", "name": "Day after Thanksgiving", "hours": [["09:30", "13:00"]]}
+      ]
+    }
+
+``weekly`` defaults to the ``default`` schedule and weekdays it leaves out are
+closed. A holiday with ``hours`` is a half-day (or any special opening).
+"""
+
+import json
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+
+
+CALENDAR_DIR_ENV = "TEMPORAL_MCP_CALENDAR_DIR"
+DEFAULT_CALENDAR = "default"
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+SECONDS_PER_DAY = 86400
+# Days indexed around the first query, and the furthest a query may reach.
+INITIAL_INDEX_DAYS = 4 * 366
+MAX_INDEX_DAYS = 200 * 366
+
+Intervals = tuple[tuple[int, int], ...]
+
+_NINE_TO_FIVE: Intervals = ((9 * 3600, 17 * 3600),)
+DEFAULT_WEEKLY: tuple[Intervals, ...] = (_NINE_TO_FIVE,) * 5 + ((), ())
+
+
+@dataclass(frozen=True)
+class _Index:
+    first: int  # proleptic ordinal of the first indexed day
+    seconds: list[int]  # working seconds before each day; one more entry than days
+    days: list[int]  # working days before each day; one more entry than days
+
+    @property
+    def last(self) -> int:
+        """Ordinal just past the last indexed day."""
+        return self.first + len(self.seconds) - 1
+
+
+class BusinessCalendar:
+    def __init__(
+        self,
+        name: str,
+        weekly: tuple[Intervals, ...] = DEFAULT_WEEKLY,
+        special_days: dict[date, Intervals] | None = None,
+        timezone: str | None = None,
+    ):
+        if len(weekly) != 7:
+            raise ValueError("A weekly schedule needs one entry per weekday.")
+        self.name = name
+        self.weekly = weekly
+        self.special_days = dict(special_days or {})
+        self.timezone = timezone
+        self.week_days = sum(1 for intervals in weekly if intervals)
+        self._index: _Index | None = None
+        self._lock = threading.Lock()
+
+    def intervals(self, day: date) -> Intervals:
+        special = self.special_days.get(day)
+        if special is not None:
+            return special
+        return self.weekly[day.weekday()]
+
+    def _build(self, first: int, last: int) -> _Index:
+        seconds = [0]
+        days = [0]
+        for ordinal in range(first, last):
+            intervals = self.intervals(date.fromordinal(ordinal))
+            seconds.append(seconds[-1] + sum(end - start for start, end in intervals))
+            days.append(days[-1] + (1 if intervals else 0))
+        return _Index(first, seconds, days)
+
+    def _covering(self, first: int, last: int) -> _Index:
+        """An index covering the days ``[first, last)``, growing the current one if needed."""
+        index = self._index
+        if index is not None and index.first <= first and last <= index.last:
+            return index
+        with self._lock:
+            index = self._index
+            if index is None:
+                middle = (first + last) // 2
+                first = min(first, middle - INITIAL_INDEX_DAYS // 2)
+                last = max(last, middle + INITIAL_INDEX_DAYS // 2)
+            elif not (index.first <= first and last <= index.last):
+                span = index.last - index.first
+                first = min(first, index.first - span if first < index.first else index.first)
+                last = max(last, index.last + span if last > index.last else index.last)
+            else:
+                return index
+            first = max(first, date.min.toordinal())
+            last = min(last, date.max.toordinal() + 1)
+            if last - first > MAX_INDEX_DAYS:
+                raise ValueError("The dates are too far apart for business time calculations.")
+            self._index = index = self._build(first, last)
+            return index
+
+    def _seconds_into_day(self, dt: datetime) -> float:
+        offset = dt.hour * 3600 + dt.minute * 60 + dt.second + dt.microsecond / 1e6
+        worked = 0.0
+        for start, end in self.intervals(dt.date()):
+            if offset <= start:
+                break
+            worked += min(offset, end) - start
+        return worked
+
+    def _working_seconds_before(self, index: _Index, dt: datetime) -> float:
+        return index.seconds[dt.toordinal() - index.first] + self._seconds_into_day(dt)
+
+    def working_seconds(self, start: datetime, end: datetime) -> float:
+        """Working seconds from ``start`` to ``end`` (wall-clock), negative if ``end`` is earlier."""
+        first, last = sorted((start.toordinal(), end.toordinal()))
+        index = self._covering(first, last + 1)
+        return self._working_seconds_before(index, end) - self._working_seconds_before(index, start)
+
+    def add_working_seconds(self, start: datetime, seconds: float) -> datetime:
+        """The wall-clock time ``seconds`` of working time after (or before) ``start``.
+
+        Landing exactly on a boundary, forward moves stop at the end of a
+        working interval and backward moves at the start of one.
+        """
+        if seconds == 0:
+            return start
+        if self.week_days == 0 and not self.special_days:
+            raise ValueError(f"Calendar '{self.name}' has no working hours.")
+        ordinal = start.toordinal()
+        # First guess at the days needed, doubled below while it falls short.
+        guess = int(abs(seconds) / max(1, self._weekly_seconds() / 7)) + 8
+        while True:
+            if seconds > 0:
+                index = self._covering(ordinal, ordinal + guess)
+            else:
+                index = self._covering(ordinal - guess, ordinal + 1)
+            target = self._working_seconds_before(index, start) + seconds
+            if index.seconds[0] <= target <= index.seconds[-1]:
+                break
+            if guess >= MAX_INDEX_DAYS:
+                raise ValueError("The result is too far away for business time calculations.")
+            guess = min(guess * 2, MAX_INDEX_DAYS)
+
+        if seconds > 0:
+            position = bisect_left(index.seconds, target) - 1
+        else:
+            position = bisect_right(index.seconds, target) - 1
+        day = date.fromordinal(index.first + position)
+        remaining = target - index.seconds[position]
+        for start_s, end_s in self.intervals(day):
+            length = end_s - start_s
+            if remaining < length or (seconds > 0 and remaining == length):
+                offset = start_s + remaining
+                break
+            remaining -= length
+        return datetime.combine(day, time(), start.tzinfo) + timedelta(seconds=offset)
+
+    def add_working_days(self, start: datetime, days: int) -> datetime:
+        """The same wall-clock time on the ``days``-th working day after (or before) ``start``'s date."""
+        if days == 0:
+            return start
+        if self.week_days == 0 and not self.special_days:
+            raise ValueError(f"Calendar '{self.name}' has no working days.")
+        ordinal = start.toordinal()
+        guess = abs(days) * 7 // max(1, self.week_days) + 8
+        while True:
+            if days > 0:
+                index = self._covering(ordinal, ordinal + guess)
+                # Working days strictly after the start date.
+                target = index.days[ordinal + 1 - index.first] + days
+                position = bisect_left(index.days, target)
+                found = position < len(index.days)
+            else:
+                index = self._covering(ordinal - guess, ordinal + 1)
+                # Working days strictly before the start date.
+                target = index.days[ordinal - index.first] + days
+                position = bisect_left(index.days, target + 1)
+                found = target >= 0
+            if found:
+                break
+            if guess >= MAX_INDEX_DAYS:
+                raise ValueError("The result is too far away for business time calculations.")
+            guess = min(guess * 2, MAX_INDEX_DAYS)
+        # ``days[position]`` is the first count reaching the target, so the
+        # target working day is the one just before it.
+        day = date.fromordinal(index.first + position - 1)
+        return datetime.combine(day, start.timetz())
+
+    def _weekly_seconds(self) -> int:
+        return sum(end - start for intervals in self.weekly for start, end in intervals)
+
+
+def _parse_clock(text: str) -> int:
+    hours, _, minutes = text.partition(":")
+    seconds = int(hours) * 3600 + int(minutes or 0) * 60
+    if not 0 <= seconds <= SECONDS_PER_DAY:
+        raise ValueError(f"Invalid time of day: '{text}'")
+    return seconds
+
+
+def _parse_intervals(spans: list) -> Intervals:
+    intervals = tuple(sorted((_parse_clock(start), _parse_clock(end)) for start, end in spans))
+    for (start, end), following in zip(intervals, intervals[1:] + ((SECONDS_PER_DAY, SECONDS_PER_DAY),)):
+        if not start < end <= following[0]:
+            raise ValueError(f"Working hours must be increasing and not overlap: {spans}")
+    return intervals
+
+
+def calendar_from_dict(data: dict, default_name: str) -> BusinessCalendar:
+    weekly = DEFAULT_WEEKLY
+    if "weekly" in data:
+        days = {key[:3].lower(): spans for key, spans in data["weekly"].items()}
+        unknown = set(days) - set(WEEKDAYS)
+        if unknown:
+            raise ValueError(f"Unknown weekdays: {', '.join(sorted(unknown))}")
+        weekly = tuple(_parse_intervals(days.get(day, [])) for day in WEEKDAYS)
+
+    special_days: dict[date, Intervals] = {}
+    for holiday in data.get("holidays", []):
+        if isinstance(holiday, str):
+            holiday = {"date": holiday}
+        special_days[date.fromisoformat(holiday["date"])] = _parse_intervals(holiday.get("hours", []))
+
+    timezone = data.get("timezone")
+    if timezone is not None:
+        from .timezones import canonical_timezone_name
+
+        timezone = canonical_timezone_name(timezone)
+    return BusinessCalendar(data.get("name", default_name), weekly, special_days, timezone)
+
+
+def load_calendar_file(path: str) -> BusinessCalendar:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    try:
+        return calendar_from_dict(data, os.path.splitext(os.path.basename(path))[0])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid calendar file {path}: {e}") from e
+
+
+class CalendarRegistry:
+    def __init__(self, directory: str | None = None):
+        self.directory = directory
+        self._calendars: dict[str, BusinessCalendar] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, BusinessCalendar]:
+        calendars = self._calendars
+        if calendars is not None:
+            return calendars
+        with self._lock:
+            if self._calendars is None:
+                calendars = {DEFAULT_CALENDAR: BusinessCalendar(DEFAULT_CALENDAR)}
+                if self.directory:
+                    for filename in sorted(os.listdir(self.directory)):
+                        if filename.endswith(".json"):
+                            calendar = load_calendar_file(os.path.join(self.directory, filename))
+                            calendars[calendar.name] = calendar
+                self._calendars = calendars
+            return self._calendars
+
+    def get(self, name: str) -> BusinessCalendar:
+        calendars = self._load()
+        calendar = calendars.get(name)
+        if calendar is None:
+            raise ValueError(f"Unknown calendar: {name}. Available: {', '.join(sorted(calendars))}.")
+        return calendar
+
+    def names(self) -> list[str]:
+        return sorted(self._load())
+
+
+_registry = CalendarRegistry(os.environ.get(CALENDAR_DIR_ENV) or None)
+
+
+def configure_calendars(directory: str | None) -> None:
+    """Load calendars from ``directory`` (on first use) instead of ``$TEMPORAL_MCP_CALENDAR_DIR``."""
+    global _registry
+    _registry = CalendarRegistry(directory)
+
+
+def get_calendar(name: str = DEFAULT_CALENDAR) -> BusinessCalendar:
+    return _registry.get(name)
+
+
+def calendar_names() -> list[str]:
+    return _registry.names()
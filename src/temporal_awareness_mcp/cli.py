@@ -0,0 +1,168 @@
+"""Command-line options shared by the stdio and HTTP entry points, and those of the HTTP server."""
+
+import argparse
+import os
+
+from . import admission, calendars, clock, executor, metrics, models, utils
+
+
+def add_common_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--parse-cache-size",
+        type=int,
+        default=None,
+        help="Maximum number of memoized timestamp parses; 0 disables the cache "
+        f"(default: ${utils.PARSE_CACHE_SIZE_ENV} or {utils.DEFAULT_PARSE_CACHE_SIZE})",
+    )
+    parser.add_argument(
+        "--response-format",
+        choices=models.RESPONSE_FORMATS,
+        default="text",
+        help="Default tool result format when a call does not pass response_format (default: text)",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=executor.EXECUTOR_MODES,
+        default="thread",
+        help="Where heavy tool calls run: inline on the event loop, or in a thread or process pool "
+        "(default: thread)",
+    )
+    parser.add_argument(
+        "--executor-workers",
+        type=int,
+        default=None,
+        help="Pool size for the thread or process executor (default: CPU count + 4, at most 32)",
+    )
+    parser.add_argument(
+        "--executor-max-queue",
+        type=int,
+        default=executor.DEFAULT_MAX_QUEUE,
+        help="Offloaded calls allowed to be pending before new ones are refused "
+        f"(default: {executor.DEFAULT_MAX_QUEUE})",
+    )
+    parser.add_argument(
+        "--offload-threshold",
+        type=int,
+        default=executor.DEFAULT_COST_THRESHOLD,
+        help="Estimated cost at which a call leaves the event loop; roughly one unit per ISO/epoch "
+        f"timestamp and {executor.DATEUTIL_COST + 1} per free-form one "
+        f"(default: {executor.DEFAULT_COST_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--calendar-dir",
+        default=None,
+        help="Directory of business calendar JSON files "
+        f"(default: ${calendars.CALENDAR_DIR_ENV}, or only the built-in 'default' calendar)",
+    )
+    parser.add_argument(
+        "--clock-tick-ms",
+        type=int,
+        default=None,
+        help="How long get_current_time readings are shared between callers; 0 reads the clock "
+        f"on every call (default: ${clock.CLOCK_TICK_ENV} or {clock.DEFAULT_CLOCK_TICK_MS})",
+    )
+    parser.add_argument(
+        "--no-metrics",
+        action="store_true",
+        help="Do not record per-tool call counts and latency histograms",
+    )
+
+
+def configure_process(parse_cache_size: int | None, calendar_dir: str | None, clock_tick_ms: int | None) -> None:
+    """Apply the module-level settings; also the initializer of process-pool workers."""
+    if parse_cache_size is not None:
+        utils.configure_parse_cache(parse_cache_size)
+    if calendar_dir is not None:
+        calendars.configure_calendars(calendar_dir)
+    if clock_tick_ms is not None:
+        clock.configure_clock(clock_tick_ms)
+
+
+def apply_common_arguments(args: argparse.Namespace) -> None:
+    if args.parse_cache_size is not None and args.parse_cache_size < 0:
+        raise SystemExit("--parse-cache-size must be non-negative")
+    if args.executor_workers is not None and args.executor_workers < 1:
+        raise SystemExit("--executor-workers must be at least 1")
+    if args.executor_max_queue < 1:
+        raise SystemExit("--executor-max-queue must be at least 1")
+    if args.calendar_dir is not None and not os.path.isdir(args.calendar_dir):
+        raise SystemExit(f"--calendar-dir {args.calendar_dir} is not a directory")
+    if args.clock_tick_ms is not None and args.clock_tick_ms < 0:
+        raise SystemExit("--clock-tick-ms must be non-negative")
+
+    settings = (args.parse_cache_size, args.calendar_dir, args.clock_tick_ms)
+    configure_process(*settings)
+    executor.configure_executor(
+        args.executor, args.executor_workers, args.executor_max_queue, args.offload_threshold,
+        initializer=configure_process, initargs=settings,
+    )
+    metrics.configure_metrics(not args.no_metrics)
+
+def add_http_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cors-origin",
+        action="append",
+        default=None,
+        help="Origin allowed to make cross-origin requests, with credentials; repeatable "
+        "(default: any origin, without credentials)",
+    )
+    parser.add_argument(
+        "--ip-rate",
+        type=float,
+        default=0.0,
+        help="Requests per second allowed from one client address; 0 disables the limit (default: 0)",
+    )
+    parser.add_argument(
+        "--ip-burst",
+        type=int,
+        default=0,
+        help="Requests one client address may make at once before --ip-rate applies (default: the rate)",
+    )
+    parser.add_argument(
+        "--session-rate",
+        type=float,
+        default=0.0,
+        help="Messages per second allowed in one SSE session; 0 disables the limit (default: 0)",
+    )
+    parser.add_argument(
+        "--session-burst",
+        type=int,
+        default=0,
+        help="Messages one SSE session may send at once before --session-rate applies (default: the rate)",
+    )
+    parser.add_argument(
+        "--max-sessions",
+        type=int,
+        default=0,
+        help="Open SSE sessions allowed per process; 0 means no limit (default: 0)",
+    )
+    parser.add_argument(
+        "--max-inflight-calls",
+        type=int,
+        default=0,
+        help="Tool calls allowed to run at once per process before new ones are shed; "
+        "0 means no limit (default: 0)",
+    )
+    parser.add_argument(
+        "--call-timeout",
+        type=float,
+        default=admission.DEFAULT_CALL_TIMEOUT,
+        help="Seconds a tool call may run before it is answered with an error; 0 disables the deadline "
+        f"(default: {admission.DEFAULT_CALL_TIMEOUT:g})",
+    )
+
+
+def apply_http_arguments(args: argparse.Namespace) -> None:
+    for flag in ("ip_rate", "ip_burst", "session_rate", "session_burst", "max_sessions",
+                 "max_inflight_calls", "call_timeout"):
+        if getattr(args, flag) < 0:
+            raise SystemExit(f"--{flag.replace('_', '-')} must be non-negative")
+    admission.configure_admission(admission.AdmissionLimits(
+        ip_rate=args.ip_rate,
+        ip_burst=args.ip_burst,
+        session_rate=args.session_rate,
+        session_burst=args.session_burst,
+        max_sessions=args.max_sessions,
+        max_inflight_calls=args.max_inflight_calls,
+        call_timeout=args.call_timeout,
+    ))
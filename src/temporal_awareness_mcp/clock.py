@@ -0,0 +1,101 @@
+"""Shared clock behind ``get_current_time``.
+
+Under the SSE server many sessions ask for the time in the same few zones
+within the same second. The clock keeps one snapshot per timezone argument,
+holding the result with its ISO, human and Unix fields already rendered, and
+recomputes it at most once per tick: every call in the same tick (``--clock-tick-ms``,
+aligned to the wall clock) is served the same snapshot, so a reading is at most
+one tick old. A miss takes a lock and checks again before computing, so
+concurrent requests for a zone that just went stale compute it once.
+
+A tick of 0 turns the clock off, and ``get_current_time`` callers that need
+the exact instant pass ``precise=True`` to bypass it.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+
+from . import results
+from .cache import LRUCache
+from .timezones import resolve_timezone
+
+
+CLOCK_TICK_ENV = "TEMPORAL_MCP_CLOCK_TICK_MS"
+DEFAULT_CLOCK_TICK_MS = 100
+# Distinct timezone arguments with a live snapshot.
+SNAPSHOT_CACHE_SIZE = 256
+
+_HUMAN_FORMAT = "%A, %B %d, %Y at %I:%M %p"
+
+
+def _tick_from_env() -> int:
+    try:
+        return max(0, int(os.environ.get(CLOCK_TICK_ENV, DEFAULT_CLOCK_TICK_MS)))
+    except ValueError:
+        return DEFAULT_CLOCK_TICK_MS
+
+
+_tick_ns = _tick_from_env() * 1_000_000
+_snapshots = LRUCache(SNAPSHOT_CACHE_SIZE)
+_compute_lock = threading.Lock()
+_served = 0
+_computed = 0
+
+
+def configure_clock(tick_ms: int) -> None:
+    """Set the snapshot tick in milliseconds; 0 computes every reading."""
+    global _tick_ns
+    if tick_ms < 0:
+        raise ValueError("tick_ms must be non-negative")
+    _tick_ns = tick_ms * 1_000_000
+    _snapshots.clear()
+
+
+def get_clock_stats() -> dict[str, int]:
+    return {"served": _served, "computed": _computed, "tick_ms": _tick_ns // 1_000_000}
+
+
+def clear_clock() -> None:
+    global _served, _computed
+    _snapshots.clear()
+    _served = _computed = 0
+
+
+def read_now(timezone_name: str) -> results.CurrentTime:
+    """The current time in ``timezone_name``, computed now."""
+    zone = resolve_timezone(timezone_name)
+    now = datetime.now(zone)
+    formatted = now.strftime(_HUMAN_FORMAT)
+    return results.CurrentTime(
+        iso_timestamp=now.isoformat(),
+        formatted_timestamp=formatted,
+        timezone=str(zone),
+        # The human format starts with the weekday.
+        day_of_week=formatted.partition(",")[0],
+        unix_timestamp=now.timestamp(),
+    )
+
+
+def read_clock(timezone_name: str) -> results.CurrentTime:
+    """The current time in ``timezone_name``, from this tick's snapshot when there is one.
+
+    Snapshots are shared between callers and must not be modified.
+    """
+    global _served, _computed
+    tick_ns = _tick_ns
+    if not tick_ns:
+        return read_now(timezone_name)
+    tick = time.time_ns() // tick_ns
+    snapshot = _snapshots.get(timezone_name)
+    if snapshot is None or snapshot[0] != tick:
+        with _compute_lock:
+            snapshot = _snapshots.get(timezone_name)
+            if snapshot is None or snapshot[0] != tick:
+                # Invalid zones raise here and are never stored.
+                snapshot = (tick, read_now(timezone_name))
+                _snapshots.put(timezone_name, snapshot)
+                _computed += 1
+    _served += 1
+    return snapshot[1]
@@ -0,0 +1,148 @@
+"""Duration formatting: "2 days, 3 hours", "2d 3h" or ISO 8601 "P2DT3H".
+
+Durations are integer microseconds and are broken down with integer
+``divmod`` over a unit table, so no precision is lost to floats. The units
+for each (largest, smallest) pair are looked up once and cached with their
+spellings; when the smallest unit is a second or longer, the arithmetic runs
+on whole seconds, which stay small ints. Units below the smallest are
+truncated, and the sign is dropped (callers report it separately). Months and
+years are nominal, 30 and 365 days, and only appear when asked for as the
+largest unit.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple
+
+
+# (name, microseconds, long singular, long plural, compact suffix, ISO designator), largest first.
+_UNIT_TABLE = (
+    ("years", 365 * 86_400_000_000, "year", "years", "y", "Y"),
+    ("months", 30 * 86_400_000_000, "month", "months", "mo", "M"),
+    ("weeks", 7 * 86_400_000_000, "week", "weeks", "w", "W"),
+    ("days", 86_400_000_000, "day", "days", "d", "D"),
+    ("hours", 3_600_000_000, "hour", "hours", "h", "H"),
+    ("minutes", 60_000_000, "minute", "minutes", "m", "M"),
+    ("seconds", 1_000_000, "second", "seconds", "s", "S"),
+    ("milliseconds", 1_000, "millisecond", "milliseconds", "ms", None),
+    ("microseconds", 1, "microsecond", "microseconds", "us", None),
+)
+DURATION_UNITS = tuple(row[0] for row in _UNIT_TABLE)
+
+_SECOND = 1_000_000
+# Counts below this have their long and compact parts rendered in advance.
+_RENDERED_COUNTS = 100
+_DAY = 86_400 * _SECOND
+# Fraction digits of ISO 8601 seconds for the sub-second units.
+_ISO_DIGITS = {"milliseconds": 3, "microseconds": 6}
+
+
+class _Unit(NamedTuple):
+    # Size in multiples of the plan's scale.
+    size: int
+    many: str
+    compact: str
+    designator: str | None
+    is_date: bool
+    # "0 hours", "1 hour", "2 hours", ... and "0h", "1h", ...
+    long_parts: tuple[str, ...]
+    compact_parts: tuple[str, ...]
+
+
+class _Plan(NamedTuple):
+    # Microseconds per counted step: a second when no unit is shorter.
+    scale: int
+    units: tuple[_Unit, ...]
+
+
+@lru_cache(maxsize=None)
+def _plan(largest_unit: str, smallest_unit: str) -> _Plan:
+    try:
+        first, last = DURATION_UNITS.index(largest_unit), DURATION_UNITS.index(smallest_unit)
+    except ValueError:
+        raise ValueError(f"Unknown duration unit; use one of {', '.join(DURATION_UNITS)}.") from None
+    # CalculateDifferenceInput rejects inverted units before any call gets here.
+    assert first <= last, f"{largest_unit} is smaller than {smallest_unit}"
+    rows = _UNIT_TABLE[first:last + 1]
+    scale = _SECOND if rows[-1][1] >= _SECOND else 1
+    return _Plan(scale, tuple(
+        _Unit(
+            size // scale, f" {many}", compact, designator, size >= _DAY,
+            tuple(f"{count} {one if count == 1 else many}" for count in range(_RENDERED_COUNTS)),
+            tuple(f"{count}{compact}" for count in range(_RENDERED_COUNTS)),
+        )
+        for _, size, one, many, compact, designator in rows
+    ))
+
+
+def format_duration(
+    microseconds: int,
+    style: str = "long",
+    largest_unit: str = "days",
+    smallest_unit: str = "seconds",
+    max_parts: int = 0,
+) -> str:
+    """Format ``abs(microseconds)``; ``max_parts`` (0 for no limit) caps the units shown.
+
+    The defaults give "1 day, 2 hours, 5 seconds": units with a zero count
+    are left out, and a duration under the smallest unit is "0 seconds".
+    ``max_parts`` counts units from the largest non-zero one, shown or not,
+    so 2 turns "1 day, 5 seconds" into "1 day".
+    """
+    if style == "iso":
+        return _format_iso(abs(microseconds), largest_unit, smallest_unit, max_parts)
+    scale, units = _plan(largest_unit, smallest_unit)
+    remaining = abs(microseconds) // scale
+    long = style == "long"
+    parts = []
+    # Units left to consider once the first non-zero one is found.
+    left = max_parts or len(units)
+    for size, many, compact, _, _, long_parts, compact_parts in units:
+        if remaining >= size:
+            count, remaining = divmod(remaining, size)
+            if count < _RENDERED_COUNTS:
+                parts.append(long_parts[count] if long else compact_parts[count])
+            else:
+                parts.append(f"{count}{many}" if long else f"{count}{compact}")
+        elif not parts:
+            continue
+        left -= 1
+        if not left:
+            break
+    if long:
+        return ", ".join(parts) if parts else units[-1].long_parts[0]
+    return " ".join(parts) if parts else units[-1].compact_parts[0]
+
+
+def _format_iso(microseconds: int, largest_unit: str, smallest_unit: str, max_parts: int) -> str:
+    _plan(largest_unit, smallest_unit)  # validates the pair
+    # ISO 8601 has no unit below the second: milliseconds and microseconds
+    # become a fraction of the seconds.
+    digits = _ISO_DIGITS.get(smallest_unit, 0)
+    fraction = 0
+    if digits:
+        fraction = microseconds % _SECOND // 10 ** (6 - digits)
+        smallest_unit = "seconds"
+        if largest_unit in _ISO_DIGITS:
+            largest_unit = "seconds"
+    scale, units = _plan(largest_unit, smallest_unit)
+    remaining = microseconds // scale
+
+    date_part = time_part = ""
+    left = max_parts or len(units)
+    for size, _, _, designator, is_date, _, _ in units:
+        if remaining >= size or (designator == "S" and fraction):
+            count, remaining = divmod(remaining, size)
+            if is_date:
+                date_part += f"{count}{designator}"
+            elif designator == "S" and fraction:
+                time_part += f"{count}.{fraction:0{digits}d}".rstrip("0") + "S"
+            else:
+                time_part += f"{count}{designator}"
+        elif not (date_part or time_part):
+            continue
+        left -= 1
+        if not left:
+            break
+    if not (date_part or time_part):
+        return "P0D" if units[-1].is_date else "PT0S"
+    return f"P{date_part}T{time_part}" if time_part else f"P{date_part}"
@@ -0,0 +1,199 @@
+"""Executor layer that keeps heavy tool calls off the event loop.
+
+Tool handlers are synchronous. Calls whose estimated cost is below
+``cost_threshold`` run inline, since handing them to a pool costs more than
+running them; heavier calls (free-form parses, large batches) are handed to a
+thread pool, or to a process pool for batch-heavy deployments and
+free-threaded builds. At most ``max_queue`` offloaded calls may be pending at
+once; beyond that calls are refused with ``ExecutorSaturatedError`` instead of
+piling up behind the pool.
+
+The cost of a call is estimated from its parsed input: every timestamp costs
+one unit and one that needs the ``dateutil`` fallback costs ``DATEUTIL_COST``
+more, summed over batch items. Timeline entries cost one unit each, without
+looking at them. Recurrence rules cost ``RECURRENCE_COST``: dateutil may
+search years ahead for the next occurrence, so they always leave the loop.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Literal
+
+from pydantic import BaseModel
+
+from . import utils
+
+
+ExecutorMode = Literal["inline", "thread", "process"]
+EXECUTOR_MODES = ("inline", "thread", "process")
+
+DEFAULT_MAX_QUEUE = 256
+DATEUTIL_COST = 20
+# A single dateutil parse is enough to leave the event loop.
+DEFAULT_COST_THRESHOLD = DATEUTIL_COST
+RECURRENCE_COST = 100
+
+TIMESTAMP_FIELDS = ("timestamp", "start_timestamp", "end_timestamp")
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when too many offloaded calls are already pending."""
+
+
+def estimate_cost(input_data: Any) -> int:
+    """Rough relative CPU cost of running a tool on ``input_data``."""
+    if isinstance(input_data, list):
+        return sum(estimate_cost(item) for item in input_data if isinstance(item, BaseModel))
+    cost = 0
+    for field in TIMESTAMP_FIELDS:
+        value = getattr(input_data, field, None)
+        if isinstance(value, str):
+            cost += 1 if utils.has_fast_path(value) else 1 + DATEUTIL_COST
+    if getattr(input_data, "rule", None) is not None:
+        cost += RECURRENCE_COST
+    timestamps = getattr(input_data, "timestamps", None)
+    if timestamps is not None:
+        cost += len(timestamps)
+    timestamps_text = getattr(input_data, "timestamps_text", None)
+    if timestamps_text is not None:
+        cost += timestamps_text.count("\n") + 1
+    return cost
+
+
+def _timed_call(func: Callable[[Any], Any], argument: Any, submitted: float) -> tuple[Any, float]:
+    # Runs in the worker; time.monotonic is system-wide, so this also holds
+    # across processes.
+    waited = time.monotonic() - submitted
+    return func(argument), waited
+
+
+class ToolExecutor:
+    def __init__(
+        self,
+        mode: ExecutorMode = "thread",
+        max_workers: int | None = None,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        cost_threshold: int = DEFAULT_COST_THRESHOLD,
+        initializer: Callable[..., None] | None = None,
+        initargs: tuple = (),
+    ):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Executor mode must be one of {', '.join(EXECUTOR_MODES)}.")
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1.")
+        self.mode = mode
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_queue = max_queue
+        self.cost_threshold = cost_threshold
+        # Run in each process-pool worker, which starts from a fresh interpreter.
+        self.initializer = initializer
+        self.initargs = initargs
+        self._pool: Executor | None = None
+        self._pending = 0
+        self._peak_pending = 0
+        self._inline = 0
+        self._offloaded = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.mode == "process":
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                # Spawned workers do not inherit the parent's threads or locks.
+                self._pool = ProcessPoolExecutor(
+                    self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=self.initializer,
+                    initargs=self.initargs,
+                )
+            else:
+                self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="temporal-tool")
+        return self._pool
+
+    async def run(self, func: Callable[[Any], Any], input_data: Any) -> Any:
+        """Run ``func(input_data)`` inline or in the pool, depending on its cost."""
+        if self.mode == "inline" or estimate_cost(input_data) < self.cost_threshold:
+            self._inline += 1
+            return func(input_data)
+
+        if self._pending >= self.max_queue:
+            self._rejected += 1
+            raise ExecutorSaturatedError(
+                f"Server is busy: {self._pending} tool calls are already queued; retry shortly."
+            )
+
+        self._pending += 1
+        self._peak_pending = max(self._peak_pending, self._pending)
+        submitted = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            result, waited = await loop.run_in_executor(
+                self._get_pool(), _timed_call, func, input_data, submitted
+            )
+        finally:
+            self._pending -= 1
+
+        self._offloaded += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        self._run_total += time.monotonic() - submitted - waited
+        return result
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "cost_threshold": self.cost_threshold,
+            "queue_depth": self._pending,
+            "peak_queue_depth": self._peak_pending,
+            "inline": self._inline,
+            "offloaded": self._offloaded,
+            "rejected": self._rejected,
+            "wait_seconds_total": self._wait_total,
+            "wait_seconds_max": self._wait_max,
+            "run_seconds_total": self._run_total,
+        }
+
+
+_executor = ToolExecutor()
+
+
+def get_executor() -> ToolExecutor:
+    return _executor
+
+
+def configure_executor(
+    mode: ExecutorMode = "thread",
+    max_workers: int | None = None,
+    max_queue: int = DEFAULT_MAX_QUEUE,
+    cost_threshold: int = DEFAULT_COST_THRESHOLD,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+) -> ToolExecutor:
+    """Replace the shared executor, shutting the previous one down.
+
+    ``initializer(*initargs)`` runs in each process-pool worker; spawned
+    workers otherwise see only the settings taken from the environment.
+    """
+    global _executor
+    previous = _executor
+    _executor = ToolExecutor(mode, max_workers, max_queue, cost_threshold, initializer, initargs)
+    previous.shutdown()
+    return _executor
+
+
+def get_executor_stats() -> dict[str, Any]:
+    return _executor.stats()
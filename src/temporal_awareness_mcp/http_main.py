@@ -3,19 +3,65 @@
 
 import asyncio
 import argparse
+import os
 from .server import create_server
+from .cli import add_common_arguments, add_http_arguments, apply_common_arguments, apply_http_arguments
+from .timezones import warm_timezone_registry
+from .workers import DEFAULT_GRACEFUL_TIMEOUT, resolve_worker_count, run_workers
 
 
 async def main():
     parser = argparse.ArgumentParser(description="Temporal Awareness MCP Server")
-    parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
-    parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
-    
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"), help="Host to bind to")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8000)), help="Port to bind to")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WORKERS", 1)),
+        help="Worker processes sharing the port; 0 starts one per available CPU "
+        "(default: $WORKERS or 1)",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=DEFAULT_GRACEFUL_TIMEOUT,
+        help="Seconds workers get to finish open requests and sessions on shutdown "
+        f"(default: {DEFAULT_GRACEFUL_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--http-stream",
+        action="store_true",
+        help="Answer streamable-HTTP requests on /mcp with an SSE stream instead of a JSON body",
+    )
+    add_common_arguments(parser)
+    add_http_arguments(parser)
+
     args = parser.parse_args()
-    
-    server = create_server()
-    await server.run_sse(host=args.host, port=args.port)
+    if args.workers < 0:
+        raise SystemExit("--workers must be non-negative")
+    workers = resolve_worker_count(args.workers)
+    if workers > 1:
+        # Each worker applies the common and HTTP arguments itself.
+        await run_workers(args, workers)
+        return
+
+    apply_common_arguments(args)
+    apply_http_arguments(args)
+    warm_timezone_registry()
+
+    server = create_server(args.response_format)
+    await server.run_sse(
+        host=args.host,
+        port=args.port,
+        json_response=not args.http_stream,
+        cors_origins=args.cors_origin or ("*",),
+    )
+
+
+def run():
+    """Console-script entry point."""
+    asyncio.run(main())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
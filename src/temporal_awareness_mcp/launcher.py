@@ -0,0 +1,119 @@
+"""Attach a stdio MCP session to the prefork daemon (``temporal-mcp-attach``).
+
+An MCP host spawns this instead of ``temporal-mcp-stdio`` when
+``temporal-mcp-daemon`` is running. The launcher connects to the daemon's
+Unix socket and hands over its stdin, stdout and stderr with ``SCM_RIGHTS``;
+a warmed-up daemon process then serves the session on those descriptors
+directly, and the launcher only waits for it to end. If no daemon is
+listening, the launcher replaces itself with ``stdio_main``, passing on any
+arguments it does not recognise. Descriptors are only handed to a daemon
+run by the same user (checked with ``SO_PEERCRED``); any other listener is
+treated as no daemon.
+
+Only the standard library is imported, so the launcher starts in the time
+it takes to start the interpreter.
+"""
+
+import argparse
+import os
+import socket
+import struct
+import sys
+
+
+SOCKET_ENV = "TEMPORAL_MCP_PREFORK_SOCKET"
+
+# struct ucred: pid, uid, gid.
+_CREDENTIALS = struct.Struct("3i")
+
+
+def fallback_dir() -> str:
+    """The per-user 0700 directory holding the socket when there is no runtime dir."""
+    return f"/tmp/temporal-mcp-{os.getuid()}"
+
+
+def default_socket_path() -> str:
+    """``$TEMPORAL_MCP_PREFORK_SOCKET``, else a per-user path in the runtime dir."""
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "temporal-mcp.sock")
+    return os.path.join(fallback_dir(), "daemon.sock")
+
+
+def peer_uid(conn: socket.socket) -> int:
+    credentials = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _CREDENTIALS.size)
+    return _CREDENTIALS.unpack(credentials)[1]
+
+
+def connect(path: str) -> socket.socket:
+    """Connect to the daemon; raises ``OSError`` if none of this user's is listening on ``path``."""
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(path)
+        uid = peer_uid(conn)
+        if uid != os.getuid():
+            raise PermissionError(f"{path} is served by uid {uid}, not by this user")
+    except OSError:
+        conn.close()
+        raise
+    return conn
+
+
+def attach(conn: socket.socket) -> None:
+    """Hand this process's stdio to the daemon session and wait for it to end."""
+    with conn:
+        socket.send_fds(conn, [b"\0"], [0, 1, 2])
+        # The session holds the other end open until it finishes; if this
+        # process is killed, the session sees the connection close and exits.
+        while conn.recv(64):
+            pass
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Attach stdio to a prefork Temporal Awareness MCP daemon"
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help=f"Daemon socket (default: ${SOCKET_ENV}, or temporal-mcp.sock in $XDG_RUNTIME_DIR, "
+        "or /tmp/temporal-mcp-<uid>/daemon.sock)",
+    )
+    parser.add_argument(
+        "--no-fallback",
+        action="store_true",
+        help="Fail instead of starting a standalone stdio server when no daemon is running",
+    )
+    args, stdio_args = parser.parse_known_args(argv)
+
+    try:
+        conn = connect(args.socket or default_socket_path())
+    except OSError as e:
+        if args.no_fallback:
+            print(f"temporal-mcp-attach: no daemon: {e}", file=sys.stderr)
+            return 1
+        os.execv(
+            sys.executable,
+            [sys.executable, "-m", "temporal_awareness_mcp.stdio_main", *stdio_args],
+        )
+
+    try:
+        attach(conn)
+    except KeyboardInterrupt:
+        return 130
+    except OSError as e:
+        print(f"temporal-mcp-attach: session lost: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run():
+    """Console-script entry point."""
+    sys.exit(main())
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,204 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+Tool calls are counted per tool, errors per tool and exception type, and
+latencies go into fixed-bucket histograms per tool and phase:
+
+* ``validation``: turning the raw arguments into the tool's input model;
+* ``parse``: time spent in ``utils.robust_parse_datetime``;
+* ``compute``: the rest of the tool handler;
+* ``render``: producing the response text;
+* ``total``: the whole call, including any executor queue wait.
+
+Parse-tier counts, parse-cache, timezone-registry and shared-clock
+statistics, executor queue state, admission-control counters and active SSE
+sessions are read from their owners when the metrics are rendered, so they
+cost nothing per call. Recording is cheap enough to leave on (a few
+``perf_counter`` calls and a bisect per call) and can be switched off with
+``configure_metrics(False)`` (``--no-metrics``).
+
+Every process keeps its own metrics; with ``http_main --workers N`` each
+worker reports for itself. With the process executor, parse time is
+measured in the pool process and sent back with the result, but parse-tier
+and cache counts stay in the pool processes.
+"""
+
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Callable, Iterable
+
+from . import admission, clock, executor, utils
+from .timezones import get_timezone_stats
+
+
+PHASES = ("validation", "parse", "compute", "render", "total")
+# Upper bounds in seconds; +Inf is implicit.
+LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+UNKNOWN_TOOL = "unknown"
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> Iterable[tuple[str, int]]:
+        running = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            running += count
+            yield ("+Inf" if bound == float("inf") else repr(bound)), running
+
+
+class Metrics:
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.calls: defaultdict[str, int] = defaultdict(int)
+        self.errors: defaultdict[tuple[str, str], int] = defaultdict(int)
+        self.latency: defaultdict[tuple[str, str], Histogram] = defaultdict(Histogram)
+
+    def record_call(self, tool: str, phases: dict[str, float]) -> None:
+        self.calls[tool] += 1
+        for phase, seconds in phases.items():
+            self.latency[tool, phase].observe(seconds)
+
+    def record_error(self, tool: str, error: BaseException) -> None:
+        self.calls[tool] += 1
+        self.errors[tool, type(error).__name__] += 1
+
+
+_metrics = Metrics()
+
+
+def configure_metrics(enabled: bool) -> None:
+    _metrics.enabled = enabled
+
+
+def metrics_enabled() -> bool:
+    return _metrics.enabled
+
+
+def reset_metrics() -> None:
+    global _metrics
+    _metrics = Metrics(_metrics.enabled)
+
+
+def record_call(tool: str, phases: dict[str, float]) -> None:
+    _metrics.record_call(tool, phases)
+
+
+def record_error(tool: str, error: BaseException) -> None:
+    _metrics.record_error(tool, error)
+
+
+def measure_handler(handler: Callable[[Any], Any], input_data: Any) -> tuple[Any, float, float]:
+    """Run ``handler`` and return its result, parse seconds and total seconds.
+
+    Module-level so that it can be sent to a process pool with ``partial``.
+    """
+    utils.start_parse_timing()
+    started = time.perf_counter()
+    try:
+        result = handler(input_data)
+        elapsed = time.perf_counter() - started
+    finally:
+        parse_seconds = utils.stop_parse_timing()
+    return result, parse_seconds, elapsed
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _family(lines: list[str], name: str, kind: str, help_text: str) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def render_metrics(active_sessions: int | None = None) -> str:
+    """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+    m = _metrics
+    lines: list[str] = []
+
+    _family(lines, "temporal_mcp_tool_calls_total", "counter", "Tool calls, including failed ones.")
+    for tool, count in sorted(m.calls.items()):
+        lines.append(f"temporal_mcp_tool_calls_total{_labels(tool=tool)} {count}")
+
+    _family(lines, "temporal_mcp_tool_errors_total", "counter", "Failed tool calls by exception type.")
+    for (tool, error), count in sorted(m.errors.items()):
+        lines.append(f"temporal_mcp_tool_errors_total{_labels(tool=tool, error=error)} {count}")
+
+    _family(
+        lines, "temporal_mcp_tool_latency_seconds", "histogram",
+        "Successful tool call latency by phase.",
+    )
+    for (tool, phase), histogram in sorted(m.latency.items()):
+        for bound, count in histogram.cumulative():
+            lines.append(
+                f"temporal_mcp_tool_latency_seconds_bucket{_labels(tool=tool, phase=phase, le=bound)} {count}"
+            )
+        labels = _labels(tool=tool, phase=phase)
+        lines.append(f"temporal_mcp_tool_latency_seconds_sum{labels} {histogram.total!r}")
+        lines.append(f"temporal_mcp_tool_latency_seconds_count{labels} {histogram.count}")
+
+    _family(lines, "temporal_mcp_parse_tier_total", "counter", "Timestamps handled by each parser tier.")
+    for tier, count in utils.get_parse_tier_counts().items():
+        lines.append(f"temporal_mcp_parse_tier_total{_labels(tier=tier)} {count}")
+
+    cache = utils.get_parse_cache_stats()
+    for key, kind in (("hits", "counter"), ("misses", "counter"), ("evictions", "counter"), ("size", "gauge")):
+        name = f"temporal_mcp_parse_cache_{key}" + ("_total" if kind == "counter" else "")
+        _family(lines, name, kind, f"Parse cache {key}.")
+        lines.append(f"{name} {cache[key]}")
+
+    zones = get_timezone_stats()
+    for key in ("hits", "misses", "rejections"):
+        name = f"temporal_mcp_timezone_{key}_total"
+        _family(lines, name, "counter", f"Timezone registry lookup {key}.")
+        lines.append(f"{name} {zones[key]}")
+
+    readings = clock.get_clock_stats()
+    for key in ("served", "computed"):
+        name = f"temporal_mcp_clock_readings_{key}_total"
+        _family(lines, name, "counter", f"Current-time readings {key} by the shared clock.")
+        lines.append(f"{name} {readings[key]}")
+
+    pool = executor.get_executor_stats()
+    _family(lines, "temporal_mcp_executor_queue_depth", "gauge", "Offloaded tool calls pending or running.")
+    lines.append(f"temporal_mcp_executor_queue_depth {pool['queue_depth']}")
+    for key in ("offloaded", "rejected"):
+        name = f"temporal_mcp_executor_{key}_total"
+        _family(lines, name, "counter", f"Tool calls {key} by the executor.")
+        lines.append(f"{name} {pool[key]}")
+    _family(lines, "temporal_mcp_executor_wait_seconds_total", "counter", "Time offloaded calls spent queued.")
+    lines.append(f"temporal_mcp_executor_wait_seconds_total {pool['wait_seconds_total']!r}")
+
+    gate = admission.get_admission_stats()
+    _family(lines, "temporal_mcp_admission_rejected_total", "counter", "Requests refused by admission control.")
+    for reason, count in gate["rejected"].items():
+        lines.append(f"temporal_mcp_admission_rejected_total{_labels(reason=reason)} {count}")
+    _family(lines, "temporal_mcp_call_timeouts_total", "counter", "Tool calls that missed their deadline.")
+    lines.append(f"temporal_mcp_call_timeouts_total {gate['timeouts']}")
+    _family(lines, "temporal_mcp_inflight_calls", "gauge", "Tool calls being handled.")
+    lines.append(f"temporal_mcp_inflight_calls {gate['inflight_calls']}")
+
+    if active_sessions is not None:
+        _family(lines, "temporal_mcp_active_sse_sessions", "gauge", "Open SSE sessions.")
+        lines.append(f"temporal_mcp_active_sse_sessions {active_sessions}")
+
+    return "\n".join(lines) + "\n"
@@ -1,7 +1,22 @@
 """Pydantic models for temporal awareness tools."""
 
-from pydantic import BaseModel, Field
-from typing import Literal
+from pydantic import BaseModel, Field, model_validator
+from typing import Generic, Literal, TypeVar, get_args
+
+
+MAX_BATCH_SIZE = 1000
+MAX_RECURRENCE_PAGE = 1000
+MAX_TIMELINE_SIZE = 1_000_000
+MAX_TIMELINE_GAPS = 100
+
+Arithmetic = Literal["wall", "absolute"]
+DurationStyle = Literal["long", "compact", "iso"]
+DurationUnit = Literal[
+    "years", "months", "weeks", "days", "hours", "minutes", "seconds", "milliseconds", "microseconds"
+]
+DURATION_UNITS = get_args(DurationUnit)
+ResponseFormat = Literal["text", "json"]
+RESPONSE_FORMATS = get_args(ResponseFormat)
 
 
 class GetCurrentTimeInput(BaseModel):
@@ -9,6 +24,15 @@ class GetCurrentTimeInput(BaseModel):
         default="UTC",
         description="The IANA timezone name for which to get the current time. e.g., 'America/New_York', 'Europe/London'."
     )
+    format: Literal["iso", "human", "timestamp"] = Field(
+        default="iso",
+        description="Which representation the text response carries: ISO 8601, human-friendly, or Unix timestamp."
+    )
+    precise: bool = Field(
+        default=False,
+        description="Read the clock for this call instead of sharing the server's snapshot, "
+        "which may be up to one clock tick (100 ms by default) old."
+    )
 
 
 class GetCurrentTimeOutput(BaseModel):
@@ -16,6 +40,7 @@ class GetCurrentTimeOutput(BaseModel):
     formatted_timestamp: str = Field(description="A human-friendly formatted timestamp, e.g., 'July 20, 2024 at 10:30 AM'.")
     timezone: str = Field(description="The timezone used for the calculation.")
     day_of_week: str = Field(description="The full name of the day of the week, e.g., 'Saturday'.")
+    unix_timestamp: float = Field(description="Seconds since the Unix epoch.")
 
 
 class CalculateDifferenceInput(BaseModel):
@@ -25,6 +50,40 @@ class CalculateDifferenceInput(BaseModel):
         default="UTC",
         description="The IANA timezone to use for parsing if the timestamps are ambiguous."
     )
+    arithmetic: Arithmetic = Field(
+        default="wall",
+        description="'wall' compares local clock readings; 'absolute' measures elapsed time, accounting for DST changes."
+    )
+    calendar: str | None = Field(
+        default=None,
+        description="Name of a business calendar ('default' is Monday-Friday, 09:00-17:00). When set, only working time is counted and arithmetic is ignored."
+    )
+    duration_style: DurationStyle = Field(
+        default="long",
+        description="How formatted_duration is written: 'long' ('2 days, 3 hours'), 'compact' ('2d 3h') or 'iso' (ISO 8601, 'P2DT3H')."
+    )
+    largest_unit: DurationUnit | None = Field(
+        default=None,
+        description="The largest unit in formatted_duration, e.g. 'hours' gives '50 hours' rather than '2 days, 2 hours'. Defaults to days, or hours with a calendar. Months and years count as 30 and 365 days."
+    )
+    smallest_unit: DurationUnit = Field(
+        default="seconds",
+        description="The smallest unit in formatted_duration; anything shorter is dropped."
+    )
+    max_parts: int = Field(
+        default=0,
+        description="Show at most this many units, counted from the largest non-zero one (2 gives '2 days, 3 hours' for 2 days, 3 hours and 5 minutes); 0 for no limit.",
+        ge=0, le=9
+    )
+
+    @model_validator(mode="after")
+    def _check_unit_order(self):
+        largest = self.largest_unit or ("hours" if self.calendar is not None else "days")
+        if DURATION_UNITS.index(largest) > DURATION_UNITS.index(self.smallest_unit):
+            raise ValueError(
+                f"largest_unit ({largest}) must not be smaller than smallest_unit ({self.smallest_unit})."
+            )
+        return self
 
 
 class CalculateDifferenceOutput(BaseModel):
@@ -66,8 +125,223 @@ class AdjustTimestampInput(BaseModel):
         default="UTC",
         description="The IANA timezone to use for parsing if the timestamp is ambiguous."
     )
+    arithmetic: Arithmetic = Field(
+        default="wall",
+        description="'wall' shifts the local clock reading (1 day is always the same time tomorrow); 'absolute' adds elapsed time, accounting for DST changes."
+    )
+    calendar: str | None = Field(
+        default=None,
+        description="Name of a business calendar ('default' is Monday-Friday, 09:00-17:00). When set, weeks and days count working days and hours, minutes and seconds count working time; arithmetic is ignored."
+    )
 
 
 class AdjustTimestampOutput(BaseModel):
     original_timestamp_iso: str = Field(description="The original timestamp in ISO 8601 format.")
-    adjusted_timestamp_iso: str = Field(description="The resulting new timestamp in ISO 8601 format.")
\ No newline at end of file
+    adjusted_timestamp_iso: str = Field(description="The resulting new timestamp in ISO 8601 format.")
+
+
+class ConvertTimezoneInput(BaseModel):
+    timestamp: str | None = Field(
+        default=None,
+        description="The instant to convert, in any common format. Defaults to the current time."
+    )
+    timezone: str = Field(
+        default="UTC",
+        description="The IANA timezone the timestamp is read in."
+    )
+    target_timezones: list[str] = Field(
+        min_length=1, max_length=MAX_BATCH_SIZE,
+        description="The IANA timezones to convert to, e.g. ['Europe/London', 'Asia/Tokyo']."
+    )
+    honor_offset: bool = Field(
+        default=False,
+        description="If true, an explicit offset in the timestamp (e.g. 'Z' or '+05:30') fixes the instant; otherwise offsets are ignored and the time is read in timezone."
+    )
+
+
+class TimezoneConversion(BaseModel):
+    timezone: str = Field(description="The IANA timezone.")
+    iso_timestamp: str = Field(description="The instant in this timezone, in ISO 8601 format.")
+    formatted_timestamp: str = Field(description="A human-friendly formatted timestamp.")
+    day_of_week: str = Field(description="The full name of the local day of the week.")
+    utc_offset: str = Field(description="The UTC offset in force, e.g. '+05:30'.")
+    abbreviation: str = Field(description="The zone abbreviation in force, e.g. 'CEST'.")
+
+
+class ConvertTimezoneOutput(BaseModel):
+    utc_timestamp: str = Field(description="The instant in UTC, in ISO 8601 format.")
+    conversions: list[TimezoneConversion] = Field(description="One entry per target timezone, in request order.")
+
+
+class BusinessDurationInput(BaseModel):
+    start_timestamp: str = Field(description="The earlier timestamp in any common format.")
+    end_timestamp: str = Field(description="The later timestamp in any common format.")
+    timezone: str = Field(
+        default="UTC",
+        description="The IANA timezone to use for parsing if the timestamps are ambiguous."
+    )
+    calendar: str = Field(
+        default="default",
+        description="Name of the business calendar ('default' is Monday-Friday, 09:00-17:00 in the given timezone)."
+    )
+
+
+class AddBusinessTimeInput(BaseModel):
+    start_timestamp: str = Field(description="The starting timestamp in any common format.")
+    amount: float = Field(description="How much working time to add; negative to subtract.")
+    unit: Literal["days", "hours", "minutes"] = Field(
+        description="'days' moves by whole working days, keeping the time of day; 'hours' and 'minutes' count working time."
+    )
+    timezone: str = Field(
+        default="UTC",
+        description="The IANA timezone to use for parsing and for the result."
+    )
+    calendar: str = Field(
+        default="default",
+        description="Name of the business calendar ('default' is Monday-Friday, 09:00-17:00 in the given timezone)."
+    )
+
+
+class ExpandRecurrenceInput(BaseModel):
+    rule: str = Field(
+        description="An RFC 5545 recurrence rule, e.g. 'FREQ=WEEKLY;INTERVAL=2;BYDAY=TU' (an 'RRULE:' prefix is optional). UNTIL must be given in UTC (ending in 'Z')."
+    )
+    start_timestamp: str = Field(
+        description="The first possible occurrence (DTSTART), in any common format. Its wall-clock time in the timezone is kept for every occurrence."
+    )
+    timezone: str = Field(
+        default="UTC",
+        description="The IANA timezone the rule repeats in; occurrences keep their local time across DST changes."
+    )
+    after: str | None = Field(default=None, description="Only return occurrences at or after this timestamp.")
+    before: str | None = Field(default=None, description="Only return occurrences at or before this timestamp.")
+    limit: int = Field(
+        default=100,
+        description="The most occurrences to return in one response.",
+        ge=1, le=MAX_RECURRENCE_PAGE
+    )
+    cursor: str | None = Field(
+        default=None,
+        description="The next_cursor of a previous response, to continue where it stopped."
+    )
+
+
+class ExpandRecurrenceOutput(BaseModel):
+    occurrences: list[str] = Field(description="The occurrences in ISO 8601 format, in order.")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Pass as cursor to get the next page; absent when there are no more occurrences."
+    )
+
+
+class AnalyzeTimelineInput(BaseModel):
+    timestamps: list[str] | None = Field(
+        default=None,
+        max_length=MAX_TIMELINE_SIZE,
+        description="The timestamps to analyze, in any common format and any order."
+    )
+    timestamps_text: str | None = Field(
+        default=None,
+        description="Alternatively, the timestamps as newline-delimited text, one per line (e.g. pasted log times); blank lines are skipped."
+    )
+    timezone: str = Field(
+        default="UTC",
+        description="The IANA timezone the timestamps are read in and bucketed by."
+    )
+    honor_offset: bool = Field(
+        default=False,
+        description="If true, an explicit offset in a timestamp (e.g. 'Z' or '+05:30') fixes its instant; otherwise offsets are ignored and times are read in timezone."
+    )
+    business_hours_start: int = Field(
+        default=9,
+        description="The start hour (0-23) for business hours.",
+        ge=0, le=23
+    )
+    business_hours_end: int = Field(
+        default=17,
+        description="The end hour (0-23) for business hours.",
+        ge=0, le=23
+    )
+    top_gaps: int = Field(
+        default=5,
+        description="How many of the largest gaps between consecutive timestamps to report.",
+        ge=0, le=MAX_TIMELINE_GAPS
+    )
+
+
+class IntervalStats(BaseModel):
+    min_seconds: float = Field(description="The shortest interval between consecutive timestamps.")
+    max_seconds: float = Field(description="The longest interval between consecutive timestamps.")
+    median_seconds: float = Field(description="The median interval between consecutive timestamps.")
+    mean_seconds: float = Field(description="The mean interval between consecutive timestamps.")
+
+
+class TimelineGap(BaseModel):
+    start_timestamp: str = Field(description="The timestamp before the gap, in ISO 8601 format.")
+    end_timestamp: str = Field(description="The timestamp after the gap, in ISO 8601 format.")
+    seconds: float = Field(description="The length of the gap in seconds.")
+    formatted_duration: str = Field(description="The length of the gap, e.g. '3 hours, 5 minutes'.")
+
+
+class AnalyzeTimelineOutput(BaseModel):
+    count: int = Field(description="How many timestamps were parsed.")
+    invalid_count: int = Field(description="How many entries could not be parsed; they are left out of everything else.")
+    errors: list[str] = Field(description="Why the first few invalid entries failed, with their item index or line number.")
+    first_timestamp: str | None = Field(default=None, description="The earliest timestamp, in ISO 8601 format.")
+    last_timestamp: str | None = Field(default=None, description="The latest timestamp, in ISO 8601 format.")
+    out_of_order: int = Field(description="How many timestamps are earlier than the one before them in the input; 0 if it was sorted.")
+    intervals: IntervalStats | None = Field(default=None, description="Statistics of the intervals between consecutive timestamps, in time order; absent for fewer than two.")
+    largest_gaps: list[TimelineGap] = Field(description="The largest intervals, longest first.")
+    by_hour: list[int] = Field(description="Timestamps per local hour of the day, 0 to 23.")
+    by_weekday: dict[str, int] = Field(description="Timestamps per local day of the week, Monday first.")
+    by_day: dict[str, int] = Field(description="Timestamps per local date (YYYY-MM-DD), in date order; days without any are left out.")
+    outside_business_hours: int = Field(description="Timestamps on weekends or outside the business hours.")
+
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class BatchItemResult(BaseModel, Generic[T]):
+    index: int = Field(description="Position of the item in the request.")
+    result: T | None = Field(default=None, description="The tool output, if the item succeeded.")
+    error: str | None = Field(default=None, description="Why the item failed, if it did.")
+
+
+class BatchGetCurrentTimeInput(BaseModel):
+    items: list[GetCurrentTimeInput] = Field(
+        min_length=1, max_length=MAX_BATCH_SIZE, description="The get_current_time requests to run."
+    )
+
+
+class BatchGetCurrentTimeOutput(BaseModel):
+    results: list[BatchItemResult[GetCurrentTimeOutput]]
+
+
+class BatchCalculateDifferenceInput(BaseModel):
+    items: list[CalculateDifferenceInput] = Field(
+        min_length=1, max_length=MAX_BATCH_SIZE, description="The calculate_difference requests to run."
+    )
+
+
+class BatchCalculateDifferenceOutput(BaseModel):
+    results: list[BatchItemResult[CalculateDifferenceOutput]]
+
+
+class BatchGetTimestampContextInput(BaseModel):
+    items: list[GetTimestampContextInput] = Field(
+        min_length=1, max_length=MAX_BATCH_SIZE, description="The get_timestamp_context requests to run."
+    )
+
+
+class BatchGetTimestampContextOutput(BaseModel):
+    results: list[BatchItemResult[GetTimestampContextOutput]]
+
+
+class BatchAdjustTimestampInput(BaseModel):
+    items: list[AdjustTimestampInput] = Field(
+        min_length=1, max_length=MAX_BATCH_SIZE, description="The adjust_timestamp requests to run."
+    )
+
+
+class BatchAdjustTimestampOutput(BaseModel):
+    results: list[BatchItemResult[AdjustTimestampOutput]]
@@ -0,0 +1,274 @@
+"""Prefork daemon for stdio sessions (``temporal-mcp-daemon``).
+
+Every ``stdio_main`` process pays for an interpreter start and for importing
+the MCP SDK before it can answer ``initialize``. The daemon pays that once: it
+imports everything, builds the tool schemas, loads the timezone index and
+common zones and exercises every parser tier, then freezes the heap
+(``gc.freeze``) so that forked children share those pages copy-on-write. It
+keeps ``--pool-size`` forked children waiting on a Unix socket.
+
+``temporal-mcp-attach`` (see ``launcher``) connects and passes its stdin,
+stdout and stderr over the socket. The child that accepts serves one MCP
+session on them and exits; the daemon forks a replacement straight away. A
+session ends when the host closes stdin or the launcher goes away. Sessions
+run in their own process group and outlive the daemon: stopping it (SIGTERM
+or SIGINT) only stops the idle children.
+
+Linux only: descriptors are passed with ``SCM_RIGHTS`` and callers are
+checked with ``SO_PEERCRED``; the socket is created with mode 0600, and the
+fallback ``/tmp/temporal-mcp-<uid>`` directory holding it with mode 0700.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import io
+import os
+import select
+import signal
+import socket
+import stat
+import struct
+import sys
+import traceback
+
+from .launcher import default_socket_path, fallback_dir, peer_uid
+
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_SESSIONS = 64
+WARM_TIMEZONES = (
+    "UTC", "America/New_York", "America/Chicago", "America/Denver", "America/Los_Angeles",
+    "America/Sao_Paulo", "Europe/London", "Europe/Paris", "Europe/Berlin", "Europe/Moscow",
+    "Asia/Kolkata", "Asia/Shanghai", "Asia/Tokyo", "Asia/Singapore", "Australia/Sydney",
+)
+# One input per parser tier (ISO, epoch, relative, dateutil).
+WARM_TIMESTAMPS = ("2024-01-01T09:00:00Z", "1700000000", "in 3 hours", "January 1, 2024 9:00 AM")
+
+_PID = struct.Struct("i")
+def _log(message: str) -> None:
+    print(f"[daemon] {message}", file=sys.stderr, flush=True)
+
+
+def warm_up() -> None:
+    """Load and exercise everything a session needs before its first request."""
+    from . import calendars, clock, metrics, models, registry, stdio_main, utils  # noqa: F401
+    from .timezones import resolve_timezone, warm_timezone_registry
+    from .tools import recurrence
+
+    registry.list_tools()
+    calendars.calendar_names()
+    clock.read_clock("UTC")
+    warm_timezone_registry()
+    for name in WARM_TIMEZONES:
+        resolve_timezone(name)
+    for text in WARM_TIMESTAMPS:
+        utils.robust_parse_datetime(text)
+    recurrence.expand_recurrence(
+        models.ExpandRecurrenceInput(rule="FREQ=DAILY;COUNT=1", start_timestamp=WARM_TIMESTAMPS[0])
+    )
+    recurrence.clear_rule_cache()
+    clock.clear_clock()
+    utils.clear_parse_cache()
+    utils.reset_parse_tier_counts()
+    metrics.reset_metrics()
+
+
+def make_private_dir(path: str) -> None:
+    """Create ``path`` with mode 0700, or check that an existing one is this user's alone."""
+    with contextlib.suppress(FileExistsError):
+        os.mkdir(path, 0o700)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise SystemExit(f"{path} must be a directory owned by this user with mode 0700")
+
+
+async def serve_attached(temporal_server, conn: socket.socket) -> None:
+    """Serve one session on stdio until it ends or the launcher disconnects."""
+    from .stdio_main import serve_stdio
+
+    conn.setblocking(False)
+    session = asyncio.ensure_future(serve_stdio(temporal_server))
+    detached = asyncio.ensure_future(asyncio.get_running_loop().sock_recv(conn, 1))
+    await asyncio.wait({session, detached}, return_when=asyncio.FIRST_COMPLETED)
+    if not session.done():
+        # The stdin reader thread cannot be cancelled, so skip interpreter
+        # cleanup; the host's pipes close with this process.
+        os._exit(0)
+    detached.cancel()
+    session.result()
+
+
+class PreforkDaemon:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.path = args.socket or default_socket_path()
+        self._server = None
+        self._listener: socket.socket | None = None
+        self._status_r = self._status_w = -1
+        self._idle: set[int] = set()
+        self._busy: set[int] = set()
+        self._stopping = False
+
+    def _bind(self) -> socket.socket:
+        if os.path.dirname(self.path) == fallback_dir():
+            make_private_dir(fallback_dir())
+        with contextlib.suppress(FileNotFoundError):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(self.path)
+                except ConnectionRefusedError:
+                    os.unlink(self.path)  # stale socket from a daemon that died
+                else:
+                    raise SystemExit(f"A daemon is already listening on {self.path}")
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)
+        try:
+            listener.bind(self.path)
+        finally:
+            os.umask(umask)
+        listener.listen(64)
+        return listener
+
+    def _fork(self) -> None:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid:
+            self._idle.add(pid)
+            return
+        code = 1
+        try:
+            code = self._child()
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            os._exit(code)
+
+    def _child(self) -> int:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        os.close(self._status_r)
+        conn, _ = self._listener.accept()
+        self._listener.close()
+        os.write(self._status_w, _PID.pack(os.getpid()))
+        os.close(self._status_w)
+        # Leave the daemon's process group so a Ctrl-C aimed at it spares sessions.
+        os.setsid()
+
+        with conn:
+            if peer_uid(conn) != os.getuid():
+                return 1
+            _, fds, _, _ = socket.recv_fds(conn, 1, 3)
+            if len(fds) != 3:
+                return 1
+            for target, fd in enumerate(fds):
+                os.dup2(fd, target)
+                os.close(fd)
+            sys.stdin = io.TextIOWrapper(open(0, "rb", closefd=False), encoding="utf-8")
+            sys.stdout = io.TextIOWrapper(open(1, "wb", closefd=False), encoding="utf-8")
+            sys.stderr = io.TextIOWrapper(open(2, "wb", closefd=False), encoding="utf-8", write_through=True)
+            asyncio.run(serve_attached(self._server, conn))
+        return 0
+
+    def _reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            if pid in self._idle:
+                _log(f"idle child {pid} exited with status {os.waitstatus_to_exitcode(status)}")
+            self._idle.discard(pid)
+            self._busy.discard(pid)
+
+    def _read_status(self) -> None:
+        data = os.read(self._status_r, 4096)
+        for (pid,) in _PID.iter_unpack(data):
+            self._idle.discard(pid)
+            self._busy.add(pid)
+
+    def _replenish(self) -> None:
+        while (
+            len(self._idle) < self.args.pool_size
+            and len(self._idle) + len(self._busy) < self.args.max_sessions
+        ):
+            self._fork()
+
+    def _stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def serve(self) -> None:
+        from .cli import apply_common_arguments
+        from .server import create_server
+
+        apply_common_arguments(self.args)
+        warm_up()
+        self._server = create_server(self.args.response_format)
+        self._listener = self._bind()
+        self._status_r, self._status_w = os.pipe()
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        # Keep the warmed-up heap out of collections so children never
+        # touch (and copy) its pages.
+        gc.freeze()
+        _log(f"listening on {self.path} with {self.args.pool_size} warm children")
+
+        try:
+            while not self._stopping:
+                self._reap()
+                self._replenish()
+                ready, _, _ = select.select([self._status_r], [], [], 0.5)
+                if ready:
+                    self._read_status()
+        finally:
+            self._listener.close()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)
+            for pid in self._idle:
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(pid, signal.SIGTERM)
+            for pid in self._idle:
+                with contextlib.suppress(ChildProcessError):
+                    os.waitpid(pid, 0)
+            _log(f"stopped; {len(self._busy)} sessions left running")
+
+
+def main(argv: list[str] | None = None) -> None:
+    from .cli import add_common_arguments
+    from .launcher import SOCKET_ENV, fallback_dir
+
+    parser = argparse.ArgumentParser(description="Temporal Awareness MCP prefork stdio daemon")
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help=f"Unix socket to listen on (default: ${SOCKET_ENV}, or temporal-mcp.sock in "
+        f"$XDG_RUNTIME_DIR, or {os.path.join(fallback_dir(), 'daemon.sock')})",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=DEFAULT_POOL_SIZE,
+        help=f"Warm children kept waiting for a session (default: {DEFAULT_POOL_SIZE})",
+    )
+    parser.add_argument(
+        "--max-sessions",
+        type=int,
+        default=DEFAULT_MAX_SESSIONS,
+        help="Children, busy or idle, allowed at once; further sessions wait for one to end "
+        f"(default: {DEFAULT_MAX_SESSIONS})",
+    )
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.pool_size < 1:
+        raise SystemExit("--pool-size must be at least 1")
+    if args.max_sessions < args.pool_size:
+        raise SystemExit("--max-sessions must be at least --pool-size")
+    PreforkDaemon(args).serve()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Tool registry: one declaration per tool, shared by tools/list and tools/call.
+
+Each ``ToolSpec`` names the tool's Pydantic input model, handler and optional
+text renderer. Input schemas are generated from the models with
+``model_json_schema`` on first use, so that process startup and the
+``initialize`` handshake do not pay for them, and the ``Tool`` list served by
+``tools/list`` is built once and only rebuilt after a tool is added.
+
+Arguments are validated once, by the input model's compiled validator: the
+server does not also check them against the JSON schema, and batch items are
+validated as one list (``batch.validate_items``).
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Callable
+
+from mcp.types import Tool
+from pydantic import BaseModel
+
+from . import models, rendering, results
+from .tools import batch, business, contextual, core, recurrence, timeline
+
+
+RESPONSE_FORMAT_PROPERTY = {
+    "type": "string",
+    "enum": list(models.RESPONSE_FORMATS),
+    "description": "'text' for a one-line summary, 'json' for the full result object. "
+    "Defaults to the server setting ('text' unless configured otherwise).",
+}
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    name: str
+    description: str
+    input_model: type[BaseModel]
+    handler: Callable[[Any], Any]
+    renderer: Callable[[Any, Any], str] | None = None
+    # Turns the raw arguments into the handler's input; defaults to validating
+    # them against ``input_model``.
+    parse_arguments: Callable[[dict[str, Any]], Any] | None = None
+
+    @cached_property
+    def input_schema(self) -> dict[str, Any]:
+        schema = self.input_model.model_json_schema()
+        if self.renderer is not None:
+            schema["properties"]["response_format"] = RESPONSE_FORMAT_PROPERTY
+        return schema
+
+    @cached_property
+    def validate(self) -> Callable[[dict[str, Any]], Any]:
+        """The raw-arguments parser: ``parse_arguments``, or the model's compiled validator."""
+        if self.parse_arguments is not None:
+            return self.parse_arguments
+        return self.input_model.__pydantic_validator__.validate_python
+
+    def parse(self, arguments: dict[str, Any]) -> Any:
+        return self.validate(arguments)
+
+    def render(self, input_data: Any, result: Any, response_format: str) -> str:
+        """Render a result; tools without a text renderer always return JSON."""
+        if response_format == "json" or self.renderer is None:
+            return results.to_json(result)
+        return self.renderer(input_data, result)
+
+    def to_tool(self) -> Tool:
+        return Tool(name=self.name, description=self.description, inputSchema=self.input_schema)
+
+
+_specs: dict[str, ToolSpec] = {}
+TOOLS = MappingProxyType(_specs)
+_tool_list: tuple[Tool, ...] | None = None
+
+
+def register(spec: ToolSpec) -> ToolSpec:
+    global _tool_list
+    if spec.name in _specs:
+        raise ValueError(f"Tool '{spec.name}' is already registered.")
+    _specs[spec.name] = spec
+    _tool_list = None
+    return spec
+
+
+def get_tool(name: str) -> ToolSpec:
+    spec = _specs.get(name)
+    if spec is None:
+        raise ValueError(f"Unknown tool: {name}")
+    return spec
+
+
+def list_tools() -> tuple[Tool, ...]:
+    """The ``Tool`` definitions, in registration order, built on first call."""
+    global _tool_list
+    if _tool_list is None:
+        _tool_list = tuple(spec.to_tool() for spec in _specs.values())
+    return _tool_list
+
+
+def _batch_arguments(item_model: type[BaseModel]) -> Callable[[dict[str, Any]], list]:
+    def parse(arguments: dict[str, Any]) -> list:
+        return batch.validate_items(item_model, arguments.get("items"))
+
+    return parse
+
+
+register(ToolSpec(
+    name="get_current_time",
+    description="Returns the current date and time in a specified timezone",
+    input_model=models.GetCurrentTimeInput,
+    handler=core.get_current_time,
+    renderer=rendering.current_time_text,
+))
+register(ToolSpec(
+    name="calculate_difference",
+    description="Calculates the duration between two timestamps",
+    input_model=models.CalculateDifferenceInput,
+    handler=core.calculate_difference,
+    renderer=rendering.difference_text,
+))
+register(ToolSpec(
+    name="get_timestamp_context",
+    description="Provides human-readable context about a specific timestamp",
+    input_model=models.GetTimestampContextInput,
+    handler=contextual.get_timestamp_context,
+    renderer=rendering.context_text,
+))
+register(ToolSpec(
+    name="adjust_timestamp",
+    description="Adds or subtracts a duration from a given timestamp",
+    input_model=models.AdjustTimestampInput,
+    handler=core.adjust_timestamp,
+    renderer=rendering.adjust_text,
+))
+register(ToolSpec(
+    name="convert_timezone",
+    description="Converts one instant into several timezones in a single call",
+    input_model=models.ConvertTimezoneInput,
+    handler=core.convert_timezone,
+    renderer=rendering.convert_text,
+))
+register(ToolSpec(
+    name="business_duration",
+    description="Calculates the working time between two timestamps on a business calendar, "
+    "skipping nights, weekends and holidays",
+    input_model=models.BusinessDurationInput,
+    handler=business.business_duration,
+    renderer=rendering.difference_text,
+))
+register(ToolSpec(
+    name="add_business_time",
+    description="Adds or subtracts working days, hours or minutes on a business calendar",
+    input_model=models.AddBusinessTimeInput,
+    handler=business.add_business_time,
+    renderer=rendering.adjust_text,
+))
+register(ToolSpec(
+    name="expand_recurrence",
+    description="Lists the occurrences of an RFC 5545 recurrence rule (RRULE) in a timezone, "
+    "optionally within a window, paged with a cursor",
+    input_model=models.ExpandRecurrenceInput,
+    handler=recurrence.expand_recurrence,
+    renderer=rendering.recurrence_text,
+))
+register(ToolSpec(
+    name="analyze_timeline",
+    description="Summarizes many timestamps at once: order, interval statistics, largest gaps, "
+    "hourly, weekday and daily counts, and how many fall outside business hours",
+    input_model=models.AnalyzeTimelineInput,
+    handler=timeline.analyze_timeline,
+    renderer=rendering.timeline_text,
+))
+register(ToolSpec(
+    name="batch_get_current_time",
+    description="Runs get_current_time for many timezones in one call, with per-item results and errors",
+    input_model=models.BatchGetCurrentTimeInput,
+    handler=batch.batch_get_current_time,
+    parse_arguments=_batch_arguments(models.GetCurrentTimeInput),
+))
+register(ToolSpec(
+    name="batch_calculate_difference",
+    description="Runs calculate_difference for many timestamp pairs in one call, with per-item results and errors",
+    input_model=models.BatchCalculateDifferenceInput,
+    handler=batch.batch_calculate_difference,
+    parse_arguments=_batch_arguments(models.CalculateDifferenceInput),
+))
+register(ToolSpec(
+    name="batch_get_timestamp_context",
+    description="Runs get_timestamp_context for many timestamps in one call, with per-item results and errors",
+    input_model=models.BatchGetTimestampContextInput,
+    handler=batch.batch_get_timestamp_context,
+    parse_arguments=_batch_arguments(models.GetTimestampContextInput),
+))
+register(ToolSpec(
+    name="batch_adjust_timestamp",
+    description="Runs adjust_timestamp for many timestamps in one call, with per-item results and errors",
+    input_model=models.BatchAdjustTimestampInput,
+    handler=batch.batch_adjust_timestamp,
+    parse_arguments=_batch_arguments(models.AdjustTimestampInput),
+))
@@ -0,0 +1,243 @@
+"""Relative time expressions: "in 3 hours", "2 weeks ago", "next Friday at 5pm",
+"tomorrow noon", "end of month".
+
+The grammar is a handful of regular expressions assembled once, at import,
+from the word tables below, and a whole input is matched in a single
+``fullmatch`` per form, so text that is not a relative expression is rejected
+after a few regex scans instead of a dateutil parse attempt.
+
+Expressions are resolved against a reference time in its own zone. Hours,
+minutes and seconds are elapsed time ("in 3 hours" across a DST change is
+three real hours later); days, weeks, months and years move the calendar and
+keep the local time of day, clamping to the end of shorter months, and so do
+"today", "tomorrow" and "yesterday" without a time. A weekday without a time
+means its midnight, as with dates. Local times that fall in a DST gap move
+forward by the gap. Weeks start on Monday.
+"""
+
+import calendar
+import re
+from datetime import date, datetime, time, timedelta, timezone
+
+
+# Canonical unit for every spelling the grammar accepts.
+UNITS = {
+    "second": "seconds", "seconds": "seconds", "sec": "seconds", "secs": "seconds", "s": "seconds",
+    "minute": "minutes", "minutes": "minutes", "min": "minutes", "mins": "minutes", "m": "minutes",
+    "hour": "hours", "hours": "hours", "hr": "hours", "hrs": "hours", "h": "hours",
+    "day": "days", "days": "days", "d": "days",
+    "week": "weeks", "weeks": "weeks", "wk": "weeks", "wks": "weeks", "w": "weeks",
+    "fortnight": "fortnights", "fortnights": "fortnights",
+    "month": "months", "months": "months", "mo": "months", "mos": "months",
+    "year": "years", "years": "years", "yr": "years", "yrs": "years", "y": "years",
+}
+WEEKDAYS = {
+    name: index
+    for index, names in enumerate((
+        ("monday", "mon"), ("tuesday", "tue", "tues"), ("wednesday", "wed"),
+        ("thursday", "thu", "thur", "thurs"), ("friday", "fri"), ("saturday", "sat"), ("sunday", "sun"),
+    ))
+    for name in names
+}
+DAY_WORDS = {"today": 0, "tomorrow": 1, "yesterday": -1}
+PERIODS = ("day", "week", "month", "year")
+# Qualifiers of a weekday or period, as a step from the current one.
+SHIFTS = {"this": 0, "next": 1, "last": -1, "previous": -1, "coming": 1}
+
+# Longer inputs are not matched at all; they are left to dateutil.
+MAX_RELATIVE_LENGTH = 128
+
+_ELAPSED = {"seconds": 1, "minutes": 60, "hours": 3600}
+_CALENDAR_DAYS = {"days": 1, "weeks": 7, "fortnights": 14}
+
+
+def _words(names) -> str:
+    # Longest first, so that "mins" is not matched as "min".
+    return "|".join(sorted(map(re.escape, names), key=len, reverse=True))
+
+
+# Words need a space before the unit: "an hour", but "and" is not "an d".
+_NUMBER = r"(?:\d+(?:\.\d+)?|(?<![a-z])(?:an?|one)(?=\s))"
+# Units may be written close up: "1h30m".
+_AMOUNT = rf"(?P<n>{_NUMBER})\s*(?P<unit>{_words(UNITS)})(?![a-z])"
+# Whitespace between amounts can only be split one way ("\s*" before an
+# optional comma, "\s*" after it); overlapping separators made near misses
+# such as "1h 1h ... 1h x" backtrack exponentially.
+_DURATION = (
+    rf"{_NUMBER}\s*(?:{_words(UNITS)})(?![a-z])"
+    rf"(?:\s*(?:,\s*)?(?:and\s+)?{_NUMBER}\s*(?:{_words(UNITS)})(?![a-z]))*"
+)
+_CLOCK = (
+    r"(?:(?:at|@)\s+)?(?:(?P<noon>noon|midday)|(?P<midnight>midnight)"
+    r"|(?P<hour>\d{1,2})(?::(?P<minute>\d{2})(?::(?P<second>\d{2}))?)?\s*(?P<meridiem>am|pm|a\.m\.|p\.m\.)?)"
+)
+_SHIFT = _words(SHIFTS)
+
+_AMOUNT_PATTERN = re.compile(_AMOUNT)
+_OFFSET_PATTERN = re.compile(
+    rf"(?:in\s+(?P<ahead>{_DURATION})|(?P<span>{_DURATION})\s+(?P<direction>ago|from\s+now|later|hence|before\s+now))"
+)
+_DAY_PATTERN = re.compile(
+    rf"(?:(?P<day>{_words(DAY_WORDS)})|(?:on\s+)?(?:(?P<shift>{_SHIFT})\s+)?(?P<weekday>{_words(WEEKDAYS)})\b)?"
+    rf"\s*,?\s*(?:{_CLOCK})?"
+)
+_BOUNDARY_PATTERN = re.compile(
+    rf"(?P<edge>start|beginning|end)\s+of\s+(?:the\s+)?(?:(?P<shift>{_SHIFT})\s+)?(?P<period>{_words(PERIODS)})"
+)
+_PERIOD_PATTERN = re.compile(rf"(?P<shift>next|last|previous|coming)\s+(?P<period>{_words(PERIODS)})")
+_SPACE = re.compile(r"\s+")
+
+
+def _amount(text: str) -> float:
+    text = text.strip()
+    return 1.0 if text in ("a", "an", "one") else float(text)
+
+
+def _add_months(dt: datetime, months: int) -> datetime:
+    month_index = dt.month - 1 + months
+    year, month = dt.year + month_index // 12, month_index % 12 + 1
+    return dt.replace(year=year, month=month, day=min(dt.day, calendar.monthrange(year, month)[1]))
+
+
+def _localize(wall: datetime, zone) -> datetime:
+    # A round trip through UTC moves wall-clock times in a DST gap forward.
+    return wall.replace(tzinfo=zone).astimezone(timezone.utc).astimezone(zone)
+
+
+def _shift(reference: datetime, durations: str, sign: int) -> datetime:
+    months = 0
+    days = 0.0
+    seconds = 0.0
+    for match in _AMOUNT_PATTERN.finditer(durations):
+        amount = _amount(match["n"]) * sign
+        unit = UNITS[match["unit"]]
+        if unit in _ELAPSED:
+            seconds += amount * _ELAPSED[unit]
+        elif unit in _CALENDAR_DAYS:
+            days += amount * _CALENDAR_DAYS[unit]
+        else:
+            whole = int(amount)
+            if whole != amount:
+                raise ValueError("Months and years must be whole numbers.")
+            months += whole * (12 if unit == "years" else 1)
+
+    wall = reference.replace(tzinfo=None)
+    if months:
+        wall = _add_months(wall, months)
+    if days:
+        wall += timedelta(days=days)
+    shifted = _localize(wall, reference.tzinfo) if (months or days) else reference
+    if seconds:
+        shifted = (shifted.astimezone(timezone.utc) + timedelta(seconds=seconds)).astimezone(reference.tzinfo)
+    return shifted
+
+
+def _clock(match: re.Match) -> time | None:
+    if match["noon"]:
+        return time(12)
+    if match["midnight"]:
+        return time(0)
+    if match["hour"] is None:
+        return None
+    hour = int(match["hour"])
+    meridiem = match["meridiem"]
+    if meridiem is None and match["minute"] is None:
+        return None
+    if meridiem is not None:
+        if not 1 <= hour <= 12:
+            raise ValueError(f"Invalid hour for {meridiem}: {hour}")
+        hour = hour % 12 + (12 if meridiem.startswith("p") else 0)
+    return time(hour, int(match["minute"] or 0), int(match["second"] or 0))
+
+
+def _weekday(reference: date, weekday: int, shift: str | None) -> date:
+    ahead = (weekday - reference.weekday()) % 7
+    if shift is None or SHIFTS[shift] == 0:
+        # "friday" and "this friday": the coming one, today included.
+        return reference + timedelta(days=ahead)
+    if SHIFTS[shift] > 0:
+        return reference + timedelta(days=ahead or 7)
+    return reference - timedelta(days=(reference.weekday() - weekday) % 7 or 7)
+
+
+def _period_start(day: date, period: str, shift: int) -> date:
+    if period == "day":
+        return day + timedelta(days=shift)
+    if period == "week":
+        return day - timedelta(days=day.weekday()) + timedelta(weeks=shift)
+    if period == "month":
+        month_index = day.month - 1 + shift
+        return date(day.year + month_index // 12, month_index % 12 + 1, 1)
+    return date(day.year + shift, 1, 1)
+
+
+def _period_end(start: date, period: str) -> date:
+    if period == "day":
+        return start
+    if period == "week":
+        return start + timedelta(days=6)
+    if period == "month":
+        return start.replace(day=calendar.monthrange(start.year, start.month)[1])
+    return start.replace(month=12, day=31)
+
+
+def parse_relative(text: str, reference: datetime) -> datetime | None:
+    """Resolve ``text`` against the aware ``reference``, or return None if it is not relative."""
+    if len(text) > MAX_RELATIVE_LENGTH:
+        return None
+    text = _SPACE.sub(" ", text.strip().lower())
+
+    match = _OFFSET_PATTERN.fullmatch(text)
+    if match is not None:
+        if match["ahead"] is not None:
+            return _shift(reference, match["ahead"], 1)
+        sign = -1 if match["direction"] in ("ago", "before now") else 1
+        return _shift(reference, match["span"], sign)
+
+    if text == "now":
+        return reference
+    match = _DAY_PATTERN.fullmatch(text)
+    if match is not None and match.group(0):
+        clock = _clock(match)
+        if clock is None and match["hour"] is not None:
+            return None  # a bare number is not a time of day
+        if match["day"] is not None:
+            if clock is None:
+                return _shift(reference, "1 day", DAY_WORDS[match["day"]])
+            day = reference.date() + timedelta(days=DAY_WORDS[match["day"]])
+        elif match["weekday"] is not None:
+            day = _weekday(reference.date(), WEEKDAYS[match["weekday"]], match["shift"])
+        else:
+            day = reference.date()
+        return _localize(datetime.combine(day, clock or time(0)), reference.tzinfo)
+
+    match = _BOUNDARY_PATTERN.fullmatch(text)
+    if match is not None:
+        period = match["period"]
+        start = _period_start(reference.date(), period, SHIFTS[match["shift"]] if match["shift"] else 0)
+        if match["edge"] == "end":
+            wall = datetime.combine(_period_end(start, period), time(23, 59, 59))
+        else:
+            wall = datetime.combine(start, time(0))
+        return _localize(wall, reference.tzinfo)
+
+    match = _PERIOD_PATTERN.fullmatch(text)
+    if match is not None:
+        sign = SHIFTS[match["shift"]]
+        return _shift(reference, f"1 {match['period']}", sign)
+
+    return None
+
+
+def looks_relative(text: str) -> bool:
+    """Whether ``text`` matches the grammar (it may still fail to resolve, e.g. "13pm")."""
+    if len(text) > MAX_RELATIVE_LENGTH:
+        return False
+    text = _SPACE.sub(" ", text.strip().lower())
+    if text == "now":
+        return True
+    day = _DAY_PATTERN.fullmatch(text)
+    return bool(day and day.group(0)) or any(
+        pattern.fullmatch(text) is not None
+        for pattern in (_OFFSET_PATTERN, _BOUNDARY_PATTERN, _PERIOD_PATTERN)
+    )
@@ -0,0 +1,65 @@
+"""One-line text renderings of tool results.
+
+Tools return the result types in ``results``. With ``response_format="json"``
+the result is serialized once with ``results.to_json`` and every field reaches
+the client; the renderings below are only built for ``response_format="text"``
+(see ``registry.ToolSpec.render``).
+"""
+
+from pydantic import BaseModel
+
+from . import models, results
+
+
+def current_time_text(input_data: models.GetCurrentTimeInput, result: results.CurrentTime) -> str:
+    if input_data.format == "human":
+        return result.formatted_timestamp
+    if input_data.format == "timestamp":
+        return str(int(result.unix_timestamp))
+    return result.iso_timestamp
+
+
+def difference_text(_input: BaseModel, result: results.Difference) -> str:
+    return result.formatted_duration
+
+
+def context_text(_input: BaseModel, result: results.TimestampContext) -> str:
+    return (
+        f"Day: {result.day_of_week}, Weekend: {result.is_weekend}, "
+        f"Business Hours: {result.is_business_hours}, Time of Day: {result.time_of_day}"
+    )
+
+
+def adjust_text(_input: BaseModel, result: results.AdjustedTimestamp) -> str:
+    return f"Original: {result.original_timestamp_iso}, Adjusted: {result.adjusted_timestamp_iso}"
+
+
+
+def convert_text(_input: BaseModel, result: results.Conversions) -> str:
+    return "; ".join(
+        f"{conversion.timezone}: {conversion.iso_timestamp} ({conversion.abbreviation})"
+        for conversion in result.conversions
+    )
+
+def recurrence_text(_input: BaseModel, result: results.Occurrences) -> str:
+    text = ", ".join(result.occurrences) or "No occurrences"
+    if result.next_cursor is not None:
+        text += f" (more after cursor {result.next_cursor})"
+    return text
+
+
+def timeline_text(_input: BaseModel, result: results.Timeline) -> str:
+    if not result.count:
+        return f"No valid timestamps ({result.invalid_count} invalid)"
+    text = f"{result.count} timestamps from {result.first_timestamp} to {result.last_timestamp}"
+    if result.largest_gaps:
+        gap = result.largest_gaps[0]
+        text += f"; largest gap {gap.formatted_duration} after {gap.start_timestamp}"
+    if result.intervals is not None:
+        text += f"; median interval {result.intervals.median_seconds:g} s"
+    text += f"; {result.outside_business_hours} outside business hours"
+    if result.out_of_order:
+        text += f"; {result.out_of_order} out of order"
+    if result.invalid_count:
+        text += f"; {result.invalid_count} invalid"
+    return text
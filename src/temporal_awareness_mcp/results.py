@@ -0,0 +1,122 @@
+"""Result types returned by the tool handlers.
+
+Handlers return these slotted dataclasses rather than Pydantic models: they
+cost a plain attribute store per field to build and nothing to validate, which
+matters most for batches, where every item used to carry two models. The
+``*Output`` models in ``models`` still document the wire format; each type
+below has the same fields as its model (``tests/test_results.py`` checks),
+and ``to_json`` writes the same JSON as ``model_dump_json(exclude_none=True)``,
+through a ``TypeAdapter`` built once per result type.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+
+@dataclass(slots=True)
+class CurrentTime:
+    iso_timestamp: str
+    formatted_timestamp: str
+    timezone: str
+    day_of_week: str
+    unix_timestamp: float
+
+
+@dataclass(slots=True)
+class Difference:
+    total_seconds: float
+    is_negative: bool
+    formatted_duration: str
+
+
+@dataclass(slots=True)
+class TimestampContext:
+    day_of_week: str
+    is_weekend: bool
+    is_business_hours: bool
+    time_of_day: str
+
+
+@dataclass(slots=True)
+class AdjustedTimestamp:
+    original_timestamp_iso: str
+    adjusted_timestamp_iso: str
+
+
+@dataclass(slots=True)
+class TimezoneConversion:
+    timezone: str
+    iso_timestamp: str
+    formatted_timestamp: str
+    day_of_week: str
+    utc_offset: str
+    abbreviation: str
+
+
+@dataclass(slots=True)
+class Conversions:
+    utc_timestamp: str
+    conversions: list[TimezoneConversion]
+
+
+@dataclass(slots=True)
+class Occurrences:
+    occurrences: list[str]
+    next_cursor: str | None = None
+
+
+@dataclass(slots=True)
+class IntervalStats:
+    min_seconds: float
+    max_seconds: float
+    median_seconds: float
+    mean_seconds: float
+
+
+@dataclass(slots=True)
+class TimelineGap:
+    start_timestamp: str
+    end_timestamp: str
+    seconds: float
+    formatted_duration: str
+
+
+@dataclass(slots=True)
+class Timeline:
+    count: int
+    invalid_count: int
+    errors: list[str]
+    first_timestamp: str | None
+    last_timestamp: str | None
+    out_of_order: int
+    intervals: IntervalStats | None
+    largest_gaps: list[TimelineGap]
+    by_hour: list[int]
+    by_weekday: dict[str, int]
+    by_day: dict[str, int]
+    outside_business_hours: int
+
+
+@dataclass(slots=True)
+class BatchItem:
+    index: int
+    result: Any = None
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class Batch:
+    results: list[BatchItem] = field(default_factory=list)
+
+
+@lru_cache(maxsize=None)
+def _adapter(result_type: type) -> TypeAdapter:
+    return TypeAdapter(result_type)
+
+
+def to_json(result: Any) -> str:
+    """Serialize a result with pydantic-core, as ``model_dump_json(exclude_none=True)`` would."""
+    return _adapter(type(result)).dump_json(result, exclude_none=True).decode()
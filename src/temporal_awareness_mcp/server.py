@@ -1,151 +1,137 @@
 """Temporal Awareness MCP Server implementation."""
 
-from typing import Any
+import functools
+import json
+import os
+import time
+from typing import Any, Sequence
 from mcp.server import Server
-from mcp.types import Tool, ServerCapabilities, ToolsCapability
+from mcp.shared.exceptions import McpError
+from mcp.types import (
+    INVALID_PARAMS,
+    CallToolRequest,
+    CallToolResult,
+    ErrorData,
+    ServerCapabilities,
+    ServerResult,
+    TextContent,
+    Tool,
+    ToolsCapability,
+)
+from pydantic import ValidationError
 
-from .tools import core, contextual
-from . import models
+from . import admission, executor, metrics, models, registry
+
+
+def _tool_result(text: str, is_error: bool = False) -> ServerResult:
+    return ServerResult(CallToolResult(content=[TextContent(type="text", text=text)], isError=is_error))
+
+
+def _invalid_params(name: str, error: ValueError) -> McpError:
+    """An ``INVALID_PARAMS`` error listing each problem with a call's arguments."""
+    if isinstance(error, ValidationError):
+        problems = [
+            {"field": ".".join(str(part) for part in item["loc"]), "message": item["msg"], "type": item["type"]}
+            for item in error.errors(include_url=False)
+        ]
+        first = problems[0]
+        # Errors raised by a model validator belong to no single field.
+        where = f"{first['field']}: " if first["field"] else ""
+        message = f"Invalid arguments for {name}: {where}{first['message']}"
+        if len(problems) > 1:
+            message += f" (and {len(problems) - 1} more)"
+    else:
+        problems = [{"message": str(error)}]
+        message = str(error)
+    return McpError(ErrorData(code=INVALID_PARAMS, message=message, data={"tool": name, "errors": problems}))
+
+
+class _ASGIEndpoint:
+    """Wraps an ASGI callable so Starlette routes it by exact path.
+
+    Starlette treats plain functions and bound methods given to ``Route`` as
+    request/response handlers; ``Mount`` would answer ``/mcp`` with a redirect.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        await self.app(scope, receive, send)
 
 
 class TemporalAwarenessServer:
     """Temporal awareness MCP server."""
 
-    def __init__(self):
+    def __init__(self, response_format: models.ResponseFormat = "text"):
+        if response_format not in models.RESPONSE_FORMATS:
+            raise ValueError(f"response_format must be one of {', '.join(models.RESPONSE_FORMATS)}.")
+        self.response_format = response_format
+        self.started_at = time.monotonic()
+        self.active_sessions = 0
         self.server = Server("temporal-awareness-mcp")
         self._setup_handlers()
 
     def _setup_handlers(self):
-        
+
         @self.server.list_tools()
-        async def handle_list_tools() -> list[Tool]:
-            return [
-                Tool(
-                    name="get_current_time",
-                    description="Returns the current date and time in a specified timezone",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "timezone": {
-                                "type": "string",
-                                "description": "Timezone name (e.g., 'UTC', 'US/Pacific', 'Europe/London')",
-                                "default": "UTC"
-                            },
-                            "format": {
-                                "type": "string", 
-                                "description": "Output format ('iso', 'human', 'timestamp')",
-                                "default": "iso"
-                            }
-                        }
-                    }
-                ),
-                Tool(
-                    name="calculate_difference",
-                    description="Calculates the duration between two timestamps",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "start_timestamp": {
-                                "type": "string",
-                                "description": "Start timestamp (ISO format or human readable)"
-                            },
-                            "end_timestamp": {
-                                "type": "string", 
-                                "description": "End timestamp (ISO format or human readable)"
-                            },
-                            "timezone": {
-                                "type": "string",
-                                "description": "Timezone for parsing ambiguous timestamps",
-                                "default": "UTC"
-                            }
-                        },
-                        "required": ["start_timestamp", "end_timestamp"]
-                    }
-                ),
-                Tool(
-                    name="get_timestamp_context",
-                    description="Provides human-readable context about a specific timestamp",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "timestamp": {
-                                "type": "string",
-                                "description": "Timestamp to analyze (ISO format or human readable)"
-                            },
-                            "timezone": {
-                                "type": "string",
-                                "description": "Timezone for context (e.g., 'UTC', 'US/Pacific')",
-                                "default": "UTC"
-                            }
-                        },
-                        "required": ["timestamp"]
-                    }
-                ),
-                Tool(
-                    name="adjust_timestamp",
-                    description="Adds or subtracts a duration from a given timestamp",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "start_timestamp": {
-                                "type": "string",
-                                "description": "Base timestamp (ISO format or human readable)"
-                            },
-                            "delta_value": {
-                                "type": "number",
-                                "description": "The value of the duration to add or subtract"
-                            },
-                            "delta_unit": {
-                                "type": "string",
-                                "enum": ["weeks", "days", "hours", "minutes", "seconds"],
-                                "description": "The unit of the duration"
-                            },
-                            "timezone": {
-                                "type": "string",
-                                "description": "Timezone for calculation",
-                                "default": "UTC"
-                            }
-                        },
-                        "required": ["start_timestamp", "delta_value", "delta_unit"]
-                    }
-                )
-            ]
-
-        @self.server.call_tool()
-        async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[Any]:
-            if arguments is None:
-                arguments = {}
+        async def handle_list_tools() -> tuple[Tool, ...]:
+            return registry.list_tools()
 
-            try:
-                if name == "get_current_time":
-                    input_data = models.GetCurrentTimeInput(**arguments)
-                    result = core.get_current_time(input_data)
-                    if hasattr(arguments, 'format') and arguments.get('format') == 'human':
-                        return [{"type": "text", "text": result.formatted_timestamp}]
-                    else:
-                        return [{"type": "text", "text": result.iso_timestamp}]
-                
-                elif name == "calculate_difference":
-                    input_data = models.CalculateDifferenceInput(**arguments)
-                    result = core.calculate_difference(input_data)
-                    return [{"type": "text", "text": result.formatted_duration}]
-                
-                elif name == "get_timestamp_context":
-                    input_data = models.GetTimestampContextInput(**arguments)
-                    result = contextual.get_timestamp_context(input_data)
-                    context_info = f"Day: {result.day_of_week}, Weekend: {result.is_weekend}, Business Hours: {result.is_business_hours}, Time of Day: {result.time_of_day}"
-                    return [{"type": "text", "text": context_info}]
-                
-                elif name == "adjust_timestamp":
-                    input_data = models.AdjustTimestampInput(**arguments)
-                    result = core.adjust_timestamp(input_data)
-                    return [{"type": "text", "text": f"Original: {result.original_timestamp_iso}, Adjusted: {result.adjusted_timestamp_iso}"}]
-                
-                else:
-                    raise ValueError(f"Unknown tool: {name}")
-                    
-            except Exception as e:
-                return [{"type": "text", "text": f"Error: {str(e)}"}]
+        # Registered directly rather than with ``Server.call_tool()``: its
+        # handler checks the arguments against the JSON schema on every call,
+        # which costs milliseconds on top of the Pydantic validation, and turns
+        # every exception into a tool result.
+        async def handle_call_tool(request: CallToolRequest) -> ServerResult:
+            name = request.params.name
+            arguments = dict(request.params.arguments or {})
+            response_format = arguments.pop("response_format", self.response_format)
+
+            with admission.admit_call():
+                started = time.perf_counter()
+                try:
+                    if response_format not in models.RESPONSE_FORMATS:
+                        raise ValueError(
+                            f"response_format must be one of {', '.join(models.RESPONSE_FORMATS)}."
+                        )
+                    spec = registry.get_tool(name)
+                    input_data = spec.parse(arguments)
+                except ValueError as e:
+                    if metrics.metrics_enabled():
+                        metrics.record_error(name if name in registry.TOOLS else metrics.UNKNOWN_TOOL, e)
+                    raise _invalid_params(name, e) from None
+
+                try:
+                    if not metrics.metrics_enabled():
+                        async with admission.deadline():
+                            result = await executor.get_executor().run(spec.handler, input_data)
+                        return _tool_result(spec.render(input_data, result, response_format))
+
+                    validated = time.perf_counter()
+                    async with admission.deadline():
+                        result, parse_seconds, handler_seconds = await executor.get_executor().run(
+                            functools.partial(metrics.measure_handler, spec.handler), input_data
+                        )
+                    computed = time.perf_counter()
+                    text = spec.render(input_data, result, response_format)
+                    finished = time.perf_counter()
+                    metrics.record_call(name, {
+                        "validation": validated - started,
+                        "parse": parse_seconds,
+                        "compute": handler_seconds - parse_seconds,
+                        "render": finished - computed,
+                        "total": finished - started,
+                    })
+                    return _tool_result(text)
+
+                except Exception as e:
+                    if metrics.metrics_enabled():
+                        metrics.record_error(name, e)
+                    if response_format == "json":
+                        return _tool_result(json.dumps({"error": str(e)}), is_error=True)
+                    return _tool_result(f"Error: {str(e)}", is_error=True)
+
+        self.server.request_handlers[CallToolRequest] = handle_call_tool
 
     async def run_stdio(self):
         from mcp.server.stdio import stdio_server
@@ -161,17 +147,39 @@ class TemporalAwarenessServer:
                 ),
             )
 
-    async def run_sse(self, host: str = "localhost", port: int = 8000):
+    def build_http_app(
+        self,
+        messages_path: str = "/messages/",
+        routes: Sequence[Any] = (),
+        json_response: bool = True,
+        cors_origins: Sequence[str] = ("*",),
+    ):
+        """Build the Starlette app serving both HTTP transports, ``/health`` and ``/metrics``.
+
+        ``/sse`` and ``messages_path`` carry the legacy SSE transport. ``/mcp``
+        is a stateless streamable-HTTP endpoint: every POST is self-contained
+        and answered with JSON, or with an SSE stream if ``json_response`` is
+        false, so calls need no session affinity. ``routes`` are appended
+        after the built-in ones. Requests pass ``admission.AdmissionMiddleware``;
+        credentialed cross-origin requests are allowed only from explicitly
+        listed ``cors_origins``.
+        """
+        from contextlib import asynccontextmanager
         from mcp.server.sse import SseServerTransport
+        from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
         from mcp.server.models import InitializationOptions
         from starlette.applications import Starlette
-        from starlette.responses import Response
+        from starlette.middleware.cors import CORSMiddleware
+        from starlette.responses import JSONResponse, PlainTextResponse, Response
         from starlette.routing import Mount, Route
-        import uvicorn
-        
-        sse = SseServerTransport("/messages/")
+
+        sse = SseServerTransport(messages_path)
+        streamable_http = StreamableHTTPSessionManager(
+            self.server, json_response=json_response, stateless=True
+        )
         
         async def handle_sse(request):
+            self.active_sessions += 1
             try:
                 async with sse.connect_sse(
                     request.scope, request.receive, request._send
@@ -190,29 +198,78 @@ class TemporalAwarenessServer:
                 import sys
                 print(f"Error in handle_sse: {e}", file=sys.stderr)
                 raise
+            finally:
+                self.active_sessions -= 1
             return Response()
-        
-        from starlette.middleware.cors import CORSMiddleware
+
+        async def handle_health(request):
+            return JSONResponse(self.health())
+
+        async def handle_metrics(request):
+            return PlainTextResponse(
+                metrics.render_metrics(self.active_sessions),
+                media_type="text/plain; version=0.0.4",
+            )
+
+        @asynccontextmanager
+        async def lifespan(app):
+            async with streamable_http.run():
+                yield
         
         app = Starlette(
             routes=[
                 Route("/sse", endpoint=handle_sse, methods=["GET"]),
-                Mount("/messages/", app=sse.handle_post_message),
+                Mount(messages_path, app=sse.handle_post_message),
+                Route(
+                    "/mcp",
+                    endpoint=_ASGIEndpoint(streamable_http.handle_request),
+                    methods=["GET", "POST", "DELETE"],
+                ),
+                Route("/health", endpoint=handle_health, methods=["GET"]),
+                Route("/metrics", endpoint=handle_metrics, methods=["GET"]),
+                *routes,
             ],
+            lifespan=lifespan,
         )
         
+        # Added first, so CORS wraps it and preflights are never rate limited.
+        app.add_middleware(
+            admission.AdmissionMiddleware,
+            active_sessions=lambda: self.active_sessions,
+        )
         app.add_middleware(
             CORSMiddleware,
-            allow_origins=["*"],
-            allow_credentials=True,
+            allow_origins=list(cors_origins),
+            allow_credentials="*" not in cors_origins,
             allow_methods=["*"],
             allow_headers=["*"],
         )
-        
+        return app
+
+    def health(self) -> dict[str, Any]:
+        return {
+            "status": "ok",
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.monotonic() - self.started_at, 3),
+            "active_sessions": self.active_sessions,
+            "executor": executor.get_executor_stats(),
+            "admission": admission.get_admission_stats(),
+        }
+
+    async def run_sse(
+        self,
+        host: str = "localhost",
+        port: int = 8000,
+        json_response: bool = True,
+        cors_origins: Sequence[str] = ("*",),
+    ):
+        import uvicorn
+
+        app = self.build_http_app(json_response=json_response, cors_origins=cors_origins)
         config = uvicorn.Config(app, host=host, port=port)
         server = uvicorn.Server(config)
         await server.serve()
 
 
-def create_server() -> TemporalAwarenessServer:
-    return TemporalAwarenessServer()
\ No newline at end of file
+def create_server(response_format: models.ResponseFormat = "text") -> TemporalAwarenessServer:
+    return TemporalAwarenessServer(response_format)
\ No newline at end of file
@@ -2,29 +2,71 @@
 """Stdio entry point for Temporal Awareness MCP server."""
 
 import asyncio
+import argparse
+import signal
+import sys
 import mcp.server.stdio
 from mcp.server.models import InitializationOptions
 from mcp.types import ServerCapabilities, ToolsCapability
 
+from . import metrics
 from .server import create_server
+from .cli import add_common_arguments, apply_common_arguments
 
 
-async def main():
-    temporal_server = create_server()
-    
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await temporal_server.server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="temporal-awareness-mcp",
-                server_version="0.1.0",
-                capabilities=ServerCapabilities(
-                    tools=ToolsCapability()
+def dump_metrics(path: str | None) -> None:
+    """Write the metrics to ``path``, or to stderr; stdout carries the protocol."""
+    text = metrics.render_metrics()
+    if path is None:
+        sys.stderr.write(text)
+        sys.stderr.flush()
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+async def serve_stdio(temporal_server, metrics_file: str | None = None) -> None:
+    """Run one MCP session over this process's stdin and stdout."""
+    if hasattr(signal, "SIGUSR1"):
+        asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, dump_metrics, metrics_file)
+
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await temporal_server.server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="temporal-awareness-mcp",
+                    server_version="0.1.0",
+                    capabilities=ServerCapabilities(
+                        tools=ToolsCapability()
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        if metrics_file is not None:
+            dump_metrics(metrics_file)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Temporal Awareness MCP Server (stdio)")
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        help="Write metrics here on SIGUSR1 and on exit (default: stderr on SIGUSR1 only)",
+    )
+    add_common_arguments(parser)
+
+    args = parser.parse_args()
+    apply_common_arguments(args)
+
+    await serve_stdio(create_server(args.response_format), args.metrics_file)
+
+
+def run():
+    """Console-script entry point."""
+    asyncio.run(main())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
@@ -0,0 +1,145 @@
+"""Timezone resolution backed by a cached index of IANA keys.
+
+``resolve_timezone`` replaces direct ``ZoneInfo(name)`` calls. Resolved zones
+are cached by canonical key, and names that are not already cached are
+checked against an in-memory index of ``zoneinfo.available_timezones()``, so
+unknown names are rejected with a dictionary lookup instead of a filesystem
+or ``tzdata`` probe. The index also maps case-insensitive variants
+("us/pacific"), spaces in place of underscores ("America/New York") and common
+abbreviations that are not IANA keys themselves ("PST", "JST") to their
+canonical key.
+"""
+
+import threading
+import zoneinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+# Abbreviations agents commonly send that tzdata does not define. Names tzdata
+# does define ("EST", "MST", "HST", "CET", ...) always resolve to their own
+# zone first.
+ALIASES = {
+    "PST": "America/Los_Angeles",
+    "PDT": "America/Los_Angeles",
+    "PT": "America/Los_Angeles",
+    "MDT": "America/Denver",
+    "MT": "America/Denver",
+    "CST": "America/Chicago",
+    "CDT": "America/Chicago",
+    "CT": "America/Chicago",
+    "EDT": "America/New_York",
+    "ET": "America/New_York",
+    "AKST": "America/Anchorage",
+    "AKDT": "America/Anchorage",
+    "BST": "Europe/London",
+    "IST": "Asia/Kolkata",
+    "CEST": "Europe/Paris",
+    "EEST": "Europe/Athens",
+    "WEST": "Europe/Lisbon",
+    "MSK": "Europe/Moscow",
+    "JST": "Asia/Tokyo",
+    "KST": "Asia/Seoul",
+    "SGT": "Asia/Singapore",
+    "HKT": "Asia/Hong_Kong",
+    "AEST": "Australia/Sydney",
+    "AEDT": "Australia/Sydney",
+    "NZST": "Pacific/Auckland",
+    "NZDT": "Pacific/Auckland",
+}
+
+
+def _normalize(name: str) -> str:
+    return name.strip().replace(" ", "_").lower()
+
+
+class TimezoneRegistry:
+    def __init__(self, aliases: dict[str, str] | None = None):
+        self._aliases = ALIASES if aliases is None else aliases
+        self._zones: dict[str, ZoneInfo] = {}
+        self._index: dict[str, str] | None = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._rejections = 0
+
+    def warm(self) -> None:
+        """Build the name index up front instead of on the first unknown name."""
+        self._ensure_index()
+
+    def canonical_name(self, name: str) -> str:
+        """Return the IANA key ``name`` refers to, or raise ``ZoneInfoNotFoundError``."""
+        if name in self._zones:
+            return name
+        key = self._ensure_index().get(_normalize(name))
+        if key is None:
+            self._rejections += 1
+            raise ZoneInfoNotFoundError(f"No time zone found with key {name}")
+        return key
+
+    def resolve(self, name: str) -> ZoneInfo:
+        zone = self._zones.get(name)
+        if zone is not None:
+            self._hits += 1
+            return zone
+
+        self._misses += 1
+        if self._index is None:
+            # Until something misses, valid keys are loaded directly so that
+            # the common case never pays for building the index.
+            try:
+                zone = ZoneInfo(name)
+            except (ZoneInfoNotFoundError, ValueError):
+                pass
+            else:
+                self._zones[name] = zone
+                return zone
+
+        key = self.canonical_name(name)
+        zone = self._zones.get(key)
+        if zone is None:
+            zone = self._zones[key] = ZoneInfo(key)
+        return zone
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "rejections": self._rejections,
+            "cached_zones": len(self._zones),
+            "indexed_names": len(self._index or ()),
+        }
+
+    def _ensure_index(self) -> dict[str, str]:
+        index = self._index
+        if index is not None:
+            return index
+        with self._lock:
+            if self._index is None:
+                index = {}
+                for alias, key in self._aliases.items():
+                    index[_normalize(alias)] = key
+                # IANA keys win over aliases that differ only by case.
+                for key in zoneinfo.available_timezones():
+                    index[_normalize(key)] = key
+                self._index = index
+            return self._index
+
+
+_registry = TimezoneRegistry()
+
+
+def resolve_timezone(name: str) -> ZoneInfo:
+    """Return the cached ``ZoneInfo`` for ``name``, raising ``ZoneInfoNotFoundError``."""
+    return _registry.resolve(name)
+
+
+def canonical_timezone_name(name: str) -> str:
+    return _registry.canonical_name(name)
+
+
+def warm_timezone_registry() -> None:
+    _registry.warm()
+
+
+def get_timezone_stats() -> dict[str, int]:
+    return _registry.stats()
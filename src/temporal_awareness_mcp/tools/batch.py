@@ -0,0 +1,253 @@
+"""Batch variants of the temporal tools.
+
+A batch is validated in a single pass over the whole item list. Items that
+fail validation or raise while being processed are reported individually, so
+one bad timestamp never fails the rest of the batch.
+
+Large batches are computed with the NumPy engine in ``vectorized`` when it is
+installed; timestamps are still parsed one by one with the same semantics.
+The engine (and NumPy) is imported when the first large batch arrives.
+"""
+
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Callable
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from .. import durations, models, utils
+from ..results import AdjustedTimestamp, Batch, BatchItem, Difference, TimestampContext
+from . import contextual, core
+
+
+# Below this many items the per-item Python path is as fast as converting to arrays.
+VECTORIZE_MIN_ITEMS = 256
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(item_model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[item_model])
+
+
+def _describe_error(loc: tuple, message: str) -> str:
+    field = ".".join(str(part) for part in loc)
+    return f"{field}: {message}" if field else message
+
+
+def validate_items(item_model: type[BaseModel], raw_items: Any) -> list[BaseModel | str]:
+    """Validate raw batch items, returning a model or an error message per item."""
+    if not isinstance(raw_items, list) or not raw_items:
+        raise ValueError("'items' must be a non-empty list.")
+    if len(raw_items) > models.MAX_BATCH_SIZE:
+        raise ValueError(f"'items' may contain at most {models.MAX_BATCH_SIZE} entries.")
+
+    try:
+        return _list_adapter(item_model).validate_python(raw_items)
+    except ValidationError as e:
+        failures: dict[int, list[str]] = {}
+        for error in e.errors():
+            index, *loc = error["loc"]
+            failures.setdefault(index, []).append(_describe_error(tuple(loc), error["msg"]))
+
+    # Only reached when some item is invalid: revalidate the others one by one.
+    return [
+        "; ".join(failures[index]) if index in failures else item_model.model_validate(raw)
+        for index, raw in enumerate(raw_items)
+    ]
+
+
+def _run_one(func: Callable[[Any], Any], index: int, item: BaseModel | str) -> BatchItem:
+    if isinstance(item, str):
+        return BatchItem(index, error=item)
+    try:
+        return BatchItem(index, func(item))
+    except (ValueError, OverflowError) as e:
+        return BatchItem(index, error=str(e))
+
+
+def _run(func: Callable[[Any], Any], items: list[BaseModel | str]) -> list[BatchItem]:
+    return [_run_one(func, index, item) for index, item in enumerate(items)]
+
+
+def _use_vectorized(items: list) -> bool:
+    if len(items) < VECTORIZE_MIN_ITEMS:
+        return False
+    # The engine has no business calendars.
+    if any(getattr(item, "calendar", None) is not None for item in items):
+        return False
+    from .. import vectorized
+
+    return vectorized.is_available()
+
+
+def _parse_items(
+    items: list[BaseModel | str],
+    fields: tuple[str, ...],
+) -> tuple[list[BatchItem | None], list[int], list[BaseModel], list[list]]:
+    """Parse the timestamp ``fields`` of every valid item.
+
+    Returns the result slots (pre-filled for failed items), the indexes and
+    items that parsed, and one list of parsed datetimes per field.
+    """
+    results: list[BatchItem | None] = [None] * len(items)
+    indexes: list[int] = []
+    parsed_items: list[BaseModel] = []
+    columns: list[list] = [[] for _ in fields]
+    for index, item in enumerate(items):
+        if isinstance(item, str):
+            results[index] = BatchItem(index, error=item)
+            continue
+        try:
+            values = [utils.robust_parse_datetime(getattr(item, field), item.timezone) for field in fields]
+        except (ValueError, OverflowError) as e:
+            results[index] = BatchItem(index, error=str(e))
+            continue
+        indexes.append(index)
+        parsed_items.append(item)
+        for column, value in zip(columns, values):
+            column.append(value)
+    return results, indexes, parsed_items, columns
+
+
+def _group_by_zone(datetimes: list, positions: list[int]) -> dict[Any, list[int]]:
+    groups: dict[Any, list[int]] = defaultdict(list)
+    for position in positions:
+        groups[datetimes[position].tzinfo].append(position)
+    return groups
+
+
+def _vectorized_calculate_difference(items):
+    from .. import vectorized
+
+    results, indexes, parsed_items, (starts, ends) = _parse_items(
+        items, ("start_timestamp", "end_timestamp")
+    )
+    if indexes:
+        start_us, start_fold = vectorized.to_wall_us(starts)
+        end_us, end_fold = vectorized.to_wall_us(ends)
+        absolute = [
+            position for position, item in enumerate(parsed_items) if item.arithmetic == "absolute"
+        ]
+        if absolute:
+            # Convert the wall readings of absolute items to instants, in place.
+            start_us, end_us = start_us.copy(), end_us.copy()
+            for zone, positions in _group_by_zone(starts, absolute).items():
+                take = vectorized.np.asarray(positions)
+                start_us[take] -= vectorized.offsets_for_wall(start_us[take], zone, start_fold[take])
+                end_us[take] -= vectorized.offsets_for_wall(end_us[take], zone, end_fold[take])
+        total_seconds = vectorized.difference_seconds(start_us, end_us)
+        for index, item, seconds, delta in zip(
+            indexes, parsed_items, total_seconds.tolist(), (end_us - start_us).tolist()
+        ):
+            try:
+                text = durations.format_duration(delta, **core.format_options(item))
+            except ValueError as e:
+                results[index] = BatchItem(index, error=str(e))
+                continue
+            results[index] = BatchItem(index, Difference(seconds, seconds < 0, text))
+    return results
+
+
+def _vectorized_get_timestamp_context(items):
+    from .. import vectorized
+
+    results, indexes, parsed_items, (timestamps,) = _parse_items(items, ("timestamp",))
+    if indexes:
+        wall_us, _ = vectorized.to_wall_us(timestamps)
+        flags = vectorized.contexts(
+            wall_us,
+            vectorized.np.array([item.business_hours_start for item in parsed_items]),
+            vectorized.np.array([item.business_hours_end for item in parsed_items]),
+        )
+        for index, weekday, weekend, business, time_of_day in zip(
+            indexes,
+            flags["weekday"].tolist(),
+            flags["is_weekend"].tolist(),
+            flags["is_business_hours"].tolist(),
+            flags["time_of_day"].tolist(),
+        ):
+            results[index] = BatchItem(index, TimestampContext(
+                vectorized.WEEKDAY_NAMES[weekday],
+                weekend,
+                business,
+                vectorized.TIME_OF_DAY_LABELS[time_of_day],
+            ))
+    return results
+
+
+def _vectorized_adjust_timestamp(items):
+    from .. import vectorized
+
+    results, indexes, parsed_items, (starts,) = _parse_items(items, ("start_timestamp",))
+    if not indexes:
+        return results
+
+    start_us, fold = vectorized.to_wall_us(starts)
+    deltas, valid = vectorized.delta_us(
+        [item.delta_value for item in parsed_items],
+        [item.delta_unit for item in parsed_items],
+    )
+    absolute = vectorized.np.array([item.arithmetic == "absolute" for item in parsed_items])
+    adjusted_us = start_us + deltas
+    # Keep a day clear of the datetime limits: absolute results may land a few
+    # hours either side of the wall-clock estimate.
+    valid &= (adjusted_us >= vectorized.MIN_WALL_US + vectorized.US_PER_DAY) & (
+        adjusted_us <= vectorized.MAX_WALL_US - vectorized.US_PER_DAY
+    )
+    if not valid.all():
+        # Items near the limits take the reference path, which reports any error.
+        for position in vectorized.np.flatnonzero(~valid).tolist():
+            index = indexes[position]
+            results[index] = _run_one(core.adjust_timestamp, index, parsed_items[position])
+        keep = vectorized.np.flatnonzero(valid)
+        indexes = [indexes[position] for position in keep.tolist()]
+        starts = [starts[position] for position in keep.tolist()]
+        start_us, fold, deltas, absolute = start_us[keep], fold[keep], deltas[keep], absolute[keep]
+
+    original_iso: list[str | None] = [None] * len(indexes)
+    adjusted_iso: list[str | None] = [None] * len(indexes)
+    for zone, positions in _group_by_zone(starts, range(len(starts))).items():
+        take = vectorized.np.asarray(positions)
+        zone_start, zone_delta = start_us[take], deltas[take]
+        start_offsets = vectorized.offsets_for_wall(zone_start, zone, fold[take])
+        adjusted = zone_start + zone_delta
+        adjusted_offsets = vectorized.offsets_for_wall(adjusted, zone)
+
+        zone_absolute = absolute[take]
+        if zone_absolute.any():
+            instants = zone_start - start_offsets + zone_delta
+            instant_offsets = vectorized.offsets_for_instants(instants, zone)
+            adjusted = vectorized.np.where(zone_absolute, instants + instant_offsets, adjusted)
+            adjusted_offsets = vectorized.np.where(zone_absolute, instant_offsets, adjusted_offsets)
+
+        originals = vectorized.format_iso(zone_start, start_offsets)
+        new = vectorized.format_iso(adjusted, adjusted_offsets)
+        for position, original, adjusted_text in zip(positions, originals, new):
+            original_iso[position] = original
+            adjusted_iso[position] = adjusted_text
+
+    for position, index in enumerate(indexes):
+        results[index] = BatchItem(index, AdjustedTimestamp(original_iso[position], adjusted_iso[position]))
+    return results
+
+
+def batch_get_current_time(items: list[models.GetCurrentTimeInput | str]) -> Batch:
+    return Batch(_run(core.get_current_time, items))
+
+
+def batch_calculate_difference(items: list[models.CalculateDifferenceInput | str]) -> Batch:
+    if _use_vectorized(items):
+        return Batch(_vectorized_calculate_difference(items))
+    return Batch(_run(core.calculate_difference, items))
+
+
+def batch_get_timestamp_context(items: list[models.GetTimestampContextInput | str]) -> Batch:
+    if _use_vectorized(items):
+        return Batch(_vectorized_get_timestamp_context(items))
+    return Batch(_run(contextual.get_timestamp_context, items))
+
+
+def batch_adjust_timestamp(items: list[models.AdjustTimestampInput | str]) -> Batch:
+    if _use_vectorized(items):
+        return Batch(_vectorized_adjust_timestamp(items))
+    return Batch(_run(core.adjust_timestamp, items))
@@ -0,0 +1,72 @@
+"""Business-time tools backed by the calendars in ``calendars``."""
+
+from datetime import datetime
+
+from .. import calendars, durations, models, results, utils
+from ..timezones import resolve_timezone
+
+
+def _in_calendar_zone(calendar: calendars.BusinessCalendar, dt: datetime) -> datetime:
+    """``dt`` as a wall-clock time in the calendar's zone (calendars without one use ``dt``'s)."""
+    if calendar.timezone is None:
+        return dt
+    return dt.astimezone(resolve_timezone(calendar.timezone))
+
+
+def working_difference(
+    start_timestamp: str, end_timestamp: str, tz_str: str, calendar_name: str, **format_options
+) -> results.Difference:
+    """Working time between two timestamps.
+
+    ``format_options`` go to ``durations.format_duration``; by default hours
+    are the largest unit, since days are ambiguous in working time.
+    """
+    calendar = calendars.get_calendar(calendar_name)
+    start_dt = _in_calendar_zone(calendar, utils.robust_parse_datetime(start_timestamp, tz_str))
+    end_dt = _in_calendar_zone(calendar, utils.robust_parse_datetime(end_timestamp, tz_str))
+
+    total_seconds = calendar.working_seconds(start_dt, end_dt)
+    return results.Difference(
+        total_seconds=total_seconds,
+        is_negative=total_seconds < 0,
+        formatted_duration=durations.format_duration(
+            round(total_seconds * 1_000_000), **{"largest_unit": "hours", **format_options}
+        ),
+    )
+
+
+def shift_working_time(
+    start_timestamp: str, amount: float, unit: str, tz_str: str, calendar_name: str
+) -> results.AdjustedTimestamp:
+    """Move by working ``weeks``, ``days``, ``hours``, ``minutes`` or ``seconds``."""
+    calendar = calendars.get_calendar(calendar_name)
+    start_dt = utils.robust_parse_datetime(start_timestamp, tz_str)
+    local = _in_calendar_zone(calendar, start_dt)
+
+    if unit in ("weeks", "days"):
+        days = amount * calendar.week_days if unit == "weeks" else amount
+        if days != int(days):
+            raise ValueError("Business days must be a whole number.")
+        adjusted = calendar.add_working_days(local, int(days))
+    else:
+        seconds = amount * {"hours": 3600, "minutes": 60, "seconds": 1}[unit]
+        adjusted = calendar.add_working_seconds(local, seconds)
+
+    # Wall-clock results may fall in a DST gap; normalize through UTC.
+    adjusted = adjusted.astimezone(start_dt.tzinfo)
+    return results.AdjustedTimestamp(
+        original_timestamp_iso=start_dt.isoformat(),
+        adjusted_timestamp_iso=adjusted.isoformat(),
+    )
+
+
+def business_duration(input_data: models.BusinessDurationInput) -> results.Difference:
+    return working_difference(
+        input_data.start_timestamp, input_data.end_timestamp, input_data.timezone, input_data.calendar
+    )
+
+
+def add_business_time(input_data: models.AddBusinessTimeInput) -> results.AdjustedTimestamp:
+    return shift_working_time(
+        input_data.start_timestamp, input_data.amount, input_data.unit, input_data.timezone, input_data.calendar
+    )
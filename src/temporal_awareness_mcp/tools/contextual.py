@@ -2,10 +2,10 @@
 
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from .. import models, utils
+from .. import models, results, utils
 
 
-def get_timestamp_context(input_data: models.GetTimestampContextInput) -> models.GetTimestampContextOutput:
+def get_timestamp_context(input_data: models.GetTimestampContextInput) -> results.TimestampContext:
     try:
         dt = utils.robust_parse_datetime(input_data.timestamp, input_data.timezone)
 
@@ -26,7 +26,7 @@ def get_timestamp_context(input_data: models.GetTimestampContextInput) -> models
         else:
             time_of_day = "night"
 
-        return models.GetTimestampContextOutput(
+        return results.TimestampContext(
             day_of_week=day_of_week,
             is_weekend=is_weekend,
             is_business_hours=is_business_hours,
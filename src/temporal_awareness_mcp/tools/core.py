@@ -1,46 +1,40 @@
 """Core time calculation tools."""
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfoNotFoundError
 
-from .. import models, utils
+from .. import clock, durations, models, results, transitions, utils
+from ..timezones import resolve_timezone
+from . import business
 
 
-def get_current_time(input_data: models.GetCurrentTimeInput) -> models.GetCurrentTimeOutput:
+def get_current_time(input_data: models.GetCurrentTimeInput) -> results.CurrentTime:
     try:
-        target_timezone = ZoneInfo(input_data.timezone)
-        now = datetime.now(target_timezone)
-        formatted_string = now.strftime("%A, %B %d, %Y at %I:%M %p")
-
-        return models.GetCurrentTimeOutput(
-            iso_timestamp=now.isoformat(),
-            formatted_timestamp=formatted_string,
-            timezone=str(target_timezone),
-            day_of_week=now.strftime("%A"),
-        )
+        if input_data.precise:
+            return clock.read_now(input_data.timezone)
+        return clock.read_clock(input_data.timezone)
     except ZoneInfoNotFoundError as e:
         raise ValueError(f"The specified timezone '{input_data.timezone}' is not valid.") from e
 
 
-def _format_timedelta(duration: timedelta) -> str:
-    seconds = abs(duration.total_seconds())
-    days, remainder = divmod(seconds, 86400)
-    hours, remainder = divmod(remainder, 3600)
-    minutes, seconds = divmod(remainder, 60)
+_MICROSECOND = timedelta(microseconds=1)
 
-    parts = []
-    if days > 0:
-        parts.append(f"{int(days)} day{'s' if days != 1 else ''}")
-    if hours > 0:
-        parts.append(f"{int(hours)} hour{'s' if hours != 1 else ''}")
-    if minutes > 0:
-        parts.append(f"{int(minutes)} minute{'s' if minutes != 1 else ''}")
-    if seconds > 0 or not parts:
-        parts.append(f"{int(seconds)} second{'s' if seconds != 1 else ''}")
 
-    return ", ".join(parts)
+def format_options(input_data: models.CalculateDifferenceInput, largest_unit: str = "days") -> dict:
+    """``durations.format_duration`` arguments for a calculate_difference request."""
+    return {
+        "style": input_data.duration_style,
+        "largest_unit": input_data.largest_unit or largest_unit,
+        "smallest_unit": input_data.smallest_unit,
+        "max_parts": input_data.max_parts,
+    }
 
 
-def calculate_difference(input_data: models.CalculateDifferenceInput) -> models.CalculateDifferenceOutput:
+def calculate_difference(input_data: models.CalculateDifferenceInput) -> results.Difference:
+    if input_data.calendar is not None:
+        return business.working_difference(
+            input_data.start_timestamp, input_data.end_timestamp, input_data.timezone, input_data.calendar,
+            **format_options(input_data, "hours"),
+        )
     try:
         start_dt = utils.robust_parse_datetime(
             input_data.start_timestamp, input_data.timezone
@@ -49,18 +43,30 @@ def calculate_difference(input_data: models.CalculateDifferenceInput) -> models.
             input_data.end_timestamp, input_data.timezone
         )
 
-        difference = end_dt - start_dt
+        if input_data.arithmetic == "absolute":
+            difference = timedelta(
+                microseconds=transitions.utc_us(end_dt) - transitions.utc_us(start_dt)
+            )
+        else:
+            difference = end_dt - start_dt
         total_seconds = difference.total_seconds()
 
-        return models.CalculateDifferenceOutput(
+        return results.Difference(
             total_seconds=total_seconds,
             is_negative=total_seconds < 0,
-            formatted_duration=_format_timedelta(difference),
+            formatted_duration=durations.format_duration(
+                difference // _MICROSECOND, **format_options(input_data)
+            ),
         )
     except (ValueError, ZoneInfoNotFoundError) as e:
         raise e
 
-def adjust_timestamp(input_data: models.AdjustTimestampInput) -> models.AdjustTimestampOutput:
+def adjust_timestamp(input_data: models.AdjustTimestampInput) -> results.AdjustedTimestamp:
+    if input_data.calendar is not None:
+        return business.shift_working_time(
+            input_data.start_timestamp, input_data.delta_value, input_data.delta_unit,
+            input_data.timezone, input_data.calendar,
+        )
     try:
         start_dt = utils.robust_parse_datetime(
             input_data.start_timestamp, input_data.timezone
@@ -69,11 +75,55 @@ def adjust_timestamp(input_data: models.AdjustTimestampInput) -> models.AdjustTi
         duration_args = {input_data.delta_unit: input_data.delta_value}
         duration = timedelta(**duration_args)
 
-        adjusted_dt = start_dt + duration
+        if input_data.arithmetic == "absolute":
+            adjusted_dt = transitions.from_utc_us(
+                transitions.utc_us(start_dt) + duration // timedelta(microseconds=1),
+                start_dt.tzinfo,
+            )
+        else:
+            adjusted_dt = start_dt + duration
 
-        return models.AdjustTimestampOutput(
+        return results.AdjustedTimestamp(
             original_timestamp_iso=start_dt.isoformat(),
             adjusted_timestamp_iso=adjusted_dt.isoformat(),
         )
     except (ValueError, ZoneInfoNotFoundError) as e:
-        raise e
\ No newline at end of file
+        raise e
+
+def _format_offset(offset: timedelta) -> str:
+    minutes = int(offset.total_seconds()) // 60
+    sign = "-" if minutes < 0 else "+"
+    return f"{sign}{abs(minutes) // 60:02d}:{abs(minutes) % 60:02d}"
+
+
+def convert_timezone(input_data: models.ConvertTimezoneInput) -> results.Conversions:
+    # Each distinct zone is resolved once; zoneinfo's compiled transition
+    # tables then give every conversion's offset by bisection.
+    zones = {}
+    for name in input_data.target_timezones:
+        if name not in zones:
+            try:
+                zones[name] = resolve_timezone(name)
+            except ZoneInfoNotFoundError as e:
+                raise ValueError(f"The specified timezone '{name}' is not valid.") from e
+
+    if input_data.timestamp is None:
+        instant = datetime.now(timezone.utc)
+    else:
+        instant = utils.robust_parse_datetime(
+            input_data.timestamp, input_data.timezone, honor_offset=input_data.honor_offset
+        ).astimezone(timezone.utc)
+
+    conversions = []
+    for name in input_data.target_timezones:
+        zone = zones[name]
+        local = instant.astimezone(zone)
+        conversions.append(results.TimezoneConversion(
+            timezone=str(zone),
+            iso_timestamp=local.isoformat(),
+            formatted_timestamp=local.strftime("%A, %B %d, %Y at %I:%M %p"),
+            day_of_week=local.strftime("%A"),
+            utc_offset=_format_offset(local.utcoffset()),
+            abbreviation=local.tzname(),
+        ))
+    return results.Conversions(utc_timestamp=instant.isoformat(), conversions=conversions)
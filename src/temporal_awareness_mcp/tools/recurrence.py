@@ -0,0 +1,159 @@
+"""Recurrence-rule expansion (RFC 5545 RRULE) backed by ``dateutil.rrule``.
+
+Rules are compiled once per rule, start and timezone and kept in an LRU
+cache. Occurrences are generated lazily: a response walks the rule only until
+it has ``limit`` occurrences inside the window (or has left it), so infinite
+rules and long windows are never materialized. Longer results are paged with
+``next_cursor``, the last occurrence returned.
+
+Rules repeat in local wall-clock time. An occurrence that falls in a DST gap
+moves forward by the gap (02:30 on a spring-forward day becomes 03:30), and
+one in a repeated hour gets the first of the two offsets, as RFC 5545
+specifies.
+
+``dateutil`` searches up to the year 9999 for the next occurrence and cannot
+be interrupted, so rules whose day filters match no day at all (the 30th of
+February) are rejected when they are compiled, and a request stops with an
+error once it has spent ``MAX_EXPANSION_SECONDS`` in total, checked after
+each occurrence.
+"""
+
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator
+
+from .. import models, results, utils
+from ..cache import LRUCache
+
+
+RULE_CACHE_SIZE = 256
+# Occurrences a request may skip before its window starts.
+MAX_SKIPPED_OCCURRENCES = 100_000
+MAX_EXPANSION_SECONDS = 2.0
+# Rule parts that select days, and may together select none.
+_DAY_PARTS = ("BYMONTH", "BYMONTHDAY", "BYYEARDAY", "BYWEEKNO", "BYDAY", "WKST")
+# The Gregorian calendar repeats every 400 years, weekdays included, so a
+# yearly rule that matches no day in the last 400 supported years never matches.
+_CYCLE_START = datetime(9599, 1, 1)
+
+_rule_cache = LRUCache(RULE_CACHE_SIZE)
+
+
+def get_rule_cache_stats() -> dict[str, int]:
+    return _rule_cache.stats()
+
+
+def clear_rule_cache() -> None:
+    _rule_cache.clear()
+
+
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def _matches_some_day(day_parts: str) -> bool:
+    from dateutil.rrule import rrulestr
+
+    return next(iter(rrulestr(f"FREQ=YEARLY;{day_parts}", dtstart=_CYCLE_START)), None) is not None
+
+
+def _check_satisfiable(text: str, rule: str) -> None:
+    """Reject rules whose day filters (BYMONTHDAY, BYYEARDAY, BYWEEKNO) select no day."""
+    parts = dict(part.split("=", 1) for part in text.split(";") if "=" in part)
+    if not parts.keys() & {"BYMONTHDAY", "BYYEARDAY", "BYWEEKNO"}:
+        return
+    if "BYDAY" in parts:
+        # "2MO" means different days at different frequencies; any Monday is a superset.
+        parts["BYDAY"] = ",".join(day.lstrip("+-0123456789") for day in parts["BYDAY"].split(","))
+    day_parts = ";".join(f"{name}={parts[name]}" for name in _DAY_PARTS if name in parts)
+    if not _matches_some_day(day_parts):
+        raise ValueError(f"Recurrence rule '{rule}' never produces an occurrence.")
+
+
+def compile_rule(rule: str, start: datetime):
+    """The ``dateutil`` rule for ``rule`` starting at ``start``, an aware wall-clock time."""
+    text = rule.strip()
+    if text.upper().startswith("RRULE:"):
+        text = text[len("RRULE:"):]
+    if not text or any(c in text for c in "\r\n") or ":" in text:
+        raise ValueError("Pass a single RRULE; the start goes in start_timestamp.")
+
+    key = (text.upper(), start.replace(tzinfo=None), str(start.tzinfo))
+    compiled = _rule_cache.get(key)
+    if compiled is None:
+        from dateutil.rrule import rrulestr
+
+        if "FREQ=" not in key[0]:
+            raise ValueError(f"Invalid recurrence rule '{rule}': FREQ is required.")
+        try:
+            compiled = rrulestr(text, dtstart=start)
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"Invalid recurrence rule '{rule}': {e}") from e
+        _check_satisfiable(key[0], rule)
+        _rule_cache.put(key, compiled)
+    return compiled
+
+
+def iter_occurrences(
+    compiled, after: datetime | None = None, before: datetime | None = None, exclusive: bool = False
+) -> Iterator[datetime]:
+    """Occurrences of ``compiled`` from ``after`` (excluded if ``exclusive``) up to ``before``."""
+    # Compare instants, so that repeated wall-clock hours order correctly.
+    after = after and after.astimezone(timezone.utc)
+    before = before and before.astimezone(timezone.utc)
+    skipped = 0
+    deadline = time.monotonic() + MAX_EXPANSION_SECONDS
+    for occurrence in compiled:
+        if time.monotonic() > deadline:
+            raise ValueError("Expanding the rule took too long; narrow the window with after and before.")
+        # Wall-clock times in a DST gap do not exist; the round trip through
+        # UTC moves them forward by the gap.
+        instant = occurrence.astimezone(timezone.utc)
+        if before is not None and instant > before:
+            return
+        if after is not None and (instant < after or (exclusive and instant == after)):
+            skipped += 1
+            if skipped > MAX_SKIPPED_OCCURRENCES:
+                raise ValueError(
+                    "Too many occurrences before the requested window; "
+                    "move start_timestamp closer to it."
+                )
+            continue
+        yield instant.astimezone(occurrence.tzinfo)
+
+
+def _parse_cursor(cursor: str) -> datetime:
+    try:
+        dt = datetime.fromisoformat(cursor)
+    except ValueError:
+        dt = None
+    if dt is None or dt.tzinfo is None:
+        raise ValueError(f"Invalid cursor: '{cursor}'")
+    return dt
+
+
+def expand_recurrence(input_data: models.ExpandRecurrenceInput) -> results.Occurrences:
+    start = utils.robust_parse_datetime(input_data.start_timestamp, input_data.timezone)
+    compiled = compile_rule(input_data.rule, start)
+
+    after = None
+    if input_data.after is not None:
+        after = utils.robust_parse_datetime(input_data.after, input_data.timezone)
+    before = None
+    if input_data.before is not None:
+        before = utils.robust_parse_datetime(input_data.before, input_data.timezone)
+    exclusive = False
+    if input_data.cursor is not None:
+        resume = _parse_cursor(input_data.cursor)
+        if after is None or resume >= after:
+            after, exclusive = resume, True
+
+    # One extra occurrence tells whether there is another page.
+    page = list(islice(iter_occurrences(compiled, after, before, exclusive), input_data.limit + 1))
+    next_cursor = None
+    if len(page) > input_data.limit:
+        page.pop()
+        next_cursor = page[-1].isoformat()
+    return results.Occurrences(
+        occurrences=[occurrence.isoformat() for occurrence in page],
+        next_cursor=next_cursor,
+    )
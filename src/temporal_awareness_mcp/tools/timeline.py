@@ -0,0 +1,130 @@
+"""Timeline analysis: ordering, intervals, gaps and histograms of many timestamps.
+
+Entries are parsed one at a time with ``robust_parse_datetime`` semantics
+(see ``utils.series_parser``) and folded into the result in a single pass:
+each timestamp adds one to a weekday-by-hour table, from which the hour and
+weekday histograms and the business-hours count are read at the end, and to
+its date's count. Beyond those, only the instants are kept, as 8-byte
+integers in an ``array``, for the intervals; they are sorted only if the input
+was not already in order. Newline-delimited text is sliced one line at a
+time rather than split into a list first.
+"""
+
+import heapq
+from array import array
+from collections import Counter
+from datetime import date
+from itertools import islice
+from operator import sub
+from typing import Iterator
+
+from .. import durations, models, results, transitions, utils
+from ..timezones import resolve_timezone
+
+
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+# Invalid entries whose errors are reported; the rest are only counted.
+MAX_REPORTED_ERRORS = 10
+
+
+def _entries(input_data: models.AnalyzeTimelineInput) -> Iterator[tuple[str, str]]:
+    """(label, text) for every non-blank entry, labelled for error messages."""
+    if (input_data.timestamps is None) == (input_data.timestamps_text is None):
+        raise ValueError("Pass either timestamps or timestamps_text.")
+    if input_data.timestamps is not None:
+        for index, text in enumerate(input_data.timestamps):
+            if text.strip():
+                yield f"Item {index}", text
+        return
+    # Slices one line at a time; ``splitlines`` or ``io.StringIO`` would copy
+    # the whole text first.
+    text = input_data.timestamps_text
+    start = 0
+    number = 0
+    while start <= len(text):
+        end = text.find("\n", start)
+        if end < 0:
+            end = len(text)
+        number += 1
+        if number > models.MAX_TIMELINE_SIZE:
+            raise ValueError(f"timestamps_text has more than {models.MAX_TIMELINE_SIZE} lines.")
+        line = text[start:end].strip()
+        if line:
+            yield f"Line {number}", line
+        start = end + 1
+
+
+def analyze_timeline(input_data: models.AnalyzeTimelineInput) -> results.Timeline:
+    parse = utils.series_parser(input_data.timezone, input_data.honor_offset)
+    zone = resolve_timezone(input_data.timezone)
+
+    instants = array("q")
+    # Timestamps per (weekday, hour), and per date ordinal.
+    cells = [0] * (7 * 24)
+    days: Counter[int] = Counter()
+    errors: list[str] = []
+    invalid = 0
+    out_of_order = 0
+    previous = None
+    for label, text in _entries(input_data):
+        try:
+            dt = parse(text)
+        except ValueError as e:
+            invalid += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(f"{label}: {e}")
+            continue
+        instant = transitions.utc_us(dt)
+        if previous is not None and instant < previous:
+            out_of_order += 1
+        previous = instant
+        instants.append(instant)
+        cells[dt.weekday() * 24 + dt.hour] += 1
+        days[dt.toordinal()] += 1
+
+    if out_of_order:
+        instants = array("q", sorted(instants))
+
+    by_hour = [sum(cells[hour::24]) for hour in range(24)]
+    by_weekday = {name: sum(cells[day * 24:day * 24 + 24]) for day, name in enumerate(WEEKDAY_NAMES)}
+    start, end = input_data.business_hours_start, input_data.business_hours_end
+    inside = sum(cells[day * 24 + hour] for day in range(5) for hour in range(start, end))
+
+    def iso(instant_us: int) -> str:
+        return transitions.from_utc_us(instant_us, zone).isoformat()
+
+    intervals = None
+    largest_gaps = []
+    if len(instants) > 1:
+        gaps = array("q", map(sub, islice(instants, 1, None), instants))
+        for i in heapq.nlargest(input_data.top_gaps, range(len(gaps)), key=gaps.__getitem__):
+            largest_gaps.append(results.TimelineGap(
+                start_timestamp=iso(instants[i]),
+                end_timestamp=iso(instants[i + 1]),
+                seconds=gaps[i] / 1e6,
+                formatted_duration=durations.format_duration(gaps[i]),
+            ))
+        ordered = sorted(gaps)
+        middle = len(ordered) // 2
+        median = ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+        intervals = results.IntervalStats(
+            min_seconds=ordered[0] / 1e6,
+            max_seconds=ordered[-1] / 1e6,
+            median_seconds=median / 1e6,
+            mean_seconds=(instants[-1] - instants[0]) / len(gaps) / 1e6,
+        )
+
+    return results.Timeline(
+        count=len(instants),
+        invalid_count=invalid,
+        errors=errors,
+        first_timestamp=iso(instants[0]) if instants else None,
+        last_timestamp=iso(instants[-1]) if instants else None,
+        out_of_order=out_of_order,
+        intervals=intervals,
+        largest_gaps=largest_gaps,
+        by_hour=by_hour,
+        by_weekday=by_weekday,
+        by_day={date.fromordinal(day).isoformat(): days[day] for day in sorted(days)},
+        outside_business_hours=len(instants) - inside,
+    )
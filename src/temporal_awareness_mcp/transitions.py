@@ -0,0 +1,197 @@
+"""Per-zone UTC offset transition index.
+
+Each zone's offset history is read once into sorted lists of transition
+instants, after which the offset at any instant or wall-clock time is a
+``bisect`` away. This gives exact elapsed-time arithmetic across DST changes
+without repeated ``utcoffset()`` calls. All values are integer microseconds
+since 1970-01-01 (UTC for instants, local for wall times).
+
+Transitions are taken from the zone's TZif file, found where ``zoneinfo``
+finds it. Past the file's last transition, where zoneinfo follows the
+file's POSIX TZ rule, and for zones without a readable file, the offset is
+probed from ``zoneinfo`` a week at a time; the rules change the offset at
+most twice a year.
+"""
+
+import os
+import struct
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import TZPATH, ZoneInfo
+
+
+US_PER_SECOND = 1_000_000
+US_PER_DAY = 86400 * US_PER_SECOND
+
+# The index is probed over this window of UTC instants; values outside it are
+# resolved through zoneinfo directly.
+TABLE_START = int(datetime(1900, 1, 1, tzinfo=timezone.utc).timestamp())
+TABLE_END = int(datetime(2100, 1, 1, tzinfo=timezone.utc).timestamp())
+_PROBE_STEP = 7 * 86400
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_ONE_US = timedelta(microseconds=1)
+_LOW_US = TABLE_START * US_PER_SECOND + US_PER_DAY
+_HIGH_US = TABLE_END * US_PER_SECOND - US_PER_DAY
+
+
+_TZIF_HEADER = struct.Struct(">4sc15x6l")
+_TZIF_TYPE = struct.Struct(">lBB")
+
+
+def _offset_at(zone: ZoneInfo, utc_seconds: int) -> int:
+    return int(datetime.fromtimestamp(utc_seconds, zone).utcoffset().total_seconds())
+
+
+def _read_tzif(key: str | None) -> bytes | None:
+    """The TZif data ``zoneinfo`` loads for ``key``: from ``TZPATH``, else the tzdata package."""
+    if key is None:
+        return None
+    for root in TZPATH:
+        path = os.path.join(root, key)
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                return f.read()
+    try:
+        from importlib import resources
+
+        return resources.files("tzdata").joinpath("zoneinfo", *key.split("/")).read_bytes()
+    except (ImportError, OSError):
+        return None
+
+
+def _tzif_transitions(data: bytes) -> tuple[list[int], list[int]]:
+    """Transition instants (UTC seconds) of TZif ``data`` and the offset after each (RFC 8536)."""
+    magic, version, *counts = _TZIF_HEADER.unpack_from(data)
+    if magic != b"TZif":
+        raise ValueError("Not TZif data.")
+    position = _TZIF_HEADER.size
+    time_size = 4
+    if version >= b"2":
+        # Skip the 32-bit block; the 64-bit one follows with its own header.
+        isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+        position += timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + isstdcnt + isutcnt
+        _, _, *counts = _TZIF_HEADER.unpack_from(data, position)
+        position += _TZIF_HEADER.size
+        time_size = 8
+    _, _, _, timecnt, typecnt, _ = counts
+    times = list(struct.unpack_from(f">{timecnt}{'q' if time_size == 8 else 'l'}", data, position))
+    position += timecnt * time_size
+    indices = data[position:position + timecnt]
+    position += timecnt
+    offsets = [_TZIF_TYPE.unpack_from(data, position + 6 * i)[0] for i in range(typecnt)]
+    return times, [offsets[i] for i in indices]
+
+
+class TransitionIndex:
+    """Sorted UTC transition instants of one zone and the offsets between them.
+
+    ``offsets[i]`` is the offset in force before ``utc_transitions[i]`` and
+    ``offsets[-1]`` the one after the last transition. The wall-clock lists
+    place each transition where zoneinfo resolves local times: with fold=0,
+    ambiguous and skipped times take the earlier offset, with fold=1 the later.
+    """
+
+    __slots__ = (
+        "zone",
+        "utc_transitions",
+        "offsets",
+        "wall_transitions_fold0",
+        "wall_transitions_fold1",
+    )
+
+    def __init__(self, zone: ZoneInfo, utc_transitions: list[int], offsets: list[int]):
+        self.zone = zone
+        self.utc_transitions = utc_transitions
+        self.offsets = offsets
+        self.wall_transitions_fold0 = [
+            t + max(before, after) for t, before, after in zip(utc_transitions, offsets, offsets[1:])
+        ]
+        self.wall_transitions_fold1 = [
+            t + min(before, after) for t, before, after in zip(utc_transitions, offsets, offsets[1:])
+        ]
+
+    @classmethod
+    def probe(cls, zone: ZoneInfo) -> "TransitionIndex":
+        transitions: list[int] = []
+        offsets = [_offset_at(zone, TABLE_START)]
+
+        lo = TABLE_START
+        data = _read_tzif(zone.key)
+        if data is not None:
+            times, after = _tzif_transitions(data)
+            for instant, offset in zip(times, after):
+                if TABLE_START < instant < TABLE_END and offset != offsets[-1]:
+                    transitions.append(instant)
+                    offsets.append(offset)
+            if times:
+                lo = min(max(lo, times[-1]), TABLE_END)
+
+        while lo < TABLE_END:
+            hi = min(lo + _PROBE_STEP, TABLE_END)
+            if _offset_at(zone, hi) != offsets[-1]:
+                # Bisect down to the first second carrying the new offset.
+                left, right = lo, hi
+                while right - left > 1:
+                    mid = (left + right) // 2
+                    if _offset_at(zone, mid) == offsets[-1]:
+                        left = mid
+                    else:
+                        right = mid
+                transitions.append(right)
+                offsets.append(_offset_at(zone, right))
+                lo = right
+            else:
+                lo = hi
+
+        return cls(
+            zone,
+            [t * US_PER_SECOND for t in transitions],
+            [offset * US_PER_SECOND for offset in offsets],
+        )
+
+    def offset_at_utc(self, utc_us: int) -> int:
+        """UTC offset in force at an absolute instant."""
+        if not _LOW_US <= utc_us < _HIGH_US:
+            dt = (_EPOCH + timedelta(microseconds=utc_us)).replace(tzinfo=timezone.utc)
+            return dt.astimezone(self.zone).utcoffset() // _ONE_US
+        return self.offsets[bisect_right(self.utc_transitions, utc_us)]
+
+    def offset_at_wall(self, wall_us: int, fold: int = 0) -> int:
+        """UTC offset of a local wall-clock time, resolved as zoneinfo does."""
+        if not _LOW_US <= wall_us < _HIGH_US:
+            dt = (_EPOCH + timedelta(microseconds=wall_us)).replace(tzinfo=self.zone, fold=fold)
+            return dt.utcoffset() // _ONE_US
+        walls = self.wall_transitions_fold1 if fold else self.wall_transitions_fold0
+        return self.offsets[bisect_right(walls, wall_us)]
+
+
+@lru_cache(maxsize=None)
+def transition_index(zone: ZoneInfo) -> TransitionIndex:
+    """Build (once per zone) the transition index for ``zone``."""
+    return TransitionIndex.probe(zone)
+
+
+def wall_us(dt: datetime) -> int:
+    """Wall-clock microseconds since 1970-01-01, ignoring any tzinfo."""
+    return (
+        (dt.toordinal() - _EPOCH_ORDINAL) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+    ) * US_PER_SECOND + dt.microsecond
+
+
+def utc_us(dt: datetime) -> int:
+    """Absolute instant of an aware ``datetime`` with a ``ZoneInfo`` tzinfo."""
+    wall = wall_us(dt)
+    return wall - transition_index(dt.tzinfo).offset_at_wall(wall, dt.fold)
+
+
+def from_utc_us(instant_us: int, zone: ZoneInfo) -> datetime:
+    """The local ``datetime`` in ``zone`` for an absolute instant, with ``fold`` set."""
+    index = transition_index(zone)
+    offset = index.offset_at_utc(instant_us)
+    wall = instant_us + offset
+    # The second occurrence of an ambiguous wall time needs fold=1.
+    fold = int(index.offset_at_wall(wall, 0) != offset)
+    return (_EPOCH + timedelta(microseconds=wall)).replace(tzinfo=zone, fold=fold)
@@ -1,19 +1,255 @@
 """Utility functions for temporal parsing."""
 
-from datetime import datetime
-from dateutil import parser
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import os
+import re
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable
+from zoneinfo import ZoneInfoNotFoundError
 
+from .cache import LRUCache
+from .timezones import resolve_timezone
 
-def robust_parse_datetime(timestamp_str: str, tz_str: str = "UTC") -> datetime:
+
+PARSE_TIERS = ("iso", "epoch", "relative", "dateutil")
+# Tiers whose results may be memoized. Results are keyed by the current date as
+# well, since dateutil fills missing fields from today; relative expressions
+# ("in 3 hours") depend on the current time and are never memoized.
+_CACHEABLE_TIERS = frozenset({"iso", "epoch", "dateutil"})
+
+PARSE_CACHE_SIZE_ENV = "TEMPORAL_MCP_PARSE_CACHE_SIZE"
+DEFAULT_PARSE_CACHE_SIZE = 1024
+
+# ISO 8601 / RFC 3339 calendar dates with optional time and offset. The offset
+# is skipped unless asked for, mirroring dateutil's ``ignoretz=True``.
+_ISO_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[Tt ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,9}))?)?)?"
+    r"([Zz]|([+-])(\d{2})(?::?(\d{2}))?)?"
+)
+# ISO 8601 basic-format date and time, YYYYMMDD[T]hhmm[ss]. Tried before the
+# epoch tier, whose 12- and 14-digit millisecond forms it overlaps.
+_ISO_BASIC_PATTERN = re.compile(r"(\d{4})(\d{2})(\d{2})[Tt]?(\d{2})(\d{2})(\d{2})?")
+# Unix epoch seconds (9-11 digits, optional fraction) or milliseconds (12-14 digits).
+_EPOCH_PATTERN = re.compile(r"(\d{9,11})(?:\.(\d{1,9}))?|(\d{12,14})")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_tier_counts: Counter[str] = Counter()
+# Seconds spent in robust_parse_datetime by the current thread, while timing
+# is switched on (see start_parse_timing).
+_parse_clock = threading.local()
+
+
+def _parse_cache_size_from_env() -> int:
+    try:
+        return max(0, int(os.environ.get(PARSE_CACHE_SIZE_ENV, DEFAULT_PARSE_CACHE_SIZE)))
+    except ValueError:
+        return DEFAULT_PARSE_CACHE_SIZE
+
+
+_parse_cache = LRUCache(_parse_cache_size_from_env())
+
+
+def configure_parse_cache(maxsize: int) -> None:
+    """Resize the parse cache; a size of 0 disables it."""
+    _parse_cache.resize(maxsize)
+
+
+def get_parse_cache_stats() -> dict[str, int]:
+    return _parse_cache.stats()
+
+
+def clear_parse_cache() -> None:
+    _parse_cache.clear()
+
+
+def get_parse_tier_counts() -> dict[str, int]:
+    """Return how many inputs each parser tier has handled since the last reset."""
+    return {tier: _tier_counts[tier] for tier in PARSE_TIERS}
+
+
+def reset_parse_tier_counts() -> None:
+    _tier_counts.clear()
+
+
+def start_parse_timing() -> None:
+    """Start accumulating this thread's time spent parsing."""
+    _parse_clock.seconds = 0.0
+
+
+def stop_parse_timing() -> float:
+    """Stop accumulating and return the seconds spent parsing since the start."""
+    seconds = getattr(_parse_clock, "seconds", None) or 0.0
+    _parse_clock.seconds = None
+    return seconds
+
+
+def _parse_iso(text: str, honor_offset: bool = False) -> datetime | None:
+    match = _ISO_PATTERN.fullmatch(text)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, offset, sign, offset_hours, offset_minutes = match.groups()
+    try:
+        tzinfo = None
+        if honor_offset and offset:
+            if sign is None:
+                tzinfo = timezone.utc
+            else:
+                delta = timedelta(hours=int(offset_hours), minutes=int(offset_minutes or 0))
+                tzinfo = timezone(-delta if sign == "-" else delta)
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+            int(fraction[:6].ljust(6, "0")) if fraction else 0,
+            tzinfo,
+        )
+    except ValueError:
+        # Out-of-range fields: let dateutil have the final say.
+        return None
+
+
+def _parse_iso_basic(text: str) -> datetime | None:
+    match = _ISO_BASIC_PATTERN.fullmatch(text)
+    if match is None:
+        return None
+    try:
+        return datetime(*(int(field or 0) for field in match.groups()))
+    except ValueError:
+        # Not a calendar date and time: read the digits as epoch milliseconds.
+        return None
+
+
+def _parse_epoch(text: str) -> datetime | None:
+    match = _EPOCH_PATTERN.fullmatch(text)
+    if match is None:
+        return None
+    seconds, fraction, millis = match.groups()
+    if millis is not None:
+        delta = timedelta(milliseconds=int(millis))
+    else:
+        micros = int(fraction[:6].ljust(6, "0")) if fraction else 0
+        delta = timedelta(seconds=int(seconds), microseconds=micros)
+    try:
+        return _EPOCH + delta
+    except OverflowError:
+        return None
+
+
+def has_fast_path(timestamp_str: str) -> bool:
+    """Whether the input looks like ISO, epoch or relative text, i.e. will not need dateutil."""
+    text = timestamp_str.strip()
+    if _ISO_PATTERN.fullmatch(text) or _ISO_BASIC_PATTERN.fullmatch(text) or _EPOCH_PATTERN.fullmatch(text):
+        return True
+    from . import relative
+
+    return relative.looks_relative(text)
+
+
+def _parse_tiered(timestamp_str: str, honor_offset: bool = False, tz=None) -> tuple[datetime, str]:
+    """Parse with the cheapest tier that accepts the input.
+
+    Returns a naive wall-clock datetime for ISO and free-form input, or an aware
+    UTC datetime for epoch input, which denotes an absolute instant. With
+    ``honor_offset``, ISO and free-form input that carries an offset or zone
+    name is returned aware as well. Relative expressions are resolved against
+    the current time in ``tz`` (UTC if not given) and returned aware.
+    """
+    text = timestamp_str.strip()
+
+    dt = _parse_iso(text, honor_offset)
+    if dt is None:
+        dt = _parse_iso_basic(text)
+    if dt is not None:
+        _tier_counts["iso"] += 1
+        return dt, "iso"
+
+    dt = _parse_epoch(text)
+    if dt is not None:
+        _tier_counts["epoch"] += 1
+        return dt, "epoch"
+
+    # Imported on first use, like dateutil below: compiling its grammar takes
+    # a few milliseconds.
+    from . import relative
+
+    dt = relative.parse_relative(text, datetime.now(tz or timezone.utc))
+    if dt is not None:
+        _tier_counts["relative"] += 1
+        return dt, "relative"
+
+    # Imported on first use: most inputs never reach this tier.
+    from dateutil import parser
+
+    _tier_counts["dateutil"] += 1
+    return parser.parse(text, ignoretz=not honor_offset), "dateutil"
+
+
+def _in_zone(dt: datetime, tz) -> datetime:
+    return dt.astimezone(tz) if dt.tzinfo is not None else dt.replace(tzinfo=tz)
+
+
+def robust_parse_datetime(timestamp_str: str, tz_str: str = "UTC", honor_offset: bool = False) -> datetime:
+    """Parse ``timestamp_str`` into an aware datetime in ``tz_str``.
+
+    Offsets in the input are ignored and the wall-clock time is read in
+    ``tz_str``, unless ``honor_offset`` is set: then an input with an offset
+    denotes that instant, converted into ``tz_str``. Epoch input is always an
+    instant.
+    """
+    if getattr(_parse_clock, "seconds", None) is None:
+        return _robust_parse_datetime(timestamp_str, tz_str, honor_offset)
+    started = time.perf_counter()
     try:
-        dt_naive = parser.parse(timestamp_str, ignoretz=True)
-        
-        tz = ZoneInfo(tz_str)
-        
-        return dt_naive.replace(tzinfo=tz)
+        return _robust_parse_datetime(timestamp_str, tz_str, honor_offset)
+    finally:
+        _parse_clock.seconds += time.perf_counter() - started
 
-    except parser.ParserError as e:
+
+def _robust_parse_datetime(timestamp_str: str, tz_str: str, honor_offset: bool) -> datetime:
+    key = None
+    if _parse_cache.enabled:
+        key = (timestamp_str, tz_str, honor_offset, date.today().toordinal())
+        cached = _parse_cache.get(key)
+        if cached is not None:
+            return cached
+
+    try:
+        tz = resolve_timezone(tz_str)
+        dt, tier = _parse_tiered(timestamp_str, honor_offset, tz)
+        dt = _in_zone(dt, tz)
+    except ZoneInfoNotFoundError as e:
+        raise ValueError(f"The specified timezone '{tz_str}' is not a valid IANA timezone.") from e
+    except (ValueError, OverflowError) as e:  # includes dateutil's ParserError
         raise ValueError(f"Could not parse the timestamp string: '{timestamp_str}'") from e
+
+    if key is not None and tier in _CACHEABLE_TIERS:
+        _parse_cache.put(key, dt)
+    return dt
+
+
+def series_parser(tz_str: str = "UTC", honor_offset: bool = False) -> Callable[[str], datetime]:
+    """A ``robust_parse_datetime`` bound to one timezone, for long series of timestamps.
+
+    The timezone is resolved once, and the parse cache is neither read nor
+    filled: a series rarely repeats a timestamp, and storing it would evict
+    the entries other requests reuse.
+    """
+    try:
+        tz = resolve_timezone(tz_str)
     except ZoneInfoNotFoundError as e:
-        raise ValueError(f"The specified timezone '{tz_str}' is not a valid IANA timezone.") from e
\ No newline at end of file
+        raise ValueError(f"The specified timezone '{tz_str}' is not a valid IANA timezone.") from e
+
+    def parse(timestamp_str: str) -> datetime:
+        try:
+            dt, _ = _parse_tiered(timestamp_str, honor_offset, tz)
+            return _in_zone(dt, tz)
+        except (ValueError, OverflowError) as e:
+            raise ValueError(f"Could not parse the timestamp string: '{timestamp_str}'") from e
+
+    return parse
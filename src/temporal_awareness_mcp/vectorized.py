@@ -0,0 +1,216 @@
+"""Vectorized NumPy engine for bulk timestamp arithmetic.
+
+This is an optional accelerator for batch workloads, installed with the
+``vector`` extra (``pip install temporal-awareness-mcp[vector]``). It works on
+timestamps that have already been parsed by ``utils.robust_parse_datetime``
+and reproduces the results of the pure-Python tools in ``tools/core.py`` and
+``tools/contextual.py``, which remain the reference implementation.
+
+Timestamps are held as ``datetime64[us]`` wall-clock values, matching the
+resolution of ``datetime`` and covering its whole range. UTC offsets come from
+the per-zone transition index in ``transitions``, converted once to arrays
+and looked up with ``searchsorted``.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Sequence
+from zoneinfo import ZoneInfo
+
+from . import transitions
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the extra
+    np = None
+
+
+US_PER_SECOND = 1_000_000
+US_PER_MINUTE = 60 * US_PER_SECOND
+US_PER_HOUR = 60 * US_PER_MINUTE
+US_PER_DAY = 24 * US_PER_HOUR
+
+UNIT_US = {
+    "weeks": 7 * US_PER_DAY,
+    "days": US_PER_DAY,
+    "hours": US_PER_HOUR,
+    "minutes": US_PER_MINUTE,
+    "seconds": US_PER_SECOND,
+}
+
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+TIME_OF_DAY_LABELS = ("morning", "afternoon", "evening", "night")
+# Index into TIME_OF_DAY_LABELS for each hour, mirroring contextual.get_timestamp_context.
+_TIME_OF_DAY_BY_HOUR = [3] * 5 + [0] * 7 + [1] * 5 + [2] * 4 + [3] * 3
+
+_UTC = timezone.utc
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+# Wall-clock range representable by ``datetime``.
+MIN_WALL_US = (datetime.min - _EPOCH) // timedelta(microseconds=1)
+MAX_WALL_US = (datetime.max - _EPOCH) // timedelta(microseconds=1)
+
+
+def is_available() -> bool:
+    return np is not None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError(
+            "The vectorized engine requires NumPy; install temporal-awareness-mcp[vector]."
+        )
+
+
+@dataclass(frozen=True)
+class ZoneTable:
+    """UTC offsets of one zone as sorted transition arrays.
+
+    ``offsets[i]`` is the offset in force before ``utc_transitions[i]`` (and
+    ``offsets[-1]`` after the last transition), all in microseconds.
+    """
+
+    zone: ZoneInfo
+    utc_transitions: "np.ndarray"
+    offsets: "np.ndarray"
+    wall_transitions_fold0: "np.ndarray"
+    wall_transitions_fold1: "np.ndarray"
+
+
+@lru_cache(maxsize=None)
+def zone_table(zone: ZoneInfo) -> ZoneTable:
+    """Array form of the zone's ``transitions.TransitionIndex``, built once per zone."""
+    _require_numpy()
+    index = transitions.transition_index(zone)
+    return ZoneTable(
+        zone=zone,
+        utc_transitions=np.array(index.utc_transitions, dtype=np.int64),
+        offsets=np.array(index.offsets, dtype=np.int64),
+        wall_transitions_fold0=np.array(index.wall_transitions_fold0, dtype=np.int64),
+        wall_transitions_fold1=np.array(index.wall_transitions_fold1, dtype=np.int64),
+    )
+
+
+def _outside_table(values_us: "np.ndarray") -> "np.ndarray":
+    # A day of margin keeps wall-clock values, which are shifted from UTC by
+    # the offset, clear of the table edges.
+    return (values_us < transitions.TABLE_START * US_PER_SECOND + US_PER_DAY) | (
+        values_us >= transitions.TABLE_END * US_PER_SECOND - US_PER_DAY
+    )
+
+
+def to_wall_us(dts: Sequence[datetime]) -> tuple["np.ndarray", "np.ndarray"]:
+    """Convert datetimes to wall-clock microseconds since 1970-01-01 and fold flags."""
+    _require_numpy()
+    # Plain integer arithmetic is several times faster than letting NumPy
+    # convert datetime objects itself.
+    wall = np.fromiter(
+        (
+            ((dt.toordinal() - _EPOCH_ORDINAL) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second)
+            * US_PER_SECOND
+            + dt.microsecond
+            for dt in dts
+        ),
+        dtype=np.int64,
+        count=len(dts),
+    )
+    fold = np.fromiter((dt.fold for dt in dts), dtype=bool, count=len(dts))
+    return wall, fold
+
+
+def offsets_for_wall(wall_us: "np.ndarray", zone: ZoneInfo, fold: "np.ndarray | None" = None) -> "np.ndarray":
+    """UTC offsets (microseconds) of wall-clock times in ``zone``, as zoneinfo resolves them."""
+    table = zone_table(zone)
+    offsets = table.offsets[np.searchsorted(table.wall_transitions_fold0, wall_us, side="right")]
+    if fold is not None and fold.any():
+        offsets_fold1 = table.offsets[
+            np.searchsorted(table.wall_transitions_fold1, wall_us, side="right")
+        ]
+        offsets = np.where(fold, offsets_fold1, offsets)
+
+    outside = _outside_table(wall_us)
+    if outside.any():
+        folds = fold if fold is not None else np.zeros(len(wall_us), dtype=bool)
+        for i in np.flatnonzero(outside):
+            dt = (_EPOCH + timedelta(microseconds=int(wall_us[i]))).replace(
+                tzinfo=zone, fold=int(folds[i])
+            )
+            offsets[i] = dt.utcoffset() // timedelta(microseconds=1)
+    return offsets
+
+
+def offsets_for_instants(utc_us: "np.ndarray", zone: ZoneInfo) -> "np.ndarray":
+    """UTC offsets (microseconds) in ``zone`` at absolute instants."""
+    table = zone_table(zone)
+    offsets = table.offsets[np.searchsorted(table.utc_transitions, utc_us, side="right")]
+
+    outside = _outside_table(utc_us)
+    if outside.any():
+        for i in np.flatnonzero(outside):
+            dt = (_EPOCH + timedelta(microseconds=int(utc_us[i]))).replace(tzinfo=_UTC)
+            offsets[i] = dt.astimezone(zone).utcoffset() // timedelta(microseconds=1)
+    return offsets
+
+
+def difference_seconds(start_wall_us: "np.ndarray", end_wall_us: "np.ndarray") -> "np.ndarray":
+    """Wall-clock differences in seconds, as ``(end - start).total_seconds()``."""
+    return (end_wall_us - start_wall_us) / US_PER_SECOND
+
+
+def delta_us(values: Sequence[float], units: Sequence[str]) -> tuple["np.ndarray", "np.ndarray"]:
+    """Durations in microseconds, rounded the way ``timedelta`` rounds them.
+
+    Also returns a mask of the durations that fit in the ``datetime`` range;
+    the others (including NaN and infinities) are set to zero.
+    """
+    _require_numpy()
+    scale = np.fromiter((UNIT_US[unit] for unit in units), dtype=np.float64, count=len(units))
+    with np.errstate(over="ignore", invalid="ignore"):
+        scaled = np.asarray(values, dtype=np.float64) * scale
+        valid = np.abs(scaled) <= float(MAX_WALL_US - MIN_WALL_US)
+    return np.round(np.where(valid, scaled, 0.0)).astype(np.int64), valid
+
+
+def _format_offset(offset_us: int) -> str:
+    sign = "-" if offset_us < 0 else "+"
+    seconds, micros = divmod(abs(offset_us), US_PER_SECOND)
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    text = f"{sign}{hours:02d}:{minutes:02d}"
+    if seconds or micros:
+        text += f":{seconds:02d}"
+    if micros:
+        text += f".{micros:06d}"
+    return text
+
+
+def format_iso(wall_us: "np.ndarray", offsets_us: "np.ndarray") -> list[str]:
+    """Render wall times and offsets like ``datetime.isoformat()``."""
+    wall = wall_us.astype("datetime64[us]")
+    text = np.where(
+        wall_us % US_PER_SECOND == 0,
+        np.datetime_as_string(wall, unit="s"),
+        np.datetime_as_string(wall, unit="us"),
+    )
+
+    unique, inverse = np.unique(offsets_us, return_inverse=True)
+    suffixes = np.array([_format_offset(int(offset)) for offset in unique])
+    return np.char.add(text, suffixes[inverse]).tolist()
+
+
+def contexts(
+    wall_us: "np.ndarray", business_start: "np.ndarray", business_end: "np.ndarray"
+) -> dict[str, "np.ndarray"]:
+    """Weekday, weekend, business-hours and time-of-day flags for wall times."""
+    days = wall_us // US_PER_DAY
+    hour = (wall_us - days * US_PER_DAY) // US_PER_HOUR
+    weekday = (days + 3) % 7  # 1970-01-01 was a Thursday
+    is_weekend = weekday >= 5
+    return {
+        "weekday": weekday,
+        "is_weekend": is_weekend,
+        "is_business_hours": ~is_weekend & (business_start <= hour) & (hour < business_end),
+        "time_of_day": np.asarray(_TIME_OF_DAY_BY_HOUR, dtype=np.int8)[hour],
+    }
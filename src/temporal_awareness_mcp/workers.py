@@ -0,0 +1,292 @@
+"""Multi-process HTTP deployment (``http_main --workers N``).
+
+The supervisor binds the public TCP socket once and spawns N worker processes
+that all accept on it, so the kernel spreads connections across them. An SSE
+session lives in the worker that accepted its ``GET /sse``. To keep message
+POSTs with their session without sticky load balancing, worker ``i``
+advertises ``/messages/{i}/`` as its message endpoint, and a POST that lands
+on another worker is relayed to worker ``i`` over that worker's private Unix
+socket. The stateless streamable-HTTP endpoint (``/mcp``) needs no affinity.
+
+The supervisor restarts workers that exit or stop answering ``/health``, and
+on SIGTERM or SIGINT asks every worker to shut down gracefully before killing
+stragglers. ``GET /health/workers`` on any worker reports on all of them.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+from typing import Any, Sequence
+
+
+HEALTH_INTERVAL = 5.0
+HEALTH_TIMEOUT = 2.0
+MAX_HEALTH_FAILURES = 3
+DEFAULT_GRACEFUL_TIMEOUT = 10
+
+# Headers describing one hop, which the relay must not copy across.
+_HOP_HEADERS = frozenset({
+    b"host", b"connection", b"content-length", b"transfer-encoding", b"keep-alive",
+    b"date", b"server",
+})
+
+
+def resolve_worker_count(workers: int) -> int:
+    """``workers``, or one per CPU available to this process when it is 0."""
+    if workers > 0:
+        return workers
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not Linux
+        return os.cpu_count() or 1
+
+
+def socket_path(run_dir: str, index: int) -> str:
+    return os.path.join(run_dir, f"worker-{index}.sock")
+
+
+async def unix_http_request(
+    path: str,
+    method: str,
+    target: str,
+    body: bytes = b"",
+    headers: list[tuple[bytes, bytes]] | None = None,
+    timeout: float = HEALTH_TIMEOUT,
+) -> tuple[int, list[tuple[bytes, bytes]], bytes]:
+    """Make one HTTP/1.1 request over a Unix socket; returns status, headers and body."""
+
+    async def exchange() -> bytes:
+        reader, writer = await asyncio.open_unix_connection(path)
+        try:
+            lines = [
+                f"{method} {target} HTTP/1.1".encode("latin-1"),
+                b"host: localhost",
+                b"connection: close",
+                b"content-length: " + str(len(body)).encode(),
+            ]
+            lines += [name + b": " + value for name, value in headers or ()]
+            writer.write(b"\r\n".join(lines) + b"\r\n\r\n" + body)
+            await writer.drain()
+            return await reader.read()
+        finally:
+            writer.close()
+
+    response = await asyncio.wait_for(exchange(), timeout)
+    head, _, payload = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.split(b"\r\n")
+    status = int(status_line.split()[1])
+    response_headers = []
+    for line in header_lines:
+        name, _, value = line.partition(b":")
+        response_headers.append((name.strip().lower(), value.strip()))
+    return status, response_headers, payload
+
+
+class MessageRelay:
+    """ASGI app relaying message POSTs for another worker's sessions."""
+
+    def __init__(self, run_dir: str, worker_count: int):
+        self.run_dir = run_dir
+        self.worker_count = worker_count
+
+    async def __call__(self, scope, receive, send):
+        from starlette.responses import PlainTextResponse
+
+        index = scope["path_params"]["worker"]
+        if not 0 <= index < self.worker_count:
+            await PlainTextResponse("Unknown worker", status_code=404)(scope, receive, send)
+            return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        target = f"/messages/{index}/"
+        if scope["query_string"]:
+            target += "?" + scope["query_string"].decode("latin-1")
+        headers = [(name, value) for name, value in scope["headers"] if name not in _HOP_HEADERS]
+        try:
+            status, response_headers, payload = await unix_http_request(
+                socket_path(self.run_dir, index), "POST", target, body, headers
+            )
+        except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+            await PlainTextResponse("Worker unavailable", status_code=502)(scope, receive, send)
+            return
+
+        # This worker's own middleware (CORS) decorates the response again.
+        response_headers = [
+            (name, value)
+            for name, value in response_headers
+            if name not in _HOP_HEADERS and not name.startswith(b"access-control-")
+        ]
+        response_headers.append((b"content-length", str(len(payload)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": response_headers})
+        await send({"type": "http.response.body", "body": payload})
+
+
+async def probe_worker(run_dir: str, index: int) -> dict[str, Any]:
+    try:
+        status, _, payload = await unix_http_request(socket_path(run_dir, index), "GET", "/health")
+        report = json.loads(payload) if status == 200 else {"status": "unhealthy", "http_status": status}
+    except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+        report = {"status": "unreachable"}
+    return {"worker": index, **report}
+
+
+def build_worker_app(
+    server,
+    index: int,
+    worker_count: int,
+    run_dir: str,
+    json_response: bool = True,
+    cors_origins: Sequence[str] = ("*",),
+):
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    async def handle_workers_health(request):
+        reports = await asyncio.gather(*(probe_worker(run_dir, i) for i in range(worker_count)))
+        healthy = all(report["status"] == "ok" for report in reports)
+        return JSONResponse(
+            {"status": "ok" if healthy else "degraded", "workers": reports},
+            status_code=200 if healthy else 503,
+        )
+
+    return server.build_http_app(
+        messages_path=f"/messages/{index}/",
+        json_response=json_response,
+        cors_origins=cors_origins,
+        routes=[
+            Route("/messages/{worker:int}/", endpoint=MessageRelay(run_dir, worker_count), methods=["POST"]),
+            Route("/health/workers", endpoint=handle_workers_health, methods=["GET"]),
+        ],
+    )
+
+
+def _worker_main(
+    index: int, worker_count: int, run_dir: str, listener: socket.socket, args: argparse.Namespace
+) -> None:
+    import uvicorn
+
+    from .cli import apply_common_arguments, apply_http_arguments
+    from .server import create_server
+    from .timezones import warm_timezone_registry
+
+    apply_common_arguments(args)
+    apply_http_arguments(args)
+    warm_timezone_registry()
+    app = build_worker_app(
+        create_server(args.response_format), index, worker_count, run_dir, not args.http_stream,
+        args.cors_origin or ("*",),
+    )
+
+    path = socket_path(run_dir, index)
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+    private = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    private.bind(path)
+
+    config = uvicorn.Config(app, timeout_graceful_shutdown=args.graceful_timeout)
+    uvicorn.Server(config).run(sockets=[listener, private])
+
+
+def _log(message: str) -> None:
+    print(f"[supervisor] {message}", file=sys.stderr)
+
+
+class Supervisor:
+    def __init__(self, args: argparse.Namespace, worker_count: int):
+        self.args = args
+        self.worker_count = worker_count
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: list[Any] = []
+        self._failures = [0] * worker_count
+        self._listener: socket.socket | None = None
+        self._run_dir = ""
+
+    def _bind(self) -> socket.socket:
+        family = socket.AF_INET6 if ":" in self.args.host else socket.AF_INET
+        listener = socket.socket(family, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind((self.args.host, self.args.port))
+        listener.set_inheritable(True)
+        return listener
+
+    def _spawn(self, index: int):
+        process = self._context.Process(
+            target=_worker_main,
+            args=(index, self.worker_count, self._run_dir, self._listener, self.args),
+            name=f"temporal-mcp-worker-{index}",
+        )
+        process.start()
+        self._failures[index] = 0
+        return process
+
+    async def _stop(self, process, timeout: float) -> None:
+        if process.is_alive():
+            process.terminate()
+            await asyncio.get_running_loop().run_in_executor(None, process.join, timeout)
+        if process.is_alive():
+            process.kill()
+            await asyncio.get_running_loop().run_in_executor(None, process.join)
+
+    async def _check_workers(self) -> None:
+        for index, process in enumerate(self._processes):
+            if not process.is_alive():
+                _log(f"worker {index} (pid {process.pid}) exited with {process.exitcode}; restarting")
+                self._processes[index] = self._spawn(index)
+                continue
+            report = await probe_worker(self._run_dir, index)
+            if report["status"] == "ok":
+                self._failures[index] = 0
+                continue
+            self._failures[index] += 1
+            if self._failures[index] >= MAX_HEALTH_FAILURES:
+                _log(f"worker {index} (pid {process.pid}) is {report['status']}; restarting")
+                await self._stop(process, self.args.graceful_timeout)
+                self._processes[index] = self._spawn(index)
+
+    async def run(self) -> None:
+        self._listener = self._bind()
+        self._run_dir = tempfile.mkdtemp(prefix="temporal-mcp-")
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, stop.set)
+
+        try:
+            self._processes = [self._spawn(index) for index in range(self.worker_count)]
+            _log(
+                f"serving on {self.args.host}:{self.args.port} with {self.worker_count} workers "
+                f"(pids {', '.join(str(p.pid) for p in self._processes)})"
+            )
+            while not stop.is_set():
+                try:
+                    await asyncio.wait_for(stop.wait(), HEALTH_INTERVAL)
+                except asyncio.TimeoutError:
+                    await self._check_workers()
+        finally:
+            _log("shutting down workers")
+            started = time.monotonic()
+            await asyncio.gather(*(
+                self._stop(process, self.args.graceful_timeout) for process in self._processes
+            ))
+            _log(f"workers stopped in {time.monotonic() - started:.1f}s")
+            self._listener.close()
+            shutil.rmtree(self._run_dir, ignore_errors=True)
+
+
+async def run_workers(args: argparse.Namespace, worker_count: int) -> None:
+    await Supervisor(args, worker_count).run()
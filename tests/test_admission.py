@@ -0,0 +1,95 @@
+"""
+Tests for admission control: rate limits, the session cap, load shedding and call deadlines.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+from temporal_awareness_mcp import admission
+from temporal_awareness_mcp.server import create_server
+
+HEADERS = {"Accept": "application/json, text/event-stream"}
+CALL = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "tools/call",
+    "params": {"name": "get_current_time", "arguments": {"timezone": "UTC"}},
+}
+
+
+@pytest.fixture
+def limits():
+    """Configure the shared controller for one test."""
+    yield lambda **options: admission.configure_admission(admission.AdmissionLimits(**options))
+    admission.configure_admission(admission.AdmissionLimits())
+
+
+@asynccontextmanager
+async def http_client(server=None):
+    server = server or create_server()
+    app = server.build_http_app()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+
+def test_rate_limiter():
+    limiter = admission.RateLimiter(rate=2, burst=3, max_keys=2)
+    assert [limiter.acquire("a", now=0.0) for _ in range(4)] == [0.0, 0.0, 0.0, 0.5]
+    assert limiter.acquire("a", now=0.5) == 0.0
+    limiter.acquire("b", now=1.0)
+    limiter.acquire("c", now=1.0)
+    assert len(limiter) == 2
+    assert not admission.RateLimiter(rate=0, burst=0).enabled
+
+
+async def test_http_limits(limits):
+    """Client and session buckets answer 429, the session cap 503; health is exempt."""
+    controller = limits(ip_rate=0.01, ip_burst=3, session_rate=0.01, session_burst=1, max_sessions=1)
+    server = create_server()
+    async with http_client(server) as client:
+        server.active_sessions = 1
+        assert (await client.get("/sse")).status_code == 503
+        assert (await client.post("/messages/?session_id=abc", json={})).status_code != 429
+        refused = await client.post("/messages/?session_id=abc", json={})
+        assert refused.status_code == 429
+        assert int(refused.headers["Retry-After"]) >= 1
+        assert (await client.post("/mcp", headers=HEADERS, json=CALL)).status_code == 429
+        health = await client.get("/health")
+        metrics = (await client.get("/metrics")).text
+
+    assert health.json()["admission"]["rejected"] == {
+        "ip_rate": 1, "session_rate": 1, "sessions": 1, "overloaded": 0,
+    }
+    assert controller.admitted == 1
+    assert 'temporal_mcp_admission_rejected_total{reason="ip_rate"} 1' in metrics
+
+
+async def test_overloaded_calls_get_an_mcp_error(limits):
+    controller = limits(max_inflight_calls=1)
+    async with http_client() as client:
+        answered = await client.post("/mcp", headers=HEADERS, json=CALL)
+        controller.inflight_calls = 1
+        shed = await client.post("/mcp", headers=HEADERS, json=CALL)
+        controller.inflight_calls = 0
+
+    assert "result" in answered.json()
+    error = shed.json()["error"]
+    assert error["code"] == admission.OVERLOADED
+    assert error["data"] == {"retry_after": admission.SHED_RETRY_AFTER}
+    assert controller.rejected["overloaded"] == 1
+
+
+async def test_call_deadline(limits):
+    controller = limits(call_timeout=0.01)
+    with pytest.raises(admission.CallTimeoutError, match="0.01 s deadline"):
+        async with admission.deadline():
+            await asyncio.sleep(1)
+    assert controller.timeouts == 1
+
+    limits(call_timeout=0)
+    async with admission.deadline():
+        await asyncio.sleep(0)
@@ -0,0 +1,78 @@
+"""
+Tests for the batch tool variants.
+"""
+import json
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from temporal_awareness_mcp import models
+from temporal_awareness_mcp.server import create_server
+from temporal_awareness_mcp.tools import batch
+
+
+def test_validate_items_single_pass():
+    items = batch.validate_items(models.CalculateDifferenceInput, [
+        {"start_timestamp": "2024-01-01 10:00:00", "end_timestamp": "2024-01-01 12:00:00"},
+        {"start_timestamp": "2024-01-01", "end_timestamp": "2024-01-02", "timezone": "Asia/Tokyo"},
+    ])
+    assert all(isinstance(item, models.CalculateDifferenceInput) for item in items)
+
+
+def test_validate_items_reports_invalid_items():
+    items = batch.validate_items(models.AdjustTimestampInput, [
+        {"start_timestamp": "2024-07-20 12:00:00", "delta_value": 5, "delta_unit": "days"},
+        {"start_timestamp": "2024-07-20 12:00:00", "delta_value": 5, "delta_unit": "fortnights"},
+    ])
+    assert isinstance(items[0], models.AdjustTimestampInput)
+    assert items[1].startswith("delta_unit:")
+
+
+@pytest.mark.parametrize("raw_items", [None, [], "2024-01-01"])
+def test_validate_items_rejects_non_lists(raw_items):
+    with pytest.raises(ValueError, match="non-empty list"):
+        batch.validate_items(models.GetCurrentTimeInput, raw_items)
+
+
+def test_batch_calculate_difference_per_item_errors():
+    items = batch.validate_items(models.CalculateDifferenceInput, [
+        {"start_timestamp": "2024-01-01 10:00:00", "end_timestamp": "2024-01-01 12:30:15"},
+        {"start_timestamp": "not a date", "end_timestamp": "2024-01-01"},
+        {"start_timestamp": "2024-01-01", "end_timestamp": "2024-01-02", "timezone": "Nowhere/Land"},
+    ])
+    output = batch.batch_calculate_difference(items)
+
+    assert [r.index for r in output.results] == [0, 1, 2]
+    assert output.results[0].result.formatted_duration == "2 hours, 30 minutes, 15 seconds"
+    assert output.results[0].error is None
+    assert "Could not parse" in output.results[1].error
+    assert "not a valid IANA timezone" in output.results[2].error
+
+
+def test_batch_get_timestamp_context():
+    items = batch.validate_items(models.GetTimestampContextInput, [
+        {"timestamp": "2024-03-11 10:30:00"},
+        {"timestamp": "2024-03-16 14:00:00"},
+    ])
+    output = batch.batch_get_timestamp_context(items)
+    assert [r.result.day_of_week for r in output.results] == ["Monday", "Saturday"]
+
+
+async def test_batch_tool_through_server():
+    server = create_server()
+    handler = server.server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(
+            name="batch_adjust_timestamp",
+            arguments={"items": [
+                {"start_timestamp": "2024-07-20 12:00:00", "delta_value": 5, "delta_unit": "days"},
+                {"start_timestamp": "garbage", "delta_value": 1, "delta_unit": "hours"},
+            ]},
+        ),
+    )
+    response = await handler(request)
+    payload = json.loads(response.root.content[0].text)
+
+    assert payload["results"][0]["result"]["adjusted_timestamp_iso"] == "2024-07-25T12:00:00+00:00"
+    assert "error" not in payload["results"][0]
+    assert "Could not parse" in payload["results"][1]["error"]
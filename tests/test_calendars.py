@@ -0,0 +1,103 @@
+"""
+Tests for business calendars and the business-time tools.
+"""
+import argparse
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from temporal_awareness_mcp import calendars, cli, executor, models
+from temporal_awareness_mcp.server import create_server
+from temporal_awareness_mcp.tools import business
+from tests.test_server import call_tool
+
+
+@pytest.fixture(autouse=True)
+def default_calendars():
+    calendars.configure_calendars(None)
+    yield
+    calendars.configure_calendars(None)
+
+
+@pytest.fixture
+def us_calendar(tmp_path):
+    (tmp_path / "us.json").write_text(json.dumps({
+        "timezone": "America/New_York",
+        "holidays": [
+            "2024-07-04",
+            {"date": "2024-07-03", "name": "Half-day", "hours": [["09:00", "13:00"]]},
+        ],
+    }))
+    calendars.configure_calendars(str(tmp_path))
+
+
+def test_duration_skips_nights_and_weekends():
+    calendar = calendars.get_calendar()
+    friday = datetime(2024, 3, 15, 15, tzinfo=timezone.utc)
+    monday = datetime(2024, 3, 18, 10, tzinfo=timezone.utc)
+    assert calendar.working_seconds(friday, monday) == 3 * 3600
+    assert calendar.working_seconds(monday, friday) == -3 * 3600
+    # Far-apart dates go through the same index.
+    later = datetime(2034, 3, 17, 10, tzinfo=timezone.utc)
+    assert calendar.working_seconds(monday, later) % 3600 == 0
+
+
+def test_add_working_time_boundaries():
+    calendar = calendars.get_calendar()
+    monday = datetime(2024, 3, 18, 9, tzinfo=timezone.utc)
+    assert calendar.add_working_seconds(monday, 8 * 3600) == datetime(2024, 3, 18, 17, tzinfo=timezone.utc)
+    assert calendar.add_working_seconds(monday, -3600) == datetime(2024, 3, 15, 16, tzinfo=timezone.utc)
+    assert calendar.add_working_days(monday, -1) == datetime(2024, 3, 15, 9, tzinfo=timezone.utc)
+    assert calendar.add_working_days(monday, 5) == datetime(2024, 3, 25, 9, tzinfo=timezone.utc)
+
+
+def test_holidays_and_half_days_from_file(us_calendar):
+    assert calendars.calendar_names() == ["default", "us"]
+    result = business.add_business_time(models.AddBusinessTimeInput(
+        start_timestamp="2024-07-03T10:00:00-04:00", amount=6, unit="hours",
+        timezone="America/New_York", calendar="us",
+    ))
+    assert result.adjusted_timestamp_iso == "2024-07-05T12:00:00-04:00"
+
+    duration = business.business_duration(models.BusinessDurationInput(
+        start_timestamp="2024-07-03T14:00:00Z", end_timestamp="2024-07-05T14:00:00Z", calendar="us",
+    ))
+    assert duration.total_seconds == 3 * 3600 + 1 * 3600
+    assert duration.formatted_duration == "4 hours"
+
+    with pytest.raises(ValueError, match="Unknown calendar: nope. Available: default, us."):
+        calendars.get_calendar("nope")
+
+
+async def test_calendar_option_on_core_tools():
+    server = create_server(response_format="json")
+    payload = json.loads(await call_tool(server, "calculate_difference", {
+        "start_timestamp": "2024-03-15 15:00", "end_timestamp": "2024-03-18 10:00", "calendar": "default",
+    }))
+    assert payload == {"total_seconds": 10800.0, "is_negative": False, "formatted_duration": "3 hours"}
+
+    payload = json.loads(await call_tool(server, "adjust_timestamp", {
+        "start_timestamp": "2024-03-15 10:00", "delta_value": 1, "delta_unit": "days", "calendar": "default",
+    }))
+    assert payload["adjusted_timestamp_iso"] == "2024-03-18T10:00:00+00:00"
+
+
+async def test_process_executor_workers_see_calendar_dir(us_calendar, tmp_path):
+    """Spawned pool workers get --calendar-dir from the CLI, not only from the environment."""
+    parser = argparse.ArgumentParser()
+    cli.add_common_arguments(parser)
+    cli.apply_common_arguments(parser.parse_args([
+        "--executor", "process", "--executor-workers", "1", "--offload-threshold", "0",
+        "--calendar-dir", str(tmp_path),
+    ]))
+    try:
+        result = await executor.get_executor().run(business.business_duration, models.BusinessDurationInput(
+            start_timestamp="2024-07-03T09:00:00", end_timestamp="2024-07-05T17:00:00", timezone="America/New_York",
+            calendar="us",
+        ))
+        assert executor.get_executor_stats()["offloaded"] == 1
+    finally:
+        executor.configure_executor()
+    # Half of the 3rd, none of the 4th (a holiday), all of the 5th.
+    assert result.total_seconds == 12 * 3600
@@ -0,0 +1,76 @@
+"""Tests for the shared clock behind get_current_time."""
+import threading
+import time
+
+import pytest
+
+from temporal_awareness_mcp import clock
+from temporal_awareness_mcp.models import GetCurrentTimeInput
+from temporal_awareness_mcp.tools.core import get_current_time
+
+
+# Long enough that a test never straddles a tick boundary in practice.
+HOUR_MS = 3_600_000
+
+
+@pytest.fixture(autouse=True)
+def fresh_clock():
+    clock.configure_clock(clock.DEFAULT_CLOCK_TICK_MS)
+    clock.clear_clock()
+    yield
+    clock.configure_clock(clock.DEFAULT_CLOCK_TICK_MS)
+    clock.clear_clock()
+
+
+def test_readings_in_one_tick_share_a_snapshot():
+    """Calls within a tick get the same snapshot; the next tick computes a new one."""
+    clock.configure_clock(HOUR_MS)
+    first = get_current_time(GetCurrentTimeInput(timezone="Asia/Tokyo"))
+    second = get_current_time(GetCurrentTimeInput(timezone="Asia/Tokyo", format="human"))
+    assert second is first
+    assert first.day_of_week == first.formatted_timestamp.split(",")[0]
+
+    clock.configure_clock(1)
+    time.sleep(0.005)
+    assert get_current_time(GetCurrentTimeInput(timezone="Asia/Tokyo")).unix_timestamp > first.unix_timestamp
+
+
+def test_precise_and_zero_tick_bypass_the_snapshot():
+    """precise=True and a tick of 0 read the clock on every call."""
+    clock.configure_clock(HOUR_MS)
+    shared = get_current_time(GetCurrentTimeInput(timezone="UTC"))
+    precise = get_current_time(GetCurrentTimeInput(timezone="UTC", precise=True))
+    assert precise is not shared
+    assert precise.unix_timestamp >= shared.unix_timestamp
+
+    clock.configure_clock(0)
+    assert get_current_time(GetCurrentTimeInput(timezone="UTC")) is not get_current_time(
+        GetCurrentTimeInput(timezone="UTC")
+    )
+    assert clock.get_clock_stats()["computed"] == 1
+
+
+def test_concurrent_misses_compute_once():
+    """Threads asking for a stale zone at once share one computation."""
+    clock.configure_clock(HOUR_MS)
+    barrier = threading.Barrier(8)
+    readings = []
+
+    def read():
+        barrier.wait()
+        readings.append(clock.read_clock("Europe/Paris"))
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert clock.get_clock_stats()["served"] == 8
+    assert clock.get_clock_stats()["computed"] == 1
+    assert all(reading is readings[0] for reading in readings)
+
+
+def test_invalid_zones_are_not_stored():
+    with pytest.raises(ValueError, match="is not valid"):
+        get_current_time(GetCurrentTimeInput(timezone="Not/AZone"))
+    assert clock.get_clock_stats()["computed"] == 0
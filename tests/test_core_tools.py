@@ -9,11 +9,13 @@ from temporal_awareness_mcp.models import (
     GetCurrentTimeInput,
     CalculateDifferenceInput,
     AdjustTimestampInput,
+    ConvertTimezoneInput,
 )
 from temporal_awareness_mcp.tools.core import (
     get_current_time,
     calculate_difference,
     adjust_timestamp,
+    convert_timezone,
 )
 
 def test_get_current_time_direct_utc():
@@ -109,4 +111,32 @@ def test_adjust_timestamp_add_weeks_and_change_timezone():
         timezone="America/Los_Angeles"
     )
     result = adjust_timestamp(test_input)
-    assert result.adjusted_timestamp_iso == "2025-01-15T00:00:00-08:00"
\ No newline at end of file
+    assert result.adjusted_timestamp_iso == "2025-01-15T00:00:00-08:00"
+
+def test_convert_timezone_fan_out():
+    """Tests converting one instant into several zones, across a DST difference."""
+    result = convert_timezone(ConvertTimezoneInput(
+        timestamp="2024-03-20T09:00:00-04:00",
+        target_timezones=["Europe/London", "Asia/Kolkata", "America/New_York", "Europe/London"],
+        honor_offset=True,
+    ))
+    assert result.utc_timestamp == "2024-03-20T13:00:00+00:00"
+    assert [c.iso_timestamp for c in result.conversions] == [
+        "2024-03-20T13:00:00+00:00",
+        "2024-03-20T18:30:00+05:30",
+        "2024-03-20T09:00:00-04:00",
+        "2024-03-20T13:00:00+00:00",
+    ]
+    assert result.conversions[1].utc_offset == "+05:30"
+    assert result.conversions[2].abbreviation == "EDT"
+
+    # Without honor_offset the wall-clock time is read in the source zone.
+    result = convert_timezone(ConvertTimezoneInput(
+        timestamp="2024-03-20T09:00:00-04:00", timezone="Asia/Tokyo", target_timezones=["UTC"],
+    ))
+    assert result.utc_timestamp == "2024-03-20T00:00:00+00:00"
+
+def test_convert_timezone_invalid_target():
+    """Tests that an unknown target zone is reported by name."""
+    with pytest.raises(ValueError, match="Mars/Base"):
+        convert_timezone(ConvertTimezoneInput(target_timezones=["UTC", "Mars/Base"]))
@@ -0,0 +1,68 @@
+"""
+Tests for duration formatting and the calculate_difference format options.
+"""
+from typing import get_args
+
+import pytest
+
+from pydantic import ValidationError
+
+from temporal_awareness_mcp import durations, models
+from temporal_awareness_mcp.tools.batch import batch_calculate_difference
+from temporal_awareness_mcp.tools.core import calculate_difference
+
+SECOND = 1_000_000
+DAY = 86400 * SECOND
+
+
+@pytest.mark.parametrize("microseconds, style, options, expected", [
+    (0, "long", {}, "0 seconds"),
+    (-(DAY + 3600 * SECOND + 5 * SECOND), "long", {}, "1 day, 1 hour, 5 seconds"),
+    (1_500_000, "long", {}, "1 second"),
+    (2 * DAY + 3 * 3600 * SECOND, "compact", {}, "2d 3h"),
+    (50 * 3600 * SECOND, "long", {"largest_unit": "hours"}, "50 hours"),
+    (10 * DAY, "long", {"largest_unit": "weeks"}, "1 week, 3 days"),
+    (DAY + 5 * SECOND, "long", {"max_parts": 2}, "1 day"),
+    (1_234_567, "compact", {"smallest_unit": "milliseconds"}, "1s 234ms"),
+    (90061 * SECOND + 500_000, "iso", {"smallest_unit": "milliseconds"}, "P1DT1H1M1.5S"),
+    (400 * DAY, "iso", {"largest_unit": "years"}, "P1Y1M5D"),
+    (0, "iso", {}, "PT0S"),
+])
+def test_format_duration(microseconds, style, options, expected):
+    assert durations.format_duration(microseconds, style, **options) == expected
+
+
+def test_units_match_the_input_model():
+    assert get_args(models.DurationUnit) == durations.DURATION_UNITS
+
+
+@pytest.mark.parametrize("options", [
+    {"largest_unit": "minutes", "smallest_unit": "hours"},
+    {"smallest_unit": "weeks"},
+    {"smallest_unit": "days", "calendar": "default"},
+])
+def test_inverted_units_are_rejected_by_the_model(options):
+    with pytest.raises(ValidationError, match="must not be smaller than smallest_unit"):
+        models.CalculateDifferenceInput(start_timestamp="2024-01-01", end_timestamp="2024-01-02", **options)
+
+
+def test_calculate_difference_options():
+    """Options apply to plain, business-time and batch differences."""
+    plain = calculate_difference(models.CalculateDifferenceInput(
+        start_timestamp="2024-01-01T00:00:00", end_timestamp="2024-01-03T02:30:00",
+        duration_style="compact", largest_unit="hours",
+    ))
+    assert plain.formatted_duration == "50h 30m"
+
+    working = calculate_difference(models.CalculateDifferenceInput(
+        start_timestamp="2024-01-01T09:00:00", end_timestamp="2024-01-02T12:00:00",
+        calendar="default", duration_style="iso",
+    ))
+    assert working.formatted_duration == "PT11H"
+
+    output = batch_calculate_difference([
+        models.CalculateDifferenceInput(
+            start_timestamp="2024-01-01", end_timestamp="2024-01-02", duration_style="iso"
+        ),
+    ])
+    assert output.results[0].result.formatted_duration == "P1D"
@@ -0,0 +1,74 @@
+"""
+Tests for the tool executor layer.
+"""
+import asyncio
+import threading
+import pytest
+
+from temporal_awareness_mcp import executor, models
+from temporal_awareness_mcp.tools import contextual, core
+
+
+def difference(start="2024-01-01T10:00:00", end="2024-01-01T12:00:00"):
+    return models.CalculateDifferenceInput(start_timestamp=start, end_timestamp=end)
+
+
+def test_estimate_cost():
+    assert executor.estimate_cost(models.GetCurrentTimeInput()) == 0
+    assert executor.estimate_cost(difference()) == 2
+    assert executor.estimate_cost(difference(end="next to the big clock")) == 2 + executor.DATEUTIL_COST
+    # Batch items that failed validation are error strings and cost nothing.
+    assert executor.estimate_cost([difference(), "bad item", difference()]) == 4
+
+
+async def test_cheap_calls_run_inline():
+    pool = executor.ToolExecutor("thread", cost_threshold=10)
+    result = await pool.run(core.calculate_difference, difference())
+    assert result.total_seconds == 7200
+    assert pool.stats()["inline"] == 1
+    assert pool.stats()["offloaded"] == 0
+
+
+async def test_single_free_form_call_is_offloaded_by_default():
+    pool = executor.ToolExecutor("thread", max_workers=1)
+    try:
+        await pool.run(core.calculate_difference, difference())
+        result = await pool.run(contextual.get_timestamp_context, models.GetTimestampContextInput(
+            timestamp="March 15, 2024 2:30 PM"
+        ))
+    finally:
+        pool.shutdown()
+    assert result.day_of_week == "Friday"
+    assert pool.stats()["inline"] == 1
+    assert pool.stats()["offloaded"] == 1
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+async def test_heavy_calls_are_offloaded(mode):
+    pool = executor.ToolExecutor(mode, max_workers=1, cost_threshold=0)
+    try:
+        result = await pool.run(core.calculate_difference, difference(end="January 2, 2024 10:00 AM"))
+    finally:
+        pool.shutdown()
+    assert result.total_seconds == 86400
+    stats = pool.stats()
+    assert stats["offloaded"] == 1
+    assert stats["queue_depth"] == 0
+    assert stats["wait_seconds_total"] >= 0
+
+
+async def test_full_queue_is_refused():
+    pool = executor.ToolExecutor("thread", max_workers=1, max_queue=1, cost_threshold=0)
+    release = threading.Event()
+    blocked = asyncio.ensure_future(pool.run(lambda _: release.wait(5), difference()))
+    await asyncio.sleep(0.01)
+    try:
+        with pytest.raises(executor.ExecutorSaturatedError, match="busy"):
+            await pool.run(core.calculate_difference, difference())
+        assert pool.stats()["queue_depth"] == 1
+    finally:
+        release.set()
+        await blocked
+        pool.shutdown()
+    assert pool.stats()["rejected"] == 1
+    assert pool.stats()["peak_queue_depth"] == 1
@@ -0,0 +1,64 @@
+"""
+Tests for the HTTP app: the streamable-HTTP endpoint and health reporting.
+"""
+import json
+from contextlib import asynccontextmanager
+
+import httpx
+
+from temporal_awareness_mcp.server import create_server
+
+HEADERS = {"Accept": "application/json, text/event-stream"}
+
+
+@asynccontextmanager
+async def http_client(json_response=True):
+    # Entered inside the test: the session manager's task group must be
+    # exited from the task that entered it.
+    app = create_server().build_http_app(json_response=json_response)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+
+def tool_call(name, arguments, request_id=1):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": arguments},
+    }
+
+
+async def test_streamable_http_single_post():
+    """A stateless call needs no initialize handshake and no session header."""
+    async with http_client() as client:
+        response = await client.post("/mcp", headers=HEADERS, json=tool_call(
+            "calculate_difference",
+            {"start_timestamp": "2024-01-01T10:00:00", "end_timestamp": "2024-01-01T12:00:00"},
+        ))
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    assert "mcp-session-id" not in response.headers
+    assert response.json()["result"]["content"][0]["text"] == "2 hours"
+
+
+async def test_streamable_http_streaming_response():
+    async with http_client(json_response=False) as client:
+        response = await client.post("/mcp", headers=HEADERS, json=tool_call(
+            "adjust_timestamp",
+            {"start_timestamp": "2024-07-20 12:00:00", "delta_value": 5, "delta_unit": "days"},
+        ))
+    assert response.headers["content-type"].startswith("text/event-stream")
+    data = [line[5:] for line in response.text.splitlines() if line.startswith("data:")]
+    result = json.loads(data[-1])["result"]
+    assert result["content"][0]["text"] == "Original: 2024-07-20T12:00:00+00:00, Adjusted: 2024-07-25T12:00:00+00:00"
+
+
+async def test_health():
+    async with http_client() as client:
+        response = await client.get("/health")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+    assert response.json()["active_sessions"] == 0
@@ -0,0 +1,70 @@
+"""Tests for the in-process metrics and the /metrics endpoint."""
+import re
+
+import pytest
+from mcp.shared.exceptions import McpError
+
+from temporal_awareness_mcp import metrics
+from tests.test_http_app import http_client
+from tests.test_server import call_tool
+from temporal_awareness_mcp.server import create_server
+
+DIFFERENCE = {"start_timestamp": "2024-01-01T10:00:00", "end_timestamp": "2024-01-01T12:00:00"}
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    metrics.configure_metrics(True)
+    metrics.reset_metrics()
+    yield
+    metrics.configure_metrics(True)
+    metrics.reset_metrics()
+
+
+def sample(text, name, **labels):
+    label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    pattern = "^" + re.escape(name + ("{" + label_text + "}" if labels else "")) + r" (\S+)"
+    match = re.search(pattern, text, re.MULTILINE)
+    return float(match.group(1)) if match else None
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = metrics.Histogram((0.001, 0.01))
+    for value in (0.0005, 0.001, 0.005, 1.0):
+        histogram.observe(value)
+    assert list(histogram.cumulative()) == [("0.001", 2), ("0.01", 3), ("+Inf", 4)]
+    assert histogram.count == 4
+
+
+async def test_calls_errors_and_phases_are_recorded():
+    server = create_server()
+    await call_tool(server, "calculate_difference", DIFFERENCE)
+    await call_tool(server, "calculate_difference", {**DIFFERENCE, "end_timestamp": "not a date"})
+    with pytest.raises(McpError):
+        await call_tool(server, "no_such_tool", {})
+
+    text = metrics.render_metrics()
+    assert sample(text, "temporal_mcp_tool_calls_total", tool="calculate_difference") == 2
+    assert sample(text, "temporal_mcp_tool_errors_total", tool="calculate_difference", error="ValueError") == 1
+    assert sample(text, "temporal_mcp_tool_errors_total", tool="unknown", error="ValueError") == 1
+    for phase in metrics.PHASES:
+        assert sample(
+            text, "temporal_mcp_tool_latency_seconds_count", tool="calculate_difference", phase=phase
+        ) == 1
+    assert sample(text, "temporal_mcp_parse_tier_total", tier="iso") is not None
+
+
+async def test_disabled_metrics_record_nothing():
+    metrics.configure_metrics(False)
+    server = create_server()
+    assert await call_tool(server, "calculate_difference", DIFFERENCE) == "2 hours"
+    assert "temporal_mcp_tool_calls_total{" not in metrics.render_metrics()
+
+
+async def test_metrics_endpoint():
+    async with http_client() as client:
+        response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert sample(response.text, "temporal_mcp_active_sse_sessions") == 0
+    assert "# TYPE temporal_mcp_tool_latency_seconds histogram" in response.text
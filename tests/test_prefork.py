@@ -0,0 +1,95 @@
+"""Tests for the prefork stdio daemon and its launcher."""
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from temporal_awareness_mcp import launcher, prefork
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "t", "version": "0"}},
+}
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    path = str(tmp_path / "daemon.sock")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "temporal_awareness_mcp.prefork", "--socket", path, "--pool-size", "1"],
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while not os.path.exists(path):
+        assert process.poll() is None and time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.05)
+    yield path
+    process.terminate()
+    process.wait(timeout=10)
+    assert not os.path.exists(path)
+
+
+def launch(*args):
+    return subprocess.Popen(
+        [sys.executable, "-m", "temporal_awareness_mcp.launcher", *args],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+
+
+def request(process, message):
+    process.stdin.write((json.dumps(message) + "\n").encode())
+    process.stdin.flush()
+    if "id" in message:
+        return json.loads(process.stdout.readline())
+
+
+def test_attached_sessions_are_served_by_the_daemon(daemon):
+    """Each launcher gets its own session; it ends when the host closes stdin."""
+    for _ in range(2):
+        launcher = launch("--socket", daemon, "--no-fallback")
+        assert request(launcher, INITIALIZE)["result"]["serverInfo"]["name"] == "temporal-awareness-mcp"
+        request(launcher, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        response = request(launcher, {
+            "jsonrpc": "2.0", "id": 2, "method": "tools/call",
+            "params": {"name": "calculate_difference", "arguments": {
+                "start_timestamp": "2024-01-01T10:00:00", "end_timestamp": "2024-01-01T12:00:00",
+            }},
+        })
+        assert response["result"]["content"][0]["text"] == "2 hours"
+        launcher.stdin.close()
+        assert launcher.wait(timeout=10) == 0
+
+
+def test_launcher_without_daemon(tmp_path):
+    launcher = launch("--socket", str(tmp_path / "missing.sock"), "--no-fallback")
+    _, stderr = launcher.communicate(timeout=10)
+    assert launcher.returncode == 1
+    assert b"no daemon" in stderr
+
+
+def test_launcher_only_attaches_to_own_user(tmp_path, monkeypatch):
+    """Descriptors go only to a daemon with this user's uid; the fallback dir must be private."""
+    path = str(tmp_path / "other.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(path)
+        listener.listen(1)
+        launcher.connect(path).close()
+        monkeypatch.setattr(launcher.os, "getuid", lambda: os.geteuid() + 1)
+        with pytest.raises(PermissionError, match="served by uid"):
+            launcher.connect(path)
+    monkeypatch.undo()
+
+    private = tmp_path / "private"
+    prefork.make_private_dir(str(private))
+    assert private.stat().st_mode & 0o777 == 0o700
+    private.chmod(0o755)
+    with pytest.raises(SystemExit, match="mode 0700"):
+        prefork.make_private_dir(str(private))
@@ -0,0 +1,77 @@
+"""
+Tests for the expand_recurrence tool.
+"""
+import pytest
+
+from temporal_awareness_mcp import executor, models
+from temporal_awareness_mcp.tools import recurrence
+
+
+def expand(rule, start, **kwargs):
+    return recurrence.expand_recurrence(models.ExpandRecurrenceInput(rule=rule, start_timestamp=start, **kwargs))
+
+
+def test_pages_follow_cursor():
+    first = expand("RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=TU", "2024-01-02 09:00", timezone="America/New_York", limit=3)
+    assert first.occurrences == [
+        "2024-01-02T09:00:00-05:00", "2024-01-16T09:00:00-05:00", "2024-01-30T09:00:00-05:00"
+    ]
+    second = expand(
+        "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU", "2024-01-02 09:00",
+        timezone="America/New_York", limit=3, cursor=first.next_cursor,
+    )
+    # Wall-clock time is kept across the March DST change.
+    assert second.occurrences == [
+        "2024-02-13T09:00:00-05:00", "2024-02-27T09:00:00-05:00", "2024-03-12T09:00:00-04:00"
+    ]
+
+
+def test_dst_gap_and_window():
+    result = expand("FREQ=DAILY", "2024-03-09 02:30", timezone="America/New_York", limit=3)
+    assert result.occurrences[1] == "2024-03-10T03:30:00-04:00"
+
+    # An infinite rule stops at the end of the window, without a cursor.
+    result = expand("FREQ=DAILY", "2024-01-01 08:00", after="2024-06-01", before="2024-06-03 12:00")
+    assert result.occurrences == ["2024-06-01T08:00:00+00:00", "2024-06-02T08:00:00+00:00",
+                                  "2024-06-03T08:00:00+00:00"]
+    assert result.next_cursor is None
+
+    result = expand("FREQ=MONTHLY;COUNT=2;BYMONTHDAY=31", "2024-01-01")
+    assert result.occurrences == ["2024-01-31T00:00:00+00:00", "2024-03-31T00:00:00+00:00"]
+
+
+def test_compiled_rules_are_cached():
+    recurrence.clear_rule_cache()
+    expand("FREQ=DAILY;COUNT=2", "2024-01-01")
+    expand("freq=daily;count=2", "2024-01-01", limit=1)
+    stats = recurrence.get_rule_cache_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+@pytest.mark.parametrize("rule, message", [
+    ("FREQ=FORTNIGHTLY", "Invalid recurrence rule"),
+    ("COUNT=3", "FREQ is required"),
+    ("DTSTART:20240101T000000\nRRULE:FREQ=DAILY", "single RRULE"),
+    ("FREQ=DAILY;UNTIL=20240105T000000", "UTC"),
+])
+def test_invalid_rules(rule, message):
+    with pytest.raises(ValueError, match=message):
+        expand(rule, "2024-01-01", timezone="Europe/Paris")
+
+
+@pytest.mark.parametrize("rule", ["FREQ=MINUTELY;BYMONTH=2;BYMONTHDAY=30", "FREQ=MONTHLY;BYMONTH=4,6;BYMONTHDAY=31"])
+def test_rules_without_occurrences_are_rejected(rule):
+    """dateutil would search until the year 9999; the rule is refused up front."""
+    with pytest.raises(ValueError, match="never produces an occurrence"):
+        expand(rule, "2024-01-01")
+    assert expand("FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=29;BYDAY=MO", "2024-01-01", limit=1).occurrences == [
+        "2044-02-29T00:00:00+00:00"
+    ]
+    input_data = models.ExpandRecurrenceInput(rule=rule, start_timestamp="2024-01-01")
+    assert executor.estimate_cost(input_data) >= executor.DEFAULT_COST_THRESHOLD
+
+
+def test_expansion_time_is_capped(monkeypatch):
+    monkeypatch.setattr(recurrence, "MAX_EXPANSION_SECONDS", -1)
+    with pytest.raises(ValueError, match="took too long"):
+        expand("FREQ=DAILY", "2024-01-01")
@@ -0,0 +1,42 @@
+"""
+Tests for the tool registry.
+"""
+import pytest
+from mcp.types import ListToolsRequest
+
+from temporal_awareness_mcp import registry
+from temporal_awareness_mcp.server import create_server
+
+
+def test_schemas_generated_from_models():
+    spec = registry.get_tool("adjust_timestamp")
+    schema = spec.input_schema
+    assert set(schema["required"]) == {"start_timestamp", "delta_value", "delta_unit"}
+    assert schema["properties"]["delta_unit"]["enum"] == ["weeks", "days", "hours", "minutes", "seconds"]
+    assert schema["properties"]["response_format"] is registry.RESPONSE_FORMAT_PROPERTY
+
+    # Batch tools always answer in JSON, so they take no response_format.
+    assert "response_format" not in registry.get_tool("batch_adjust_timestamp").input_schema["properties"]
+
+
+def test_unknown_tool():
+    with pytest.raises(ValueError, match="Unknown tool: nope"):
+        registry.get_tool("nope")
+
+
+def test_duplicate_registration_rejected():
+    spec = registry.get_tool("get_current_time")
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(spec)
+
+
+async def test_list_tools_serves_prebuilt_definitions():
+    server = create_server()
+    handler = server.server.request_handlers[ListToolsRequest]
+    first = (await handler(ListToolsRequest(method="tools/list"))).root.tools
+    second = (await handler(ListToolsRequest(method="tools/list"))).root.tools
+
+    assert [tool.name for tool in first] == list(registry.TOOLS)
+    assert len(first) == 13
+    assert all(a is b for a, b in zip(first, second))
+    assert first[0].inputSchema["properties"]["format"]["enum"] == ["iso", "human", "timestamp"]
@@ -0,0 +1,73 @@
+"""
+Tests for relative time expressions, against a fixed reference time.
+"""
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from temporal_awareness_mcp.relative import MAX_RELATIVE_LENGTH, looks_relative, parse_relative
+
+
+NEW_YORK = ZoneInfo("America/New_York")
+# A Friday, two days before the spring DST change.
+REFERENCE = datetime(2024, 3, 8, 10, 30, tzinfo=NEW_YORK)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("now", "2024-03-08T10:30:00-05:00"),
+    ("tomorrow", "2024-03-09T10:30:00-05:00"),
+    ("Tomorrow at noon", "2024-03-09T12:00:00-05:00"),
+    ("in 3 hours", "2024-03-08T13:30:00-05:00"),
+    ("in 1h30m", "2024-03-08T12:00:00-05:00"),
+    ("2 weeks ago", "2024-02-23T10:30:00-05:00"),
+    ("a day and 2 hours from now", "2024-03-09T12:30:00-05:00"),
+    ("in 1 hour , 30 mins", "2024-03-08T12:00:00-05:00"),
+    ("in 1 month", "2024-04-08T10:30:00-04:00"),
+    ("friday", "2024-03-08T00:00:00-05:00"),
+    ("next Friday at 5pm", "2024-03-15T17:00:00-04:00"),
+    ("last fri", "2024-03-01T00:00:00-05:00"),
+    ("on monday at 9:15 am", "2024-03-11T09:15:00-04:00"),
+    ("5pm", "2024-03-08T17:00:00-05:00"),
+    ("end of month", "2024-03-31T23:59:59-04:00"),
+    ("start of next week", "2024-03-11T00:00:00-04:00"),
+    ("end of the year", "2024-12-31T23:59:59-05:00"),
+    ("next month", "2024-04-08T10:30:00-04:00"),
+])
+def test_expressions(text, expected):
+    assert parse_relative(text, REFERENCE).isoformat() == expected
+
+
+def test_dst_boundaries():
+    # Elapsed units count real time, calendar units keep the local time.
+    assert parse_relative("in 48 hours", REFERENCE).isoformat() == "2024-03-10T11:30:00-04:00"
+    assert parse_relative("in 2 days", REFERENCE).isoformat() == "2024-03-10T10:30:00-04:00"
+    # 02:30 does not exist on the 10th and moves forward by the gap.
+    assert parse_relative("sunday 2:30am", REFERENCE).isoformat() == "2024-03-10T03:30:00-04:00"
+    # Months clamp to the end of shorter months.
+    end_of_january = datetime(2024, 1, 31, tzinfo=NEW_YORK)
+    assert parse_relative("in 1 month", end_of_january).date().isoformat() == "2024-02-29"
+
+
+@pytest.mark.parametrize("text", ["March 15, 2024", "friday 3", "2 pm tomorrow", ""])
+def test_other_text_is_not_relative(text):
+    assert parse_relative(text, REFERENCE) is None
+
+
+def test_invalid_values():
+    with pytest.raises(ValueError, match="whole numbers"):
+        parse_relative("in 1.5 months", REFERENCE)
+    with pytest.raises(ValueError, match="Invalid hour"):
+        parse_relative("13pm", REFERENCE)
+
+
+@pytest.mark.parametrize("text", ["1h " * 42 + "x", "1 h and " * 15 + "x", "1 , 2h" * 20 + "x"])
+def test_near_misses_fail_fast(text):
+    """Long almost-durations are rejected in linear time, not by exponential backtracking."""
+    assert len(text) <= MAX_RELATIVE_LENGTH
+    started = time.perf_counter()
+    assert parse_relative(text, REFERENCE) is None
+    assert not looks_relative(text)
+    assert time.perf_counter() - started < 0.1
+    assert not looks_relative("in " + "1h" * MAX_RELATIVE_LENGTH)
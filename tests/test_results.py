@@ -0,0 +1,42 @@
+"""
+Tests that the handlers' result types match the documented output models.
+"""
+import json
+from dataclasses import fields
+
+import pytest
+
+from temporal_awareness_mcp import models, results
+
+
+PAIRS = [
+    (results.CurrentTime, models.GetCurrentTimeOutput),
+    (results.Difference, models.CalculateDifferenceOutput),
+    (results.TimestampContext, models.GetTimestampContextOutput),
+    (results.AdjustedTimestamp, models.AdjustTimestampOutput),
+    (results.TimezoneConversion, models.TimezoneConversion),
+    (results.Conversions, models.ConvertTimezoneOutput),
+    (results.Occurrences, models.ExpandRecurrenceOutput),
+    (results.IntervalStats, models.IntervalStats),
+    (results.TimelineGap, models.TimelineGap),
+    (results.Timeline, models.AnalyzeTimelineOutput),
+    (results.BatchItem, models.BatchItemResult),
+    (results.Batch, models.BatchCalculateDifferenceOutput),
+]
+
+
+@pytest.mark.parametrize("result_type, model", PAIRS)
+def test_fields_match_output_models(result_type, model):
+    assert [f.name for f in fields(result_type)] == list(model.model_fields)
+
+
+def test_json_matches_model_dump():
+    difference = {"total_seconds": 60.0, "is_negative": False, "formatted_duration": "1 minute"}
+    slotted = results.Batch([results.BatchItem(0, results.Difference(**difference)), results.BatchItem(1, error="bad")])
+    model = models.BatchCalculateDifferenceOutput.model_validate(
+        {"results": [{"index": 0, "result": difference}, {"index": 1, "error": "bad"}]}
+    )
+    assert results.to_json(slotted) == model.model_dump_json(exclude_none=True)
+
+    page = results.Occurrences(["2024-01-01T00:00:00+00:00"])
+    assert json.loads(results.to_json(page)) == {"occurrences": ["2024-01-01T00:00:00+00:00"]}
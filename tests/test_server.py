@@ -1,5 +1,8 @@
 """Tests for the MCP server implementation."""
+import json
 import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import INVALID_PARAMS, CallToolRequest, CallToolRequestParams
 from temporal_awareness_mcp.server import create_server
 from temporal_awareness_mcp.models import (
     GetCurrentTimeInput,
@@ -64,4 +67,82 @@ def test_expected_tools_count():
     ]
     
     # This tests that our server is properly configured with tools
-    assert len(expected_tools) == 4  # We expect 4 tools
\ No newline at end of file
+    assert len(expected_tools) == 4  # We expect 4 tools
+
+
+async def call_tool(server, name, arguments):
+    handler = server.server.request_handlers[CallToolRequest]
+    response = await handler(CallToolRequest(
+        method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments)
+    ))
+    return response.root.content[0].text
+
+
+@pytest.mark.parametrize("fmt, check", [
+    ("iso", lambda text: "T" in text),
+    ("human", lambda text: " at " in text),
+    ("timestamp", lambda text: text.isdigit()),
+])
+async def test_get_current_time_honors_format(fmt, check):
+    text = await call_tool(create_server(), "get_current_time", {"timezone": "UTC", "format": fmt})
+    assert check(text)
+
+
+async def test_json_response_format_returns_full_model():
+    text = await call_tool(create_server(), "calculate_difference", {
+        "start_timestamp": "2024-01-01 10:00:00",
+        "end_timestamp": "2024-01-01 12:00:00",
+        "response_format": "json",
+    })
+    assert json.loads(text) == {
+        "total_seconds": 7200.0, "is_negative": False, "formatted_duration": "2 hours"
+    }
+
+
+async def test_server_default_response_format():
+    server = create_server(response_format="json")
+    payload = json.loads(await call_tool(server, "get_timestamp_context", {"timestamp": "2024-03-16 14:00"}))
+    assert payload["day_of_week"] == "Saturday"
+    assert payload["is_weekend"] is True
+
+    text = await call_tool(server, "get_timestamp_context", {"timestamp": "nonsense"})
+    assert "Could not parse" in json.loads(text)["error"]
+
+    text = await call_tool(server, "get_timestamp_context", {
+        "timestamp": "2024-03-16 14:00", "response_format": "text"
+    })
+    assert text.startswith("Day: Saturday")
+
+
+async def test_invalid_arguments_are_a_structured_error():
+    """Validation failures are JSON-RPC errors listing every problem; tool failures stay results."""
+    server = create_server()
+    with pytest.raises(McpError) as raised:
+        await call_tool(server, "adjust_timestamp", {"start_timestamp": "2024-01-01", "delta_unit": "fortnights"})
+    error = raised.value.error
+    assert error.code == INVALID_PARAMS
+    assert error.message.startswith("Invalid arguments for adjust_timestamp: delta_value: Field required")
+    assert error.data["tool"] == "adjust_timestamp"
+    assert [problem["field"] for problem in error.data["errors"]] == ["delta_value", "delta_unit"]
+
+    with pytest.raises(McpError) as raised:
+        await call_tool(server, "calculate_difference", {
+            "start_timestamp": "2024-01-01", "end_timestamp": "2024-01-02",
+            "largest_unit": "seconds", "smallest_unit": "hours",
+        })
+    error = raised.value.error
+    assert error.code == INVALID_PARAMS
+    assert error.message == (
+        "Invalid arguments for calculate_difference: "
+        "Value error, largest_unit (seconds) must not be smaller than smallest_unit (hours)."
+    )
+
+    with pytest.raises(McpError, match="Unknown tool: nope"):
+        await call_tool(server, "nope", {})
+
+    handler = server.server.request_handlers[CallToolRequest]
+    response = await handler(CallToolRequest(method="tools/call", params=CallToolRequestParams(
+        name="get_timestamp_context", arguments={"timestamp": "nonsense"}
+    )))
+    assert response.root.isError
+    assert response.root.content[0].text.startswith("Error: Could not parse")
@@ -0,0 +1,16 @@
+"""Tests that the stdio entry point starts without loading deferred modules."""
+import subprocess
+import sys
+
+
+def test_stdio_main_defers_heavy_imports():
+    """NumPy, dateutil, the vector engine and the relative grammar load on first use, not at startup."""
+    code = (
+        "import sys, temporal_awareness_mcp.stdio_main; "
+        "print(','.join(m for m in ('numpy', 'dateutil', 'temporal_awareness_mcp.vectorized', "
+        "'temporal_awareness_mcp.relative') if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    assert output == ""
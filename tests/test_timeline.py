@@ -0,0 +1,66 @@
+"""
+Tests for the analyze_timeline tool.
+"""
+import pytest
+
+from temporal_awareness_mcp import executor, models, utils
+from temporal_awareness_mcp.tools.timeline import analyze_timeline
+
+
+def analyze(**kwargs):
+    return analyze_timeline(models.AnalyzeTimelineInput(**kwargs))
+
+
+def test_intervals_gaps_and_histograms():
+    result = analyze(timestamps=[
+        "2024-03-04 09:00",  # Monday
+        "2024-03-04 09:10",
+        "2024-03-04 08:00",  # out of order, before business hours
+        "2024-03-04 12:10",
+        "2024-03-09 10:00",  # Saturday
+    ], top_gaps=2)
+    assert result.count == 5 and result.invalid_count == 0
+    assert result.out_of_order == 1
+    assert result.first_timestamp == "2024-03-04T08:00:00+00:00"
+    assert result.last_timestamp == "2024-03-09T10:00:00+00:00"
+    # Sorted intervals: 60, 10, 180 minutes, then Monday 12:10 to Saturday 10:00.
+    assert result.intervals.min_seconds == 600
+    assert result.intervals.median_seconds == (3600 + 10800) / 2
+    assert result.intervals.mean_seconds == (5 * 86400 + 7200) / 4
+    assert [gap.start_timestamp for gap in result.largest_gaps] == [
+        "2024-03-04T12:10:00+00:00", "2024-03-04T09:10:00+00:00"
+    ]
+    assert result.largest_gaps[1].formatted_duration == "3 hours"
+    assert result.by_hour[9] == 2 and sum(result.by_hour) == 5
+    assert result.by_weekday["Monday"] == 4 and result.by_weekday["Saturday"] == 1
+    assert result.by_day == {"2024-03-04": 4, "2024-03-09": 1}
+    assert result.outside_business_hours == 2
+
+
+def test_text_input_reports_invalid_lines():
+    """Lines are parsed like any timestamp argument; bad ones are counted, not fatal."""
+    text = "2024-01-01T10:00:00Z\n\nnot a time\n1704106800\r\n"
+    result = analyze(timestamps_text=text, timezone="Europe/Paris", honor_offset=True)
+    assert result.count == 2
+    assert result.invalid_count == 1
+    assert result.errors == ["Line 3: Could not parse the timestamp string: 'not a time'"]
+    assert result.first_timestamp == "2024-01-01T11:00:00+01:00"
+    assert result.intervals.max_seconds == 3600
+    assert result.by_hour[11] == 1 and result.by_hour[12] == 1
+
+
+def test_input_rules_and_empty_results():
+    with pytest.raises(ValueError, match="either timestamps or timestamps_text"):
+        analyze()
+    with pytest.raises(ValueError, match="either timestamps or timestamps_text"):
+        analyze(timestamps=["2024-01-01"], timestamps_text="2024-01-01")
+    result = analyze(timestamps=["2024-01-01"])
+    assert result.intervals is None and result.largest_gaps == []
+    assert analyze(timestamps=[]).first_timestamp is None
+
+
+def test_series_skip_the_parse_cache_and_are_costed_per_entry():
+    utils.clear_parse_cache()
+    analyze(timestamps=["2024-01-01", "2024-01-02"])
+    assert utils.get_parse_cache_stats()["size"] == 0
+    assert executor.estimate_cost(models.AnalyzeTimelineInput(timestamps_text="a\nb\nc")) == 3
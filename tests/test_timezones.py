@@ -0,0 +1,55 @@
+"""
+Tests for the timezone registry.
+"""
+import pytest
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from temporal_awareness_mcp.timezones import TimezoneRegistry, resolve_timezone
+from temporal_awareness_mcp.models import GetCurrentTimeInput
+from temporal_awareness_mcp.tools.core import get_current_time
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("UTC", "UTC"),
+    ("America/New_York", "America/New_York"),
+    ("us/pacific", "US/Pacific"),
+    ("america/new york", "America/New_York"),
+    ("EST", "EST"),
+    ("PST", "America/Los_Angeles"),
+    ("jst", "Asia/Tokyo"),
+])
+def test_resolves_keys_variants_and_aliases(name, expected):
+    assert resolve_timezone(name) is ZoneInfo(expected)
+
+
+def test_resolved_zones_are_cached():
+    registry = TimezoneRegistry()
+    first = registry.resolve("Europe/London")
+    second = registry.resolve("Europe/London")
+    assert first is second
+    assert registry.stats()["hits"] == 1
+    # Valid keys do not require building the index.
+    assert registry.stats()["indexed_names"] == 0
+
+
+def test_unknown_names_are_rejected_from_the_index():
+    registry = TimezoneRegistry()
+    for _ in range(3):
+        with pytest.raises(ZoneInfoNotFoundError):
+            registry.resolve("Mars/Olympus_Mons")
+    with pytest.raises(ZoneInfoNotFoundError):
+        registry.resolve("../../etc/passwd")
+
+    stats = registry.stats()
+    assert stats["rejections"] == 4
+    assert stats["indexed_names"] > 0
+
+
+def test_get_current_time_reports_canonical_zone():
+    result = get_current_time(GetCurrentTimeInput(timezone="pst"))
+    assert result.timezone == "America/Los_Angeles"
+
+
+def test_get_current_time_invalid_zone():
+    with pytest.raises(ValueError, match="is not valid"):
+        get_current_time(GetCurrentTimeInput(timezone="Not/AZone"))
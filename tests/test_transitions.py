@@ -0,0 +1,93 @@
+"""
+Tests for the zone transition index and absolute (elapsed-time) arithmetic.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, available_timezones
+
+import pytest
+
+from temporal_awareness_mcp import models, transitions
+from temporal_awareness_mcp.tools import core
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("key", ["America/New_York", "Australia/Lord_Howe", "Europe/Dublin"])
+def test_index_matches_zoneinfo_around_transitions(key):
+    zone = ZoneInfo(key)
+    index = transitions.transition_index(zone)
+    for utc_us in index.utc_transitions[::7]:
+        for step in (-1, 0, 1):
+            instant = utc_us + step * transitions.US_PER_SECOND
+            dt = (EPOCH + timedelta(microseconds=instant)).astimezone(zone)
+            assert index.offset_at_utc(instant) == dt.utcoffset() // timedelta(microseconds=1)
+            for fold in (0, 1):
+                local = dt.replace(fold=fold)
+                assert transitions.utc_us(local) == transitions.wall_us(local) - (
+                    local.utcoffset() // timedelta(microseconds=1)
+                )
+
+
+def _zoneinfo_offset_us(zone, utc_seconds):
+    return int(datetime.fromtimestamp(utc_seconds, zone).utcoffset().total_seconds()) * transitions.US_PER_SECOND
+
+
+def test_index_matches_zoneinfo_in_every_zone():
+    """Differential check: random instants, and either side of every transition, in all zones."""
+    rng = random.Random(0)
+    for key in sorted(available_timezones()):
+        zone = ZoneInfo(key)
+        index = transitions.transition_index(zone)
+        instants = [rng.randrange(transitions.TABLE_START, transitions.TABLE_END) for _ in range(200)]
+        for utc_us in index.utc_transitions:
+            second = utc_us // transitions.US_PER_SECOND
+            instants += [second - 1, second]
+        for instant in instants:
+            assert index.offset_at_utc(instant * transitions.US_PER_SECOND) == _zoneinfo_offset_us(
+                zone, instant
+            ), (key, instant)
+
+
+@pytest.mark.parametrize("day", ["2040-10-20", "2054-03-28", "2072-10-22"])
+def test_index_keeps_transitions_less_than_a_week_apart(day):
+    # Asia/Hebron suspends DST for a few days around these dates.
+    zone = ZoneInfo("Asia/Hebron")
+    instant = int(datetime.fromisoformat(day).replace(tzinfo=timezone.utc).timestamp())
+    index = transitions.transition_index(zone)
+    assert index.offset_at_utc(instant * transitions.US_PER_SECOND) == _zoneinfo_offset_us(zone, instant)
+
+
+def test_from_utc_us_sets_fold_for_repeated_hour():
+    zone = ZoneInfo("America/New_York")
+    # 2024-11-03 01:30 EDT and 01:30 EST are an hour apart.
+    first = datetime(2024, 11, 3, 5, 30, tzinfo=timezone.utc)
+    for instant in (first, first + timedelta(hours=1)):
+        expected = instant.astimezone(zone)
+        actual = transitions.from_utc_us((instant - EPOCH) // timedelta(microseconds=1), zone)
+        assert actual.fold == expected.fold
+        assert actual.isoformat() == expected.isoformat()
+
+
+def test_calculate_difference_absolute_across_dst():
+    start, end = "2024-03-10T00:00:00", "2024-03-10T05:00:00"
+    wall = core.calculate_difference(models.CalculateDifferenceInput(
+        start_timestamp=start, end_timestamp=end, timezone="America/New_York"
+    ))
+    absolute = core.calculate_difference(models.CalculateDifferenceInput(
+        start_timestamp=start, end_timestamp=end, timezone="America/New_York", arithmetic="absolute"
+    ))
+    assert wall.total_seconds == 5 * 3600
+    assert absolute.total_seconds == 4 * 3600
+    assert absolute.formatted_duration == "4 hours"
+
+
+def test_adjust_timestamp_absolute_across_dst():
+    def adjust(arithmetic):
+        return core.adjust_timestamp(models.AdjustTimestampInput(
+            start_timestamp="2024-03-10T01:00:00", delta_value=24, delta_unit="hours",
+            timezone="America/New_York", arithmetic=arithmetic,
+        )).adjusted_timestamp_iso
+
+    assert adjust("wall") == "2024-03-11T01:00:00-04:00"
+    assert adjust("absolute") == "2024-03-11T02:00:00-04:00"
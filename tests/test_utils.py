@@ -0,0 +1,145 @@
+"""
+Tests for the tiered timestamp parser.
+"""
+import pytest
+from datetime import datetime
+from dateutil import parser
+from zoneinfo import ZoneInfo
+
+from temporal_awareness_mcp import utils
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    utils.reset_parse_tier_counts()
+    utils.clear_parse_cache()
+    yield
+    utils.reset_parse_tier_counts()
+    utils.clear_parse_cache()
+
+
+@pytest.mark.parametrize("text", [
+    "2024-03-11",
+    "2024-03-11 10:30",
+    "2024-03-11T10:30:00",
+    "2024-03-11T10:30:00Z",
+    "2024-03-11t10:30:00.5+05:30",
+    "2024-03-11T10:30:00,123456789-0800",
+    "  2024-03-11T10:30:00+02  ",
+])
+def test_iso_fast_path_matches_dateutil(text):
+    """The ISO tier must agree with dateutil's ignoretz semantics."""
+    expected = parser.parse(text, ignoretz=True).replace(tzinfo=ZoneInfo("UTC"))
+    assert utils.robust_parse_datetime(text) == expected
+    assert utils.get_parse_tier_counts()["iso"] == 1
+    assert utils.get_parse_tier_counts()["dateutil"] == 0
+
+
+def test_epoch_seconds_and_millis():
+    """Epoch inputs are absolute instants converted into the requested zone."""
+    tz = "America/New_York"
+    expected = datetime(2023, 11, 14, 22, 13, 20, tzinfo=ZoneInfo("UTC"))
+
+    seconds = utils.robust_parse_datetime("1700000000", tz)
+    millis = utils.robust_parse_datetime("1700000000000", tz)
+    fractional = utils.robust_parse_datetime("1700000000.25", tz)
+
+    assert seconds == millis == expected
+    assert seconds.tzinfo == ZoneInfo(tz)
+    assert seconds.isoformat() == "2023-11-14T17:13:20-05:00"
+    assert fractional.microsecond == 250000
+    assert utils.get_parse_tier_counts()["epoch"] == 3
+
+
+@pytest.mark.parametrize("text", ["20250718120000", "202507181200", "20250718T1200"])
+def test_basic_format_is_not_read_as_epoch(text):
+    """Compact ISO 8601 date-times read as dateutil reads them, not as epoch millis."""
+    expected = parser.parse(text).replace(tzinfo=ZoneInfo("UTC"))
+    assert utils.robust_parse_datetime(text) == expected == datetime(2025, 7, 18, 12, tzinfo=ZoneInfo("UTC"))
+    assert utils.get_parse_tier_counts()["epoch"] == 0
+
+
+def test_digits_that_are_not_a_date_stay_epoch_millis():
+    result = utils.robust_parse_datetime("170000000000")
+    assert result == datetime(1975, 5, 22, 14, 13, 20, tzinfo=ZoneInfo("UTC"))
+    assert utils.get_parse_tier_counts()["epoch"] == 1
+
+
+def test_free_form_falls_back_to_dateutil():
+    result = utils.robust_parse_datetime("March 15, 2024 2:30 PM")
+    assert result == datetime(2024, 3, 15, 14, 30, tzinfo=ZoneInfo("UTC"))
+    assert utils.get_parse_tier_counts() == {"iso": 0, "epoch": 0, "relative": 0, "dateutil": 1}
+
+
+def test_invalid_iso_fields_fall_back_and_fail():
+    with pytest.raises(ValueError, match="Could not parse"):
+        utils.robust_parse_datetime("2024-13-45")
+    assert utils.get_parse_tier_counts()["dateutil"] == 1
+
+
+def test_invalid_timezone():
+    with pytest.raises(ValueError, match="not a valid IANA timezone"):
+        utils.robust_parse_datetime("2024-03-11", "Mars/Olympus_Mons")
+
+
+def test_parse_cache_hits_and_evictions():
+    utils.configure_parse_cache(2)
+    try:
+        first = utils.robust_parse_datetime("2024-03-11T10:30:00", "Europe/London")
+        second = utils.robust_parse_datetime("2024-03-11T10:30:00", "Europe/London")
+        assert first is second
+
+        # Same string in another zone is a different entry.
+        utils.robust_parse_datetime("2024-03-11T10:30:00", "Asia/Tokyo")
+        utils.robust_parse_datetime("2024-03-12", "UTC")
+
+        stats = utils.get_parse_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+        assert stats["evictions"] == 1
+        assert stats["size"] == 2
+        assert utils.get_parse_tier_counts()["iso"] == 3
+    finally:
+        utils.configure_parse_cache(utils.DEFAULT_PARSE_CACHE_SIZE)
+
+
+def test_parse_cache_disabled():
+    utils.configure_parse_cache(0)
+    try:
+        utils.robust_parse_datetime("2024-03-11")
+        utils.robust_parse_datetime("2024-03-11")
+        assert utils.get_parse_cache_stats()["misses"] == 0
+        assert utils.get_parse_tier_counts()["iso"] == 2
+    finally:
+        utils.configure_parse_cache(utils.DEFAULT_PARSE_CACHE_SIZE)
+
+
+@pytest.mark.parametrize("text", [
+    "2024-03-11T10:30:00Z",
+    "2024-03-11T16:00:00+05:30",
+    "2024-03-11T05:30:00-0500",
+    "March 11, 2024 10:30 UTC",
+])
+def test_honor_offset(text):
+    """With honor_offset the input's offset fixes the instant."""
+    result = utils.robust_parse_datetime(text, "Europe/Paris", honor_offset=True)
+    assert result == datetime(2024, 3, 11, 10, 30, tzinfo=ZoneInfo("UTC"))
+    assert result.tzinfo == ZoneInfo("Europe/Paris")
+
+
+def test_offset_ignored_by_default():
+    """Cached results of either reading do not leak into the other."""
+    honored = utils.robust_parse_datetime("2024-03-11T10:30:00Z", "Europe/Paris", honor_offset=True)
+    ignored = utils.robust_parse_datetime("2024-03-11T10:30:00Z", "Europe/Paris")
+    assert (honored.hour, ignored.hour) == (11, 10)
+
+
+def test_relative_expressions_resolve_against_now():
+    """Relative input is parsed ahead of dateutil, in the requested zone, and not cached."""
+    before = datetime.now(ZoneInfo("UTC"))
+    result = utils.robust_parse_datetime("in 3 hours", "Asia/Tokyo")
+    assert result.tzinfo == ZoneInfo("Asia/Tokyo")
+    assert abs((result - before).total_seconds() - 3 * 3600) < 5
+    assert utils.get_parse_tier_counts()["relative"] == 1
+    assert utils.get_parse_tier_counts()["dateutil"] == 0
+    assert utils.get_parse_cache_stats()["size"] == 0
@@ -0,0 +1,154 @@
+"""
+Differential tests: the NumPy engine against the pure-Python reference tools.
+"""
+import random
+import pytest
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+np = pytest.importorskip("numpy")
+
+from temporal_awareness_mcp import models, vectorized  # noqa: E402
+from temporal_awareness_mcp.tools import batch, contextual, core  # noqa: E402
+
+ZONES = [
+    "UTC",
+    "America/New_York",
+    "Europe/London",
+    "Australia/Lord_Howe",
+    "Asia/Kathmandu",
+    "Africa/Casablanca",
+    "America/St_Johns",
+    "Pacific/Apia",
+]
+
+
+@pytest.fixture
+def rng():
+    return random.Random(20240311)
+
+
+def random_wall(rng, start_year=1850, end_year=2150):
+    start = datetime(start_year, 1, 1)
+    span = (datetime(end_year, 1, 1) - start) // timedelta(seconds=1)
+    return start + timedelta(seconds=rng.randrange(span), microseconds=rng.choice([0, rng.randrange(10**6)]))
+
+
+@pytest.mark.parametrize("key", ZONES)
+def test_offsets_for_instants_match_zoneinfo(key, rng):
+    zone = ZoneInfo(key)
+    instants = [random_wall(rng).replace(tzinfo=timezone.utc) for _ in range(2000)]
+    table = vectorized.zone_table(zone)
+    for utc_us in table.utc_transitions.tolist()[:300]:
+        base = datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=utc_us)
+        instants += [base - timedelta(microseconds=1), base, base + timedelta(seconds=1)]
+
+    utc_us = np.array(
+        [(dt - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1) for dt in instants]
+    )
+    expected = [dt.astimezone(zone).utcoffset() // timedelta(microseconds=1) for dt in instants]
+    assert vectorized.offsets_for_instants(utc_us, zone).tolist() == expected
+
+
+@pytest.mark.parametrize("key", ZONES)
+@pytest.mark.parametrize("fold", [0, 1])
+def test_offsets_for_wall_match_zoneinfo(key, fold, rng):
+    zone = ZoneInfo(key)
+    walls = [random_wall(rng) for _ in range(2000)]
+    for utc_us in vectorized.zone_table(zone).utc_transitions.tolist()[:300]:
+        base = datetime(1970, 1, 1) + timedelta(microseconds=utc_us)
+        walls += [base + timedelta(minutes=m) for m in range(-150, 151, 15)]
+    walls = [w for w in walls if datetime.min + timedelta(days=2) < w < datetime.max - timedelta(days=2)]
+
+    wall_us, _ = vectorized.to_wall_us(walls)
+    folds = np.full(len(walls), bool(fold))
+    expected = [
+        w.replace(tzinfo=zone, fold=fold).utcoffset() // timedelta(microseconds=1) for w in walls
+    ]
+    assert vectorized.offsets_for_wall(wall_us, zone, folds).tolist() == expected
+
+
+def test_format_iso_matches_isoformat(rng):
+    zone = ZoneInfo("America/New_York")
+    dts = [random_wall(rng, 1, 9999).replace(tzinfo=zone) for _ in range(3000)]
+    wall_us, fold = vectorized.to_wall_us(dts)
+    offsets = vectorized.offsets_for_wall(wall_us, zone, fold)
+    assert vectorized.format_iso(wall_us, offsets) == [dt.isoformat() for dt in dts]
+
+
+def make_timestamp(rng):
+    dt = random_wall(rng, 1990, 2060)
+    return rng.choice([
+        dt.isoformat(),
+        dt.strftime("%Y-%m-%d %H:%M"),
+        str(int(dt.replace(tzinfo=timezone.utc).timestamp())),
+        dt.strftime("%B %d, %Y %I:%M %p"),
+    ])
+
+
+def test_batch_calculate_difference_matches_reference(rng):
+    items = [
+        models.CalculateDifferenceInput(
+            start_timestamp=make_timestamp(rng),
+            end_timestamp=make_timestamp(rng),
+            timezone=rng.choice(ZONES),
+            arithmetic=rng.choice(["wall", "absolute"]),
+            duration_style=rng.choice(["long", "compact", "iso"]),
+            smallest_unit=rng.choice(["seconds", "microseconds"]),
+            max_parts=rng.choice([0, 2]),
+        )
+        for _ in range(1500)
+    ]
+    expected = batch._run(core.calculate_difference, items)
+    actual = batch._vectorized_calculate_difference(items)
+    assert actual == expected
+
+
+def test_batch_get_timestamp_context_matches_reference(rng):
+    items = []
+    for _ in range(1500):
+        start = rng.randrange(0, 23)
+        items.append(models.GetTimestampContextInput(
+            timestamp=make_timestamp(rng),
+            timezone=rng.choice(ZONES),
+            business_hours_start=start,
+            business_hours_end=rng.randrange(start, 24) if start < 23 else 23,
+        ))
+    expected = batch._run(contextual.get_timestamp_context, items)
+    assert batch._vectorized_get_timestamp_context(items) == expected
+
+
+def test_batch_adjust_timestamp_matches_reference(rng):
+    items = [
+        models.AdjustTimestampInput(
+            start_timestamp=make_timestamp(rng),
+            delta_value=round(rng.uniform(-5000, 5000), rng.randrange(0, 7)),
+            delta_unit=rng.choice(["weeks", "days", "hours", "minutes", "seconds"]),
+            timezone=rng.choice(ZONES),
+            arithmetic=rng.choice(["wall", "absolute"]),
+        )
+        for _ in range(1500)
+    ]
+    # Results that leave the datetime range, and a bad timestamp, go through the error path.
+    items += [
+        models.AdjustTimestampInput(start_timestamp="9999-12-30", delta_value=5, delta_unit="days"),
+        models.AdjustTimestampInput(
+            start_timestamp="9999-12-31T20:00:00", delta_value=3, delta_unit="hours",
+            timezone="America/New_York", arithmetic="absolute",
+        ),
+        models.AdjustTimestampInput(start_timestamp="2024-01-01", delta_value=float("inf"), delta_unit="days"),
+        models.AdjustTimestampInput(start_timestamp="not a date", delta_value=1, delta_unit="days"),
+    ]
+    expected = batch._run(core.adjust_timestamp, items)
+    assert batch._vectorized_adjust_timestamp(items) == expected
+
+
+def test_large_batches_use_vectorized_engine(monkeypatch):
+    calls = []
+    monkeypatch.setattr(batch, "_vectorized_calculate_difference", lambda items: calls.append(len(items)) or [])
+    items = [
+        models.CalculateDifferenceInput(start_timestamp="2024-01-01", end_timestamp="2024-01-02")
+    ] * batch.VECTORIZE_MIN_ITEMS
+    batch.batch_calculate_difference(items)
+    batch.batch_calculate_difference(items[:1])
+    assert calls == [batch.VECTORIZE_MIN_ITEMS]
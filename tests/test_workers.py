@@ -0,0 +1,60 @@
+"""
+Tests for the multi-worker HTTP deployment helpers.
+"""
+import asyncio
+import os
+import socket
+import httpx
+import pytest
+import uvicorn
+
+from temporal_awareness_mcp import workers
+from temporal_awareness_mcp.server import create_server
+
+
+def test_resolve_worker_count():
+    assert workers.resolve_worker_count(3) == 3
+    assert workers.resolve_worker_count(0) == len(os.sched_getaffinity(0))
+
+
+@pytest.fixture
+async def peer_worker(tmp_path):
+    """Worker 1 of 2, serving on its private Unix socket."""
+    run_dir = str(tmp_path)
+    app = workers.build_worker_app(create_server(), 1, 2, run_dir)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(workers.socket_path(run_dir, 1))
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning"))
+    task = asyncio.create_task(server.serve(sockets=[sock]))
+    while not server.started:
+        await asyncio.sleep(0.01)
+    yield run_dir
+    server.should_exit = True
+    await task
+
+
+async def test_message_posts_are_relayed_to_owning_worker(peer_worker):
+    app = workers.build_worker_app(create_server(), 0, 2, peer_worker)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Worker 1 answers for its own (unknown) session.
+        response = await client.post(
+            "/messages/1/?session_id=" + "0" * 32, json={"jsonrpc": "2.0", "method": "ping", "id": 1}
+        )
+        assert response.status_code == 404
+        assert response.text == "Could not find session"
+
+        response = await client.post("/messages/7/?session_id=x", content=b"{}")
+        assert response.status_code == 404
+
+
+async def test_workers_health_reports_every_worker(peer_worker):
+    app = workers.build_worker_app(create_server(), 0, 2, peer_worker)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/health/workers")
+
+    # Worker 0 only exists in-process here, so its socket is missing.
+    assert response.status_code == 503
+    payload = response.json()
+    assert payload["status"] == "degraded"
+    assert [w["status"] for w in payload["workers"]] == ["unreachable", "ok"]
+    assert payload["workers"][1]["active_sessions"] == 0